@@ -0,0 +1,69 @@
+"""
+Benchmark of the DFA simulation engines
+
+Times the same inputs through each engine and prints the results. Nothing
+is asserted: timings depend on the machine and its load. Run with
+
+    python benchmark_engines.py
+"""
+import time
+
+from dfa import create_mod_n_dfa, is_accepted
+from dfa_batch import process_batch
+from dfa_codegen import compile_dfa
+
+
+def _time(function, words):
+    """Return (results, seconds) of calling function on every word."""
+    begin = time.perf_counter()
+    results = [function(word) for word in words]
+    return results, time.perf_counter() - begin
+
+
+def benchmark_engines(dfa, words):
+    """
+    Time every engine on the same inputs.
+
+    Args:
+        dfa: A DFA object
+        words: List of input strings
+
+    Returns:
+        List of (engine name, seconds) pairs, is_accepted() first
+    """
+    expected, dict_time = _time(lambda word: is_accepted(dfa, word), words)
+    timings = [('is_accepted', dict_time)]
+
+    accepts = compile_dfa(dfa)
+    engines = [
+        ('compiled function', accepts),
+        ("process(engine='codegen')", lambda word: dfa.process(word, engine='codegen')),
+        ("process(engine='translate')", lambda word: dfa.process(word, engine='translate')),
+    ]
+    for name, function in engines:
+        results, seconds = _time(function, words)
+        if results != expected:
+            raise AssertionError(f"{name} disagrees with is_accepted()")
+        timings.append((name, seconds))
+
+    begin = time.perf_counter()
+    results = list(process_batch(dfa, words))
+    seconds = time.perf_counter() - begin
+    if results != expected:
+        raise AssertionError("process_batch() disagrees with is_accepted()")
+    timings.append(('process_batch', seconds))
+    return timings
+
+
+if __name__ == '__main__':
+    dfa = create_mod_n_dfa(97)
+    words = [format(n * 7919, 'b') * 20 for n in range(1, 2001)]
+    symbols = sum(map(len, words))
+
+    print("=" * 60)
+    print(f"Simulation engines: {len(words)} inputs, {symbols} symbols")
+    print("=" * 60)
+    timings = benchmark_engines(dfa, words)
+    dict_time = timings[0][1]
+    for name, seconds in timings:
+        print(f"{name:<28} {seconds * 1000:8.1f} ms  {dict_time / seconds:5.1f}x")
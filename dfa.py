@@ -1,5 +1,13 @@
 import json
 
+from dfa_codegen import compile_dfa
+from dfa_compression import DECOMPRESSION_ERRORS, open_dfa_file
+from dfa_encoding import ENCODE_MIN_LENGTH, symbol_encoder, translate_engine
+from dfa_prefix_cache import (DEFAULT_MAX_PREFIX_BYTES, DEFAULT_MAX_PREFIXES, DEFAULT_STRIDE,
+                              PrefixStateCache)
+from dfa_result_cache import (DEFAULT_HASH_THRESHOLD, DEFAULT_MAX_BYTES, DEFAULT_MAX_RESULTS,
+                              ResultCache)
+
 
 class DFA:
     """
@@ -13,7 +21,8 @@ class DFA:
     - F: Set of final/accept states
     """
     
-    def __init__(self, states, alphabet, transitions, start_state, final_states):
+    def __init__(self, states, alphabet, transitions, start_state, final_states,
+                 assume_complete=False, lazy=False):
         """
         Initialize a DFA.
         
@@ -23,17 +32,80 @@ class DFA:
             transitions: Dict mapping (state, symbol) -> next_state (δ)
             start_state: Initial state (q0)
             final_states: Set of accepting states (F)
+            assume_complete: Skip the |Q| × |Σ| completeness scan because the
+                caller already guarantees that every (state, symbol) pair has
+                a transition to a valid state (e.g. DFABuilderDialog)
+            lazy: Defer validation until the DFA is first used or
+                validate() is called
         """
         self.states = set(states)
         self.alphabet = set(alphabet)
         self.transitions = transitions
         self.start_state = start_state
         self.final_states = set(final_states)
+        self._assume_complete = assume_complete
+        self.validated = False
+        self.prefix_cache = None
+        self.result_cache = None
         
         # Validate the DFA
-        self._validate()
+        if not lazy:
+            self.validate()
+    
+    @classmethod
+    def from_trusted(cls, states, alphabet, transitions, start_state, final_states):
+        """
+        Build a DFA from data that is already known to be valid.
+        
+        The given sets and dict are used as-is (not copied) and no validation
+        is run, so construction is O(1). The caller must not modify them
+        afterwards and is responsible for their correctness; validate() can
+        still be called explicitly to check.
+        
+        Args:
+            states: Set of state names (Q)
+            alphabet: Set of input symbols (Σ)
+            transitions: Dict mapping (state, symbol) -> next_state (δ)
+            start_state: Initial state (q0)
+            final_states: Set of accepting states (F)
+            
+        Returns:
+            DFA object
+        """
+        dfa = cls.__new__(cls)
+        dfa.states = states
+        dfa.alphabet = alphabet
+        dfa.transitions = transitions
+        dfa.start_state = start_state
+        dfa.final_states = final_states
+        dfa._assume_complete = False
+        dfa.validated = True
+        dfa.prefix_cache = None
+        dfa.result_cache = None
+        return dfa
+    
+    def validate(self, check_transitions=None):
+        """
+        Validate the DFA now.
+        
+        Args:
+            check_transitions: Check that the transition function is complete
+                (defaults to True unless the DFA was built with assume_complete)
+            
+        Raises:
+            ValueError: If the DFA is malformed
+        """
+        if check_transitions is None:
+            check_transitions = not self._assume_complete
+        self._validate(check_transitions=check_transitions)
+        self.validated = True
+    
+    def _ensure_validated(self):
+        """Run deferred validation before first use."""
+        if not self.validated:
+            self.validate()
     
-    def _validate(self):
+    def _validate(self, check_transitions=True):
         """Validate that the DFA is well-formed."""
         if self.start_state not in self.states:
             raise ValueError(f"Start state {self.start_state} not in states")
@@ -41,6 +113,9 @@ class DFA:
         if not self.final_states.issubset(self.states):
             raise ValueError("Final states must be subset of states")
         
+        if not check_transitions:
+            return
+        
         # Check that transition function is complete
         for state in self.states:
             for symbol in self.alphabet:
@@ -49,16 +124,87 @@ class DFA:
                 if self.transitions[(state, symbol)] not in self.states:
                     raise ValueError(f"Invalid transition target for ({state}, {symbol})")
     
-    def process(self, input_string):
+    def enable_prefix_cache(self, max_entries=DEFAULT_MAX_PREFIXES, stride=DEFAULT_STRIDE,
+                            max_bytes=DEFAULT_MAX_PREFIX_BYTES):
+        """
+        Cache the states reached by input prefixes.
+        
+        process() and is_accepted() then resume each input from its longest
+        cached prefix. Worth it when inputs share long prefixes.
+        
+        Args:
+            max_entries: Maximum number of cached prefixes (LRU eviction)
+            stride: Cache prefixes whose length is a multiple of this
+            max_bytes: Maximum estimated memory used by the cache
+            
+        Returns:
+            The PrefixStateCache, whose counters give the hit rate
+        """
+        self.prefix_cache = PrefixStateCache(max_entries, stride, max_bytes)
+        return self.prefix_cache
+    
+    def disable_prefix_cache(self):
+        """Stop using and drop the prefix cache."""
+        self.prefix_cache = None
+    
+    def enable_result_cache(self, max_entries=DEFAULT_MAX_RESULTS, max_bytes=DEFAULT_MAX_BYTES,
+                            hash_threshold=DEFAULT_HASH_THRESHOLD):
+        """
+        Memoize the results of process() and is_accepted() for repeated inputs.
+        
+        The transitions dict and final states set are replaced by tracked
+        copies, so cached results are dropped automatically whenever they
+        (or the start state) change.
+        
+        Args:
+            max_entries: Maximum number of cached results (LRU eviction)
+            max_bytes: Maximum estimated memory used by the cache
+            hash_threshold: Key inputs longer than this by a digest
+            
+        Returns:
+            The ResultCache, whose counters give hits, misses and evictions
+        """
+        self.result_cache = ResultCache(max_entries, max_bytes, hash_threshold)
+        self.result_cache.attach(self)
+        return self.result_cache
+    
+    def disable_result_cache(self):
+        """Stop using and drop the result cache."""
+        self.result_cache = None
+    
+    def process(self, input_string, engine='dict'):
         """
         Process an input string and return whether it's accepted.
         
         Args:
             input_string: String to process
+            engine: Simulation engine, a key of ENGINES ('dict' walks the
+                    transitions dict, 'codegen' runs a compiled function,
+                    'translate' encodes the input and walks an integer table)
             
         Returns:
             True if the string is accepted, False otherwise
+            
+        Raises:
+            ValueError: If a symbol is not in the alphabet or the engine is unknown
         """
+        self._ensure_validated()
+        try:
+            run = ENGINES[engine](self)
+        except KeyError:
+            raise ValueError(f"Unknown engine '{engine}', expected one of {sorted(ENGINES)}")
+        if self.result_cache is None or type(input_string) is not str:
+            return run(input_string)
+        key, result = self.result_cache.lookup(self, input_string)
+        if result is None:
+            result = run(input_string)
+            self.result_cache.store(key, result)
+        return result
+    
+    def _process(self, input_string):
+        """Simulate the DFA on a string, bypassing the result cache."""
+        if self.prefix_cache is not None and self.alphabet.issuperset(input_string):
+            return self.prefix_cache.run(self, input_string) in self.final_states
         current_state = self.start_state
         
         for symbol in input_string:
@@ -79,6 +225,7 @@ class DFA:
         Returns:
             Tuple of (accepted, trace) where trace is list of states visited
         """
+        self._ensure_validated()
         current_state = self.start_state
         trace = [current_state]
         
@@ -103,6 +250,20 @@ class DFA:
                 f")")
 
 
+# Engines for DFA.process(): name -> function returning the simulator for a DFA
+ENGINES = {
+    'dict': lambda dfa: dfa._process,
+    'codegen': compile_dfa,
+    'translate': translate_engine,
+}
+
+
+def _ensure_validated(dfa):
+    """Run deferred validation on DFAs built with lazy=True."""
+    if not getattr(dfa, 'validated', True):
+        dfa.validate()
+
+
 def is_accepted(dfa, input_string):
     """
     Core DFA simulation logic - determines if a string is accepted.
@@ -117,9 +278,46 @@ def is_accepted(dfa, input_string):
     Raises:
         ValueError: If a symbol in the input string is not in the DFA's alphabet
     """
+    _ensure_validated(dfa)
+    
+    # Only str inputs are cached; lists and tuples of symbols are run directly
+    result_cache = getattr(dfa, 'result_cache', None)
+    if result_cache is None or type(input_string) is not str:
+        return _is_accepted(dfa, input_string)
+    key, result = result_cache.lookup(dfa, input_string)
+    if result is None:
+        result = _is_accepted(dfa, input_string)
+        result_cache.store(key, result)
+    return result
+
+
+def _is_accepted(dfa, input_string):
+    """Simulate a DFA on a string, bypassing the result cache."""
+    # Resume from the longest cached prefix if the DFA has a prefix cache
+    prefix_cache = getattr(dfa, 'prefix_cache', None)
+    if prefix_cache is not None and dfa.alphabet.issuperset(input_string):
+        return prefix_cache.run(dfa, input_string) in dfa.final_states
+    
     # Start at the initial state
     current_state = dfa.start_state
     
+    # Validate the whole string in one pass when the alphabet can be encoded
+    encoder = None
+    if type(input_string) is str and len(input_string) >= ENCODE_MIN_LENGTH:
+        encoder = symbol_encoder(dfa)
+    if encoder is not None:
+        invalid = encoder.first_invalid(input_string, encoder.encode(input_string))
+        if invalid is not None:
+            i, symbol = invalid
+            raise ValueError(
+                f"Invalid symbol '{symbol}' at position {i}. "
+                f"Symbol not in alphabet {dfa.alphabet}"
+            )
+        transitions = dfa.transitions
+        for symbol in input_string:
+            current_state = transitions[(current_state, symbol)]
+        return current_state in dfa.final_states
+    
     # Process each symbol in the input string
     for i, symbol in enumerate(input_string):
         # Error handling: check if symbol is in alphabet
@@ -136,7 +334,7 @@ def is_accepted(dfa, input_string):
     return current_state in dfa.final_states
 
 
-def export_dfa_to_json(dfa, filename):
+def export_dfa_to_json(dfa, filename, compression=None):
     """
     Export a DFA object to a JSON file.
     
@@ -156,12 +354,15 @@ def export_dfa_to_json(dfa, filename):
     Args:
         dfa: A DFA object to export
         filename: Path to the JSON file to create
+        compression: 'gzip', 'bz2', 'xz', 'zstd' or 'none'; by default
+            chosen from the extension (e.g. "dfa.json.gz" is gzipped)
         
     Returns:
         None
         
     Raises:
         IOError: If file cannot be written
+        ValueError: If the compression format is unknown or unavailable
     """
     # Convert DFA to JSON-serializable dictionary
     dfa_dict = {
@@ -177,17 +378,20 @@ def export_dfa_to_json(dfa, filename):
     
     # Write to JSON file with pretty formatting
     try:
-        with open(filename, 'w', encoding='utf-8') as f:
+        with open_dfa_file(filename, 'w', compression, encoding='utf-8') as f:
             json.dump(dfa_dict, f, indent=2, ensure_ascii=False)
         print(f"✓ DFA exported successfully to '{filename}'")
     except IOError as e:
         raise IOError(f"Failed to write DFA to file '{filename}': {e}")
 
 
-def import_dfa_from_json(filename):
+def import_dfa_from_json(filename, verbose=True):
     """
     Import a DFA object from a JSON file.
     
+    gzip, bz2, xz and zstd compressed files are detected from their magic
+    bytes and decompressed while reading.
+    
     Expected JSON Schema:
     {
         "states": ["q0", "q1", ...],
@@ -203,6 +407,7 @@ def import_dfa_from_json(filename):
     
     Args:
         filename: Path to the JSON file to load
+        verbose: Print a confirmation line after importing
         
     Returns:
         DFA object constructed from the JSON data
@@ -214,13 +419,36 @@ def import_dfa_from_json(filename):
     """
     # Read JSON file
     try:
-        with open(filename, 'r', encoding='utf-8') as f:
+        with open_dfa_file(filename, 'r', encoding='utf-8') as f:
             dfa_dict = json.load(f)
-    except IOError as e:
+    except DECOMPRESSION_ERRORS as e:
         raise IOError(f"Failed to read file '{filename}': {e}")
     except json.JSONDecodeError as e:
         raise json.JSONDecodeError(f"Invalid JSON in file '{filename}': {e.msg}", e.doc, e.pos)
     
+    dfa = dfa_from_dict(dfa_dict)
+    if verbose:
+        print(f"✓ DFA imported successfully from '{filename}'")
+    return dfa
+
+
+def dfa_from_dict(dfa_dict):
+    """
+    Build a DFA from a dictionary in the JSON schema.
+    
+    This is the parsing step of import_dfa_from_json(), for callers that
+    already have the decoded JSON (e.g. from a cache or another source).
+    
+    Args:
+        dfa_dict: Dictionary with states, alphabet, transitions,
+            start_state and final_states as described in import_dfa_from_json()
+        
+    Returns:
+        DFA object
+        
+    Raises:
+        ValueError: If the DFA structure is malformed
+    """
     # Validate required fields
     required_fields = ["states", "alphabet", "transitions", "start_state", "final_states"]
     missing_fields = [field for field in required_fields if field not in dfa_dict]
@@ -254,9 +482,10 @@ def import_dfa_from_json(filename):
         if not isinstance(dfa_dict["final_states"], list):
             raise ValueError("'final_states' must be a list")
         
-        # Create and return DFA (validation happens in DFA.__init__)
-        dfa = DFA(states, alphabet, transitions, start_state, final_states)
-        print(f"✓ DFA imported successfully from '{filename}'")
+        # Create the DFA from the sets built above without copying them,
+        # then validate once
+        dfa = DFA.from_trusted(states, alphabet, transitions, start_state, final_states)
+        dfa.validate()
         return dfa
         
     except KeyError as e:
@@ -290,6 +519,12 @@ def trace_execution(dfa, input_string):
     Raises:
         ValueError: If a symbol in the input string is not in the DFA's alphabet
     """
+    return _trace_execution(dfa, input_string)
+
+
+def _trace_execution(dfa, input_string):
+    """Generator behind trace_execution(), replaced when instrumented."""
+    _ensure_validated(dfa)
     current_state = dfa.start_state
     
     # Initial step - show starting configuration
@@ -373,7 +608,32 @@ def create_even_a_dfa():
     start_state = 'q0'
     final_states = {'q0'}  # Accept when even number of 'a's
     
-    return DFA(states, alphabet, transitions, start_state, final_states)
+    # Fixed, known-valid definition: skip copying and validation
+    return DFA.from_trusted(states, alphabet, transitions, start_state, final_states)
+
+
+def create_mod_n_dfa(n):
+    """
+    Create a DFA that accepts binary numbers divisible by n.
+
+    Language: L = {w ∈ {0,1}* | w read as a binary number is divisible by n}
+    (the empty string counts as 0)
+
+    States:
+    - q0 .. q{n-1}: Value of the digits read so far, mod n (q0 accepting)
+
+    Transitions:
+    - From qi: c → q((2i + c) mod n)
+
+    Args:
+        n: Divisor, at least 1 (also the number of states)
+    """
+    states = {f"q{i}" for i in range(n)}
+    alphabet = {'0', '1'}
+    transitions = {(f"q{i}", c): f"q{(2 * i + int(c)) % n}" for i in range(n) for c in '01'}
+
+    # Complete by construction: skip copying and validation
+    return DFA.from_trusted(states, alphabet, transitions, 'q0', {'q0'})
 
 
 if __name__ == "__main__":
@@ -0,0 +1,306 @@
+"""
+Structural analysis of DFAs
+
+analyze_structure() runs three linear-time graph passes over the transition
+function: a search from the start state (reachable states), a reverse search
+from the final states (co-reachable states) and cycle detection among the
+useful states, those that are both. The result says whether the language is
+empty, finite or infinite and which states are useless. It is computed once
+per DFA and cached, so other features can share it.
+
+shortest_accepted(), shortest_rejected() and shortest_string_to() find
+witness strings from one cached breadth-first search.
+"""
+import numpy as np
+
+from dfa_index import dfa_cache, index_dfa
+
+
+class StructureReport:
+    """
+    Structural properties of a DFA.
+
+    The *_mask attributes are lists of bools indexed by state number in
+    index_dfa(dfa).states order; the *_states properties give state names.
+
+    Attributes:
+        reachable_mask: True for states reachable from the start state
+        coreachable_mask: True for states from which a final state is reachable
+        useful_mask: True for states that are both
+        is_empty: True if the DFA accepts no strings
+        is_finite: True if the DFA accepts finitely many strings
+        longest_length: Length of the longest accepted string for a finite,
+            non-empty language, otherwise None
+    """
+
+    def __init__(self, states, reachable_mask, coreachable_mask, has_cycle, longest_length):
+        self._states = states
+        self.reachable_mask = reachable_mask
+        self.coreachable_mask = coreachable_mask
+        self.useful_mask = [r and c for r, c in zip(reachable_mask, coreachable_mask)]
+        self.is_empty = not any(self.useful_mask)
+        self.is_finite = self.is_empty or not has_cycle
+        self.longest_length = longest_length
+
+    @property
+    def is_infinite(self):
+        return not self.is_finite
+
+    def _select(self, mask):
+        return {state for state, flag in zip(self._states, mask) if flag}
+
+    @property
+    def reachable_states(self):
+        """States reachable from the start state."""
+        return self._select(self.reachable_mask)
+
+    @property
+    def coreachable_states(self):
+        """States from which some final state can be reached."""
+        return self._select(self.coreachable_mask)
+
+    @property
+    def useful_states(self):
+        """States on some path from the start state to a final state."""
+        return self._select(self.useful_mask)
+
+    @property
+    def unreachable_states(self):
+        """States that no input string leads to."""
+        return self._select(not flag for flag in self.reachable_mask)
+
+    @property
+    def dead_states(self):
+        """Reachable states from which no final state can be reached."""
+        return self._select(r and not c for r, c in zip(self.reachable_mask, self.coreachable_mask))
+
+    @property
+    def useless_states(self):
+        """States that are unreachable or dead."""
+        return self._select(not flag for flag in self.useful_mask)
+
+    def summary(self):
+        """
+        Describe the report in a few lines.
+
+        Returns:
+            Multi-line string
+        """
+        if self.is_empty:
+            language = "empty"
+        elif self.is_finite:
+            language = f"finite (longest accepted string has length {self.longest_length})"
+        else:
+            language = "infinite"
+        return '\n'.join([
+            f"Language: {language}",
+            f"States: {len(self._states)} total, {sum(self.reachable_mask)} reachable, "
+            f"{sum(self.useful_mask)} useful",
+            f"Unreachable states: {len(self.unreachable_states)}",
+            f"Dead states: {len(self.dead_states)}",
+        ])
+
+    def __repr__(self):
+        kind = 'empty' if self.is_empty else 'finite' if self.is_finite else 'infinite'
+        return (f"StructureReport({kind}, {sum(self.useful_mask)}/{len(self._states)} "
+                f"useful states)")
+
+
+def _search(adjacency, sources, num_states):
+    """Mark every state reachable from the sources along the adjacency lists."""
+    marked = [False] * num_states
+    stack = list(sources)
+    for state in stack:
+        marked[state] = True
+    while stack:
+        for target in adjacency[stack.pop()]:
+            if not marked[target]:
+                marked[target] = True
+                stack.append(target)
+    return marked
+
+
+def _topological_order(delta, useful):
+    """
+    Order the useful states topologically (Kahn's algorithm).
+
+    Returns:
+        List of useful state numbers, or None if they contain a cycle
+    """
+    indegree = [0] * len(useful)
+    for source, targets in enumerate(delta):
+        if useful[source]:
+            for target in targets:
+                if useful[target]:
+                    indegree[target] += 1
+    order = [q for q in range(len(useful)) if useful[q] and indegree[q] == 0]
+    for source in order:
+        for target in delta[source]:
+            if useful[target]:
+                indegree[target] -= 1
+                if indegree[target] == 0:
+                    order.append(target)
+    return order if len(order) == sum(useful) else None
+
+
+def analyze_structure(dfa):
+    """
+    Analyze the reachability structure and language size of a DFA.
+
+    Runs in O(|Q|·|Σ|) time. The report is cached per DFA.
+
+    Args:
+        dfa: A DFA (or CompactDFA)
+
+    Returns:
+        StructureReport object
+    """
+    cache = dfa_cache(dfa)
+    report = cache.get('structure')
+    if report is not None:
+        return report
+
+    idx = index_dfa(dfa)
+    n = idx.num_states
+    delta = idx.delta.tolist()
+    reachable = _search(delta, [idx.start], n)
+
+    predecessors = [[] for _ in range(n)]
+    for source, targets in enumerate(delta):
+        for target in targets:
+            predecessors[target].append(source)
+    final = idx.final.tolist()
+    coreachable = _search(predecessors, [q for q in range(n) if final[q]], n)
+
+    useful = [r and c for r, c in zip(reachable, coreachable)]
+    order = _topological_order(delta, useful) if any(useful) else []
+    longest_length = None
+    if order:
+        # Longest path from each useful state to a final state, in reverse order
+        longest = [-1] * n
+        for state in reversed(order):
+            best = 0 if final[state] else -1
+            for target in delta[state]:
+                if useful[target] and longest[target] >= 0:
+                    best = max(best, longest[target] + 1)
+            longest[state] = best
+        longest_length = longest[idx.start]
+
+    report = StructureReport(idx.states, reachable, coreachable, order is None, longest_length)
+    cache['structure'] = report
+    return report
+
+
+def _bfs_tree(dfa):
+    """
+    Breadth-first search from the start state, cached per DFA.
+
+    Symbols are tried in sorted order, so the first path found to each state
+    is the shortest and, among those, the alphabetically smallest.
+
+    Returns:
+        Tuple (parent_state, parent_symbol, order): int32 arrays where
+        parent_state[q] is the state q was discovered from (-1 for the start
+        state and unreachable states) and parent_symbol[q] the symbol number
+        used, and order lists reachable states in discovery order
+    """
+    cache = dfa_cache(dfa)
+    tree = cache.get('bfs_tree')
+    if tree is not None:
+        return tree
+
+    idx = index_dfa(dfa)
+    delta = idx.delta.tolist()
+    parent_state = [-1] * idx.num_states
+    parent_symbol = [-1] * idx.num_states
+    seen = [False] * idx.num_states
+    seen[idx.start] = True
+    order = [idx.start]
+    for source in order:
+        for symbol, target in enumerate(delta[source]):
+            if not seen[target]:
+                seen[target] = True
+                parent_state[target] = source
+                parent_symbol[target] = symbol
+                order.append(target)
+
+    tree = (np.array(parent_state, dtype=np.int32),
+            np.array(parent_symbol, dtype=np.int32),
+            np.array(order, dtype=np.int32))
+    cache['bfs_tree'] = tree
+    return tree
+
+
+def _path_to(dfa, state_number):
+    """Read the string leading to a reachable state off the BFS tree."""
+    idx = index_dfa(dfa)
+    parent_state, parent_symbol, _ = _bfs_tree(dfa)
+    symbols = []
+    while state_number != idx.start:
+        symbols.append(idx.symbols[parent_symbol[state_number]])
+        state_number = parent_state[state_number]
+    return ''.join(reversed(symbols))
+
+
+def shortest_string_to(dfa, state):
+    """
+    Find the shortest string that leads from the start state to a state.
+
+    Ties are broken alphabetically (by sorted symbols).
+
+    Args:
+        dfa: A DFA (or CompactDFA)
+        state: Target state name
+
+    Returns:
+        The string, or None if the state is unreachable
+
+    Raises:
+        ValueError: If the state is not in the DFA
+    """
+    idx = index_dfa(dfa)
+    if state not in idx.state_index:
+        raise ValueError(f"State '{state}' not in states")
+    state_number = idx.state_index[state]
+    parent_state, _, _ = _bfs_tree(dfa)
+    if state_number != idx.start and parent_state[state_number] < 0:
+        return None
+    return _path_to(dfa, state_number)
+
+
+def _first_in_order(dfa, final):
+    """Shortest string reaching a state whose finality equals final."""
+    idx = index_dfa(dfa)
+    _, _, order = _bfs_tree(dfa)
+    matches = np.flatnonzero(idx.final[order] == final)
+    if len(matches) == 0:
+        return None
+    return _path_to(dfa, int(order[matches[0]]))
+
+
+def shortest_accepted(dfa):
+    """
+    Find the shortest string the DFA accepts.
+
+    Args:
+        dfa: A DFA (or CompactDFA)
+
+    Returns:
+        The shortest accepted string (alphabetically first among equals),
+        or None if the language is empty
+    """
+    return _first_in_order(dfa, True)
+
+
+def shortest_rejected(dfa):
+    """
+    Find the shortest string the DFA rejects.
+
+    Args:
+        dfa: A DFA (or CompactDFA)
+
+    Returns:
+        The shortest rejected string (alphabetically first among equals),
+        or None if the DFA accepts every string
+    """
+    return _first_in_order(dfa, False)
@@ -0,0 +1,144 @@
+"""
+Batch and streaming simulation engines
+
+process_batch() decides many inputs at once. Inputs are encoded with the
+DFA's SymbolEncoder, sorted by length and packed into a NumPy matrix of
+symbol ids, and the strings of a group then advance together: one
+vectorized table lookup per position instead of one Python lookup per
+symbol.
+
+run_batch() runs the same loop on already encoded inputs and returns the
+states reached. Its on_step hook sees every transition taken, which is how
+dfa_coverage counts them.
+
+process_stream() decides a single input that arrives in chunks, such as a
+file read in blocks, without joining the chunks.
+
+Both need an alphabet of single-character symbols (see dfa_encoding.py).
+"""
+import numpy as np
+
+from dfa_encoding import MAX_SYMBOLS, integer_tables, symbol_encoder
+from dfa_index import index_dfa
+
+
+# Number of inputs advanced together in process_batch()
+BATCH_SIZE = 4096
+
+
+def _encoder_for(dfa):
+    """Return the DFA's encoder or raise ValueError."""
+    encoder = symbol_encoder(dfa)
+    if encoder is None:
+        raise ValueError(
+            f"Batch and streaming engines need at most {MAX_SYMBOLS} single-character symbols"
+        )
+    return encoder
+
+
+def process_batch(dfa, input_strings, batch_size=BATCH_SIZE):
+    """
+    Decide many input strings at once.
+
+    Args:
+        dfa: A DFA object
+        input_strings: Iterable of str or bytes-like inputs
+        batch_size: Number of inputs advanced together
+
+    Returns:
+        NumPy bool array, True where the input is accepted
+
+    Raises:
+        ValueError: If an input contains a symbol outside the alphabet, or the
+            alphabet cannot be encoded
+    """
+    encoder = _encoder_for(dfa)
+
+    encoded = []
+    for i, input_string in enumerate(input_strings):
+        codes = encoder.encode(input_string)
+        invalid = encoder.first_invalid(input_string, codes)
+        if invalid is not None:
+            raise ValueError(
+                f"Invalid symbol '{invalid[1]}' at position {invalid[0]} of input {i}. "
+                f"Symbol not in alphabet {dfa.alphabet}"
+            )
+        encoded.append(codes)
+
+    return index_dfa(dfa).final[run_batch(dfa, encoded, batch_size)]
+
+
+def run_batch(dfa, encoded, batch_size=BATCH_SIZE, on_step=None):
+    """
+    Run many encoded inputs and return the states reached.
+
+    Args:
+        dfa: A DFA object
+        encoded: List of bytes of valid symbol ids, from symbol_encoder(dfa)
+        batch_size: Number of inputs advanced together
+        on_step: Optional function called at each step with a NumPy array
+            of the transitions taken, as flat indexes state·|Σ| + symbol
+
+    Returns:
+        NumPy array of state indexes (index_dfa order), one per input
+    """
+    index = index_dfa(dfa)
+    delta = index.delta.ravel()
+    width = index.num_symbols
+
+    # Longest inputs first: at each position only a prefix of the group is
+    # still active, and shorter inputs keep the state they ended in
+    order = sorted(range(len(encoded)), key=lambda i: len(encoded[i]), reverse=True)
+    reached = np.empty(len(encoded), dtype=np.intp)
+    for begin in range(0, len(order), batch_size):
+        group = order[begin:begin + batch_size]
+        length = len(encoded[group[0]])
+        codes = np.frombuffer(b''.join(encoded[i].ljust(length, b'\0') for i in group),
+                              dtype=np.uint8).reshape(len(group), length)
+        lengths = np.array([len(encoded[i]) for i in group])
+        active = len(group) - np.searchsorted(lengths[::-1], np.arange(length), side='right')
+
+        states = np.full(len(group), index.start, dtype=np.intp)
+        for position in range(length):
+            count = active[position]
+            taken = states[:count] * width + codes[:count, position]
+            if on_step is not None:
+                on_step(taken)
+            states[:count] = delta[taken]
+        reached[group] = states
+
+    return reached
+
+
+def process_stream(dfa, chunks):
+    """
+    Decide one input given as a sequence of chunks.
+
+    Args:
+        dfa: A DFA object
+        chunks: Iterable of str or bytes-like chunks of the input
+
+    Returns:
+        True if the concatenated input is accepted, False otherwise
+
+    Raises:
+        ValueError: If a symbol is outside the alphabet (with its position in
+            the whole input), or the alphabet cannot be encoded
+    """
+    encoder = _encoder_for(dfa)
+    rows, final, state = integer_tables(dfa)
+
+    offset = 0
+    for chunk in chunks:
+        codes = encoder.encode(chunk)
+        invalid = encoder.first_invalid(chunk, codes)
+        if invalid is not None:
+            raise ValueError(
+                f"Invalid symbol '{invalid[1]}' at position {offset + invalid[0]}. "
+                f"Symbol not in alphabet {dfa.alphabet}"
+            )
+        for code in codes:
+            state = rows[state][code]
+        offset += len(codes)
+
+    return final[state]
@@ -0,0 +1,383 @@
+"""
+Compact binary DFA file format
+
+An alternative to the JSON format for very large DFAs. States and symbols
+are stored once in a name table and transitions as a dense array of state
+indexes, so files are small and load with a single read.
+
+File layout (all integers little-endian):
+
+    offset  size  field
+    0       4     magic b'DFAB'
+    4       2     format version (1)
+    6       2     flags (reserved, 0)
+    8       4     number of states |Q|
+    12      4     number of symbols |Σ|
+    16      4     start state index
+    20      4     reserved (0)
+    24      8     size in bytes of the name table
+    32      ...   name table: UTF-8 state names then symbol names, joined by NUL
+    ...     ...   zero padding to an 8-byte boundary
+    ...     4·|Q|·|Σ|  transition table: uint32 target index of δ(i, j)
+                       at position i·|Σ| + j
+    ...     ⌈|Q|/8⌉    final-state bitmap: bit i (LSB first) set if state i is final
+
+States and symbols are stored in sorted order, so the same DFA always
+produces the same file. The transition table is 8-byte aligned so it can be
+used in place from a memory mapping (see load_dfa_mmap).
+"""
+import mmap
+import struct
+import sys
+from array import array
+
+from dfa_compact import CompactDFA
+from dfa_compression import DECOMPRESSION_ERRORS, detect_compression, open_dfa_file
+
+
+MAGIC = b'DFAB'
+VERSION = 1
+
+# magic, version, flags, num_states, num_symbols, start, reserved, names_size
+HEADER = struct.Struct('<4sHHIIIIQ')
+
+
+def _align(offset, alignment=8):
+    """Round offset up to a multiple of alignment."""
+    return (offset + alignment - 1) // alignment * alignment
+
+
+def encode_dfa(dfa):
+    """
+    Encode a DFA in the binary format.
+
+    Args:
+        dfa: A DFA object
+
+    Returns:
+        bytes containing the encoded DFA
+
+    Raises:
+        ValueError: If a state or symbol name contains a NUL character
+    """
+    states = sorted(dfa.states)
+    symbols = sorted(dfa.alphabet)
+    state_index = {state: i for i, state in enumerate(states)}
+
+    for name in states + symbols:
+        if '\0' in name:
+            raise ValueError(f"Name {name!r} contains a NUL character")
+
+    names = '\0'.join(states + symbols).encode('utf-8')
+
+    # Dense transition table, row per state
+    transitions = dfa.transitions
+    table = array('I', [
+        state_index[transitions[(state, symbol)]]
+        for state in states
+        for symbol in symbols
+    ])
+    if sys.byteorder == 'big':
+        table.byteswap()
+
+    # Final-state bitmap
+    final_bits = bytearray((len(states) + 7) // 8)
+    for state in dfa.final_states:
+        i = state_index[state]
+        final_bits[i >> 3] |= 1 << (i & 7)
+
+    header = HEADER.pack(MAGIC, VERSION, 0, len(states), len(symbols),
+                         state_index[dfa.start_state], 0, len(names))
+    names_end = HEADER.size + len(names)
+    padding = b'\0' * (_align(names_end) - names_end)
+
+    return b''.join([header, names, padding, table.tobytes(), bytes(final_bits)])
+
+
+def _read_layout(view):
+    """
+    Parse and check the header of a binary DFA.
+
+    Args:
+        view: memoryview over the file contents
+
+    Returns:
+        Tuple of (num_states, num_symbols, start, names_end, table_start,
+        table_end, bits_end)
+
+    Raises:
+        ValueError: If the header is invalid or the file is truncated
+    """
+    if len(view) < HEADER.size:
+        raise ValueError("File too short for a binary DFA header")
+
+    (magic, version, _flags, num_states, num_symbols,
+     start, _reserved, names_size) = HEADER.unpack_from(view, 0)
+
+    if magic != MAGIC:
+        raise ValueError(f"Not a binary DFA file (magic {bytes(magic)!r})")
+    if version != VERSION:
+        raise ValueError(f"Unsupported binary DFA version {version}")
+    if num_states and start >= num_states:
+        raise ValueError(f"Start state index {start} out of range")
+
+    names_end = HEADER.size + names_size
+    table_start = _align(names_end)
+    table_end = table_start + 4 * num_states * num_symbols
+    bits_end = table_end + (num_states + 7) // 8
+    if len(view) < bits_end:
+        raise ValueError("Binary DFA file is truncated")
+
+    return num_states, num_symbols, start, names_end, table_start, table_end, bits_end
+
+
+def _table_view(view, num_states, table_start, table_end, check_targets=True):
+    """
+    Return the transition table as a sequence of ints.
+
+    On little-endian machines this is a memoryview into the buffer, so no
+    data is copied; big-endian machines get a byte-swapped array copy.
+    """
+    table_bytes = view[table_start:table_end]
+    if sys.byteorder == 'little':
+        table = table_bytes.cast('I')
+    else:
+        table = array('I', table_bytes)
+        table.byteswap()
+
+    if check_targets and len(table) and max(table) >= num_states:
+        # Release the views so a mapped file can still be closed
+        if isinstance(table, memoryview):
+            table.release()
+        table_bytes.release()
+        raise ValueError("Transition table refers to a state that does not exist")
+
+    return table
+
+
+def decode_dfa_tables(buffer):
+    """
+    Decode the parts of a binary DFA without building a DFA object.
+
+    The transition table is returned as a view into the buffer where
+    possible, so no transition data is copied.
+
+    Args:
+        buffer: bytes-like object (bytes, mmap, memoryview) holding the file
+
+    Returns:
+        Tuple of (states, symbols, start_index, table, final_bits) where
+        states and symbols are lists of names, table is a sequence of
+        |Q|·|Σ| target indexes and final_bits is the final-state bitmap
+
+    Raises:
+        ValueError: If the data is not a valid binary DFA
+    """
+    view = memoryview(buffer)
+    (num_states, num_symbols, start, names_end,
+     table_start, table_end, bits_end) = _read_layout(view)
+
+    names = str(view[HEADER.size:names_end], 'utf-8').split('\0')
+    if len(names) != num_states + num_symbols:
+        raise ValueError(
+            f"Name table has {len(names)} names, expected {num_states + num_symbols}"
+        )
+    states = names[:num_states]
+    symbols = names[num_states:]
+
+    table = _table_view(view, num_states, table_start, table_end)
+    final_bits = view[table_end:bits_end]
+
+    return states, symbols, start, table, final_bits
+
+
+def decode_dfa(buffer):
+    """
+    Decode a binary DFA into a DFA object.
+
+    Args:
+        buffer: bytes-like object holding the encoded DFA
+
+    Returns:
+        DFA object
+
+    Raises:
+        ValueError: If the data is not a valid binary DFA
+    """
+    # Every target was range-checked, so the resulting DFA is known to be
+    # complete and to_dfa() skips the completeness scan
+    states, symbols, start, table, final_bits = decode_dfa_tables(buffer)
+    return CompactDFA(states, symbols, table, start, final_bits).to_dfa()
+
+
+class MappedDFA(CompactDFA):
+    """
+    DFA simulated directly from a read-only memory-mapped binary file.
+
+    The transition table and final-state bitmap are views into the mapping,
+    so opening the file costs no parsing and processes that map the same
+    file share one physical copy through the page cache. State names are
+    only decoded if something asks for them (traces, transitions, ...);
+    process() never does.
+
+    Use as a context manager, or call close() when done.
+    """
+
+    __slots__ = ('filename', '_mmap', '_names_end')
+
+    def __init__(self, filename, check_targets=False):
+        """
+        Map a binary DFA file.
+
+        Args:
+            filename: Path to the binary DFA file
+            check_targets: Scan the whole table for out-of-range targets.
+                Off by default so opening stays O(1); a corrupt target then
+                raises IndexError during simulation instead.
+
+        Raises:
+            IOError: If the file cannot be opened or mapped
+            ValueError: If the file is not a valid binary DFA
+        """
+        self.filename = filename
+        try:
+            with open(filename, 'rb') as f:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (IOError, ValueError) as e:
+            raise IOError(f"Failed to map file '{filename}': {e}")
+
+        compression = detect_compression(self._mmap[:6])
+        if compression:
+            self._mmap.close()
+            raise ValueError(
+                f"Cannot memory-map {compression}-compressed file '{filename}'; "
+                f"use import_dfa_binary() or decompress it first"
+            )
+
+        try:
+            view = memoryview(self._mmap)
+            try:
+                (num_states, num_symbols, start, names_end,
+                 table_start, table_end, bits_end) = _read_layout(view)
+                symbols = self._read_symbols(num_symbols, names_end)
+                table = _table_view(view, num_states, table_start, table_end,
+                                    check_targets=check_targets)
+                final_bits = view[table_end:bits_end]
+            finally:
+                view.release()
+        except ValueError as e:
+            self._mmap.close()
+            raise ValueError(f"Invalid binary DFA file '{filename}': {e}")
+
+        self._names_end = names_end
+        super().__init__(self._read_state_names, symbols, table, start, final_bits,
+                         num_states=num_states)
+
+    def _read_symbols(self, num_symbols, names_end):
+        """Decode only the symbol names at the end of the name table."""
+        if num_symbols == 0:
+            return []
+        pos = names_end
+        for _ in range(num_symbols):
+            pos = self._mmap.rfind(b'\0', HEADER.size, pos)
+            if pos == -1:
+                raise ValueError("Name table is too short")
+        return str(self._mmap[pos + 1:names_end], 'utf-8').split('\0')
+
+    def _read_state_names(self):
+        """Decode the state names from the name table."""
+        names = str(self._mmap[HEADER.size:self._names_end], 'utf-8').split('\0')
+        return names[:self.num_states]
+
+    def close(self):
+        """Release the views and unmap the file."""
+        if self._mmap.closed:
+            return
+        if isinstance(self.table, memoryview):
+            self.table.release()
+        self.final_bits.release()
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def load_dfa_mmap(filename, check_targets=False):
+    """
+    Open a binary DFA file for simulation without loading it into memory.
+
+    Args:
+        filename: Path to the binary DFA file
+        check_targets: Verify every transition target when opening
+
+    Returns:
+        MappedDFA object
+
+    Raises:
+        IOError: If the file cannot be opened or mapped
+        ValueError: If the file is not a valid binary DFA
+    """
+    return MappedDFA(filename, check_targets=check_targets)
+
+
+def export_dfa_binary(dfa, filename, compression=None):
+    """
+    Export a DFA object to a binary DFA file.
+
+    Args:
+        dfa: A DFA object to export
+        filename: Path to the file to create
+        compression: 'gzip', 'bz2', 'xz', 'zstd' or 'none'; by default
+            chosen from the extension (e.g. "dfa.dfab.xz" is xz-compressed)
+
+    Returns:
+        None
+
+    Raises:
+        IOError: If file cannot be written
+        ValueError: If a state or symbol name contains a NUL character, or
+            the compression format is unknown or unavailable
+    """
+    data = encode_dfa(dfa)
+
+    try:
+        with open_dfa_file(filename, 'wb', compression) as f:
+            f.write(data)
+        print(f"✓ DFA exported successfully to '{filename}'")
+    except IOError as e:
+        raise IOError(f"Failed to write DFA to file '{filename}': {e}")
+
+
+def import_dfa_binary(filename):
+    """
+    Import a DFA object from a binary DFA file.
+
+    Compressed files are detected from their magic bytes and decompressed
+    while reading.
+
+    Args:
+        filename: Path to the file to load
+
+    Returns:
+        DFA object
+
+    Raises:
+        IOError: If file cannot be read
+        ValueError: If the file is not a valid binary DFA
+    """
+    try:
+        with open_dfa_file(filename, 'rb') as f:
+            data = f.read()
+    except DECOMPRESSION_ERRORS as e:
+        raise IOError(f"Failed to read file '{filename}': {e}")
+
+    try:
+        dfa = decode_dfa(data)
+    except ValueError as e:
+        raise ValueError(f"Invalid binary DFA file '{filename}': {e}")
+
+    print(f"✓ DFA imported successfully from '{filename}'")
+    return dfa
@@ -1,15 +1,434 @@
 """
 DFA Builder - GUI for manually creating DFAs
 """
+import csv
+from bisect import bisect_left
+from collections import Counter
+
 from PyQt5.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
-    QPushButton, QListWidget, QGroupBox, QMessageBox, QTableWidget,
-    QTableWidgetItem, QHeaderView, QComboBox, QFileDialog
+    QPushButton, QListWidget, QGroupBox, QMessageBox, QTableView,
+    QHeaderView, QComboBox, QFileDialog, QAbstractItemView, QTabWidget,
+    QPlainTextEdit, QTableWidget, QTableWidgetItem, QCheckBox, QDialogButtonBox,
+    QWidget
 )
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex
 from dfa import DFA
 
 
+class TransitionsTableModel(QAbstractTableModel):
+    """
+    Table model over a transitions dict {(from_state, symbol): to_state}.
+    
+    Rows are kept sorted by the current sort column, so adding or removing
+    a transition is a binary search plus a single row insert/remove signal
+    instead of rebuilding the whole table. Rows are fetched lazily in
+    batches, so views only materialize what is scrolled into view.
+    """
+    
+    HEADERS = ['From', 'Symbol', 'To']
+    FETCH_BATCH = 1000
+    
+    def __init__(self, transitions=None, parent=None):
+        super().__init__(parent)
+        self._sort_column = 0
+        self._sort_order = Qt.AscendingOrder
+        self._transitions = {}
+        self._rows = []        # transition keys, ascending by sort key
+        self._sort_keys = []   # sort key of each entry in _rows
+        self._loaded = 0       # rows exposed to views so far
+        self.set_transitions(transitions if transitions is not None else {})
+    
+    # --- Qt model interface -------------------------------------------------
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._loaded
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+        key = self.key_at(index.row())
+        if index.column() == 0:
+            return key[0]
+        if index.column() == 1:
+            return key[1]
+        return self._transitions[key]
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return section + 1
+    
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._loaded < len(self._rows)
+    
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        count = min(self.FETCH_BATCH, len(self._rows) - self._loaded)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + count - 1)
+        self._loaded += count
+        self.endInsertRows()
+    
+    def sort(self, column, order=Qt.AscendingOrder):
+        self.beginResetModel()
+        self._sort_column = column
+        self._sort_order = order
+        self._rebuild()
+        self.endResetModel()
+    
+    # --- Transition editing -------------------------------------------------
+    
+    def set_transitions(self, transitions):
+        """Replace the underlying transitions dict and reset the model."""
+        self.beginResetModel()
+        self._transitions = transitions
+        self._rebuild()
+        self.endResetModel()
+    
+    def set_transition(self, key, to_state):
+        """Add or overwrite a single transition."""
+        if key in self._transitions:
+            if self._sort_column == 2 and self._transitions[key] != to_state:
+                # Target is the sort key, so the row moves
+                self._remove_row(key)
+            else:
+                self._transitions[key] = to_state
+                row = self._internal_index(self._index_of(key))
+                if row < self._loaded:
+                    self.dataChanged.emit(self.index(row, 0), self.index(row, 2))
+                return
+        
+        self._transitions[key] = to_state
+        self._insert_row(key)
+    
+    def remove_transition(self, key):
+        """Remove a single transition if present."""
+        if key in self._transitions:
+            self._remove_row(key)
+            del self._transitions[key]
+    
+    def remove_transitions(self, keys):
+        """Remove several transitions, resetting the model once for large batches."""
+        keys = [k for k in keys if k in self._transitions]
+        if len(keys) <= 100:
+            for key in keys:
+                self.remove_transition(key)
+            return
+        
+        self.beginResetModel()
+        for key in keys:
+            del self._transitions[key]
+        self._rebuild()
+        self.endResetModel()
+    
+    def key_at(self, row):
+        """Return the (from_state, symbol) key shown at a view row."""
+        return self._rows[self._internal_index(row)]
+    
+    # --- Internals ----------------------------------------------------------
+    
+    def _sort_key(self, key):
+        from_state, symbol = key
+        if self._sort_column == 1:
+            return (symbol, from_state)
+        if self._sort_column == 2:
+            return (self._transitions[key], from_state, symbol)
+        return key
+    
+    def _rebuild(self):
+        pairs = sorted((self._sort_key(key), key) for key in self._transitions)
+        self._sort_keys = [sort_key for sort_key, _ in pairs]
+        self._rows = [key for _, key in pairs]
+        self._loaded = min(len(self._rows), self.FETCH_BATCH)
+    
+    def _internal_index(self, row):
+        # Descending order is the ascending list read backwards. The mapping
+        # is its own inverse, so it also turns list indexes into view rows.
+        if self._sort_order == Qt.AscendingOrder:
+            return row
+        return len(self._rows) - 1 - row
+    
+    def _index_of(self, key):
+        return bisect_left(self._sort_keys, self._sort_key(key))
+    
+    def _insert_row(self, key):
+        sort_key = self._sort_key(key)
+        index = bisect_left(self._sort_keys, sort_key)
+        
+        # Row position once inserted
+        if self._sort_order == Qt.AscendingOrder:
+            row = index
+        else:
+            row = len(self._rows) - index
+        
+        # Show the row now if it lands among the fetched rows, or right
+        # after them when everything has been fetched
+        if row < self._loaded or self._loaded == len(self._rows):
+            self.beginInsertRows(QModelIndex(), row, row)
+            self._sort_keys.insert(index, sort_key)
+            self._rows.insert(index, key)
+            self._loaded += 1
+            self.endInsertRows()
+        else:
+            # Not fetched yet; canFetchMore() will expose it
+            self._sort_keys.insert(index, sort_key)
+            self._rows.insert(index, key)
+    
+    def _remove_row(self, key):
+        index = self._index_of(key)
+        row = self._internal_index(index)
+        
+        if row < self._loaded:
+            self.beginRemoveRows(QModelIndex(), row, row)
+            del self._sort_keys[index]
+            del self._rows[index]
+            self._loaded -= 1
+            self.endRemoveRows()
+        else:
+            del self._sort_keys[index]
+            del self._rows[index]
+
+
+def parse_transitions_text(text):
+    """
+    Parse a pasted block of transitions.
+    
+    Each non-empty line holds one transition as three comma- or
+    tab-separated fields: from_state, symbol, to_state. Lines starting
+    with '#' and an optional "from,symbol,to" header row are ignored.
+    
+    Args:
+        text: The pasted CSV/TSV text
+        
+    Returns:
+        Tuple of (transitions, errors) where transitions maps
+        (from_state, symbol) -> to_state and errors is a list of
+        "Line N: message" strings
+    """
+    delimiter = '\t' if '\t' in text else ','
+    transitions = {}
+    errors = []
+    
+    for line_no, row in enumerate(csv.reader(text.splitlines(), delimiter=delimiter), start=1):
+        fields = [field.strip() for field in row]
+        if not any(fields) or fields[0].startswith('#'):
+            continue
+        if line_no == 1 and [f.lower() for f in fields] == ['from', 'symbol', 'to']:
+            continue
+        if len(fields) != 3 or not all(fields):
+            errors.append(f"Line {line_no}: expected 'from{delimiter}symbol{delimiter}to', got {row}")
+            continue
+        
+        from_state, symbol, to_state = fields
+        transitions[(from_state, symbol)] = to_state
+    
+    return transitions, errors
+
+
+class BulkTransitionsDialog(QDialog):
+    """Dialog for entering many transitions at once, by paste or by grid."""
+    
+    def __init__(self, states, alphabet, transitions, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle('Bulk Edit Transitions')
+        self.setGeometry(200, 200, 700, 500)
+        self.setModal(True)
+        
+        self.states = list(states)
+        self.alphabet = list(alphabet)
+        self.existing = transitions
+        
+        # Results, read by the builder after exec_()
+        self.new_transitions = {}
+        self.removed_keys = []
+        
+        self.init_ui()
+    
+    def init_ui(self):
+        """Initialize the user interface."""
+        layout = QVBoxLayout()
+        self.setLayout(layout)
+        
+        self.tabs = QTabWidget()
+        layout.addWidget(self.tabs)
+        
+        # Paste tab
+        paste_widget = QWidget()
+        paste_layout = QVBoxLayout()
+        paste_widget.setLayout(paste_layout)
+        
+        hint = QLabel(
+            'One transition per line: <b>from, symbol, to</b> '
+            '(comma- or tab-separated, e.g. pasted from a spreadsheet).'
+        )
+        hint.setWordWrap(True)
+        paste_layout.addWidget(hint)
+        
+        self.paste_input = QPlainTextEdit()
+        self.paste_input.setPlaceholderText('q0,a,q1\nq0,b,q0\nq1,a,q1\nq1,b,q0')
+        paste_layout.addWidget(self.paste_input)
+        
+        self.add_unknown_check = QCheckBox('Add unknown states and symbols automatically')
+        self.add_unknown_check.setChecked(True)
+        paste_layout.addWidget(self.add_unknown_check)
+        
+        self.tabs.addTab(paste_widget, 'Paste CSV/TSV')
+        
+        # Grid tab: one row per state, one column per symbol
+        self.grid = QTableWidget(len(self.states), len(self.alphabet))
+        self.grid.setVerticalHeaderLabels(self.states)
+        self.grid.setHorizontalHeaderLabels(self.alphabet)
+        for row, state in enumerate(self.states):
+            for col, symbol in enumerate(self.alphabet):
+                target = self.existing.get((state, symbol))
+                if target is not None:
+                    self.grid.setItem(row, col, QTableWidgetItem(target))
+        self.tabs.addTab(self.grid, 'State × Symbol Grid')
+        
+        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        buttons.accepted.connect(self.apply)
+        buttons.rejected.connect(self.reject)
+        layout.addWidget(buttons)
+    
+    def apply(self):
+        """Parse the active tab and close if it is valid."""
+        if self.tabs.currentWidget() is self.grid:
+            transitions, removed, errors = self.read_grid()
+        else:
+            transitions, errors = parse_transitions_text(self.paste_input.toPlainText())
+            removed = []
+            if not errors and not self.add_unknown_check.isChecked():
+                errors = self.unknown_names(transitions)
+        
+        if errors:
+            QMessageBox.warning(
+                self, 'Invalid Transitions',
+                '\n'.join(errors[:10]) +
+                (f'\n... and {len(errors) - 10} more' if len(errors) > 10 else '')
+            )
+            return
+        
+        self.new_transitions = transitions
+        self.removed_keys = removed
+        self.accept()
+    
+    def read_grid(self):
+        """Read the grid. Empty cells remove existing transitions."""
+        state_set = set(self.states)
+        transitions = {}
+        removed = []
+        errors = []
+        
+        for row, state in enumerate(self.states):
+            for col, symbol in enumerate(self.alphabet):
+                item = self.grid.item(row, col)
+                target = item.text().strip() if item else ''
+                if not target:
+                    if (state, symbol) in self.existing:
+                        removed.append((state, symbol))
+                elif target not in state_set:
+                    errors.append(f"({state}, {symbol}): unknown state '{target}'")
+                else:
+                    transitions[(state, symbol)] = target
+        
+        return transitions, removed, errors
+    
+    def unknown_names(self, transitions):
+        """List states and symbols in transitions that are not defined yet."""
+        state_set = set(self.states)
+        symbol_set = set(self.alphabet)
+        errors = []
+        for (from_state, symbol), to_state in transitions.items():
+            for state in (from_state, to_state):
+                if state not in state_set:
+                    errors.append(f"Unknown state '{state}'")
+                    state_set.add(state)
+            if symbol not in symbol_set:
+                errors.append(f"Unknown symbol '{symbol}'")
+                symbol_set.add(symbol)
+        return errors
+
+
+class CompletenessTracker:
+    """
+    Live count of what keeps the transition function from being complete.
+    
+    Tracks two numbers, each updated in O(1) per edit:
+    - missing: (state, symbol) pairs without a transition, i.e.
+      |Q| × |Σ| minus the number of defined transitions
+    - dangling: transitions whose target state has been removed
+    
+    The builder only stores transitions whose source state and symbol
+    exist, so the defined count is simply the number of transitions.
+    """
+    
+    def __init__(self, states=(), alphabet=(), transitions=None):
+        self.reset(states, alphabet, transitions or {})
+    
+    def reset(self, states, alphabet, transitions):
+        """Recount everything from scratch (O(|δ|))."""
+        self._states = set(states)
+        self._num_symbols = len(set(alphabet))
+        self._defined = len(transitions)
+        self._target_refs = Counter(transitions.values())
+        self.dangling = sum(count for target, count in self._target_refs.items()
+                            if target not in self._states)
+    
+    @property
+    def missing(self):
+        """Number of (state, symbol) pairs without a transition."""
+        return len(self._states) * self._num_symbols - self._defined
+    
+    @property
+    def is_complete(self):
+        """True if every pair has a transition to an existing state."""
+        return self.missing == 0 and self.dangling == 0
+    
+    def add_state(self, state):
+        self._states.add(state)
+        self.dangling -= self._target_refs[state]
+    
+    def remove_state(self, state):
+        """Remove a state. Its outgoing transitions must be removed first."""
+        self._states.discard(state)
+        self.dangling += self._target_refs[state]
+    
+    def add_symbol(self):
+        self._num_symbols += 1
+    
+    def remove_symbol(self):
+        """Remove a symbol. Its transitions must be removed first."""
+        self._num_symbols -= 1
+    
+    def set_transition(self, old_target, new_target):
+        """Record a transition being added (old_target None) or overwritten."""
+        if old_target is None:
+            self._defined += 1
+        else:
+            self._unref(old_target)
+        self._target_refs[new_target] += 1
+        if new_target not in self._states:
+            self.dangling += 1
+    
+    def remove_transition(self, old_target):
+        """Record a transition being removed."""
+        self._defined -= 1
+        self._unref(old_target)
+    
+    def _unref(self, target):
+        self._target_refs[target] -= 1
+        if target not in self._states:
+            self.dangling -= 1
+
+
 class DFABuilderDialog(QDialog):
     """Dialog for manually creating a DFA."""
     
@@ -24,6 +443,7 @@ class DFABuilderDialog(QDialog):
         self.transitions = {}
         self.start_state = None
         self.final_states = []
+        self.completeness = CompletenessTracker()
         
         self.init_ui()
         
@@ -140,13 +560,26 @@ class DFABuilderDialog(QDialog):
         
         transitions_layout.addLayout(trans_input_layout)
         
+        trans_btn_layout = QHBoxLayout()
+        
         add_transition_btn = QPushButton('Add Transition')
         add_transition_btn.clicked.connect(self.add_transition)
-        transitions_layout.addWidget(add_transition_btn)
-        
-        self.transitions_table = QTableWidget()
-        self.transitions_table.setColumnCount(3)
-        self.transitions_table.setHorizontalHeaderLabels(['From', 'Symbol', 'To'])
+        trans_btn_layout.addWidget(add_transition_btn)
+        
+        bulk_transition_btn = QPushButton('Bulk Add...')
+        bulk_transition_btn.clicked.connect(self.bulk_add_transitions)
+        trans_btn_layout.addWidget(bulk_transition_btn)
+        
+        transitions_layout.addLayout(trans_btn_layout)
+        
+        self.transitions_model = TransitionsTableModel(self.transitions, self)
+        self.transitions_table = QTableView()
+        self.transitions_table.setModel(self.transitions_model)
+        self.transitions_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.transitions_table.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.transitions_table.setSortingEnabled(True)
+        self.transitions_table.sortByColumn(0, Qt.AscendingOrder)
+        self.transitions_table.verticalHeader().setVisible(False)
         self.transitions_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         self.transitions_table.setMaximumHeight(200)
         transitions_layout.addWidget(self.transitions_table)
@@ -155,6 +588,11 @@ class DFABuilderDialog(QDialog):
         remove_transition_btn.clicked.connect(self.remove_transition)
         transitions_layout.addWidget(remove_transition_btn)
         
+        self.completeness_label = QLabel()
+        self.completeness_label.setWordWrap(True)
+        transitions_layout.addWidget(self.completeness_label)
+        self.update_completeness_label()
+        
         transitions_group.setLayout(transitions_layout)
         right_column.addWidget(transitions_group)
         
@@ -228,6 +666,8 @@ class DFABuilderDialog(QDialog):
         self.states.append(state)
         self.states_list.addItem(state)
         self.state_input.clear()
+        self.completeness.add_state(state)
+        self.update_completeness_label()
         
         # Update combo boxes
         self.update_combos()
@@ -245,10 +685,11 @@ class DFABuilderDialog(QDialog):
         # Remove related transitions
         to_remove = [k for k in self.transitions.keys() if k[0] == state]
         for k in to_remove:
-            del self.transitions[k]
+            self.completeness.remove_transition(self.transitions[k])
+        self.transitions_model.remove_transitions(to_remove)
+        self.completeness.remove_state(state)
+        self.update_completeness_label()
         
-        # Update table
-        self.update_transitions_table()
         self.update_combos()
     
     def add_symbol(self):
@@ -265,6 +706,8 @@ class DFABuilderDialog(QDialog):
         self.alphabet.append(symbol)
         self.alphabet_list.addItem(symbol)
         self.alphabet_input.clear()
+        self.completeness.add_symbol()
+        self.update_completeness_label()
         
         # Update combo boxes
         self.update_combos()
@@ -282,10 +725,11 @@ class DFABuilderDialog(QDialog):
         # Remove related transitions
         to_remove = [k for k in self.transitions.keys() if k[1] == symbol]
         for k in to_remove:
-            del self.transitions[k]
+            self.completeness.remove_transition(self.transitions[k])
+        self.transitions_model.remove_transitions(to_remove)
+        self.completeness.remove_symbol()
+        self.update_completeness_label()
         
-        # Update table
-        self.update_transitions_table()
         self.update_combos()
     
     def add_transition(self):
@@ -308,23 +752,74 @@ class DFABuilderDialog(QDialog):
             if reply == QMessageBox.No:
                 return
         
-        self.transitions[key] = to_state
-        self.update_transitions_table()
+        self.completeness.set_transition(self.transitions.get(key), to_state)
+        self.transitions_model.set_transition(key, to_state)
+        self.update_completeness_label()
+    
+    def bulk_add_transitions(self):
+        """Open the bulk editor and apply its transitions in one batch."""
+        dialog = BulkTransitionsDialog(self.states, self.alphabet, self.transitions, self)
+        if dialog.exec_() == QDialog.Accepted:
+            self.apply_transitions(dialog.new_transitions, dialog.removed_keys)
+    
+    def apply_transitions(self, transitions, removed_keys=()):
+        """
+        Apply many transition edits with a single table refresh.
+        
+        States and symbols used by the transitions that are not defined yet
+        are added to the DFA.
+        
+        Args:
+            transitions: Dict mapping (from_state, symbol) -> to_state to add or overwrite
+            removed_keys: (from_state, symbol) keys to delete
+        """
+        state_set = set(self.states)
+        symbol_set = set(self.alphabet)
+        new_states = []
+        new_symbols = []
+        
+        for (from_state, symbol), to_state in transitions.items():
+            for state in (from_state, to_state):
+                if state not in state_set:
+                    state_set.add(state)
+                    new_states.append(state)
+            if symbol not in symbol_set:
+                symbol_set.add(symbol)
+                new_symbols.append(symbol)
+        
+        if new_states:
+            self.states.extend(new_states)
+            self.states_list.addItems(new_states)
+            for state in new_states:
+                self.completeness.add_state(state)
+        if new_symbols:
+            self.alphabet.extend(new_symbols)
+            self.alphabet_list.addItems(new_symbols)
+            for _ in new_symbols:
+                self.completeness.add_symbol()
+        
+        for key in removed_keys:
+            if key in self.transitions:
+                self.completeness.remove_transition(self.transitions.pop(key))
+        for key, to_state in transitions.items():
+            self.completeness.set_transition(self.transitions.get(key), to_state)
+            self.transitions[key] = to_state
+        
+        self.transitions_model.set_transitions(self.transitions)
+        self.update_completeness_label()
+        if new_states or new_symbols:
+            self.update_combos()
     
     def remove_transition(self):
         """Remove selected transition."""
-        current_row = self.transitions_table.currentRow()
-        if current_row < 0:
+        current_index = self.transitions_table.currentIndex()
+        if not current_index.isValid():
             return
         
-        from_state = self.transitions_table.item(current_row, 0).text()
-        symbol = self.transitions_table.item(current_row, 1).text()
-        
-        key = (from_state, symbol)
-        if key in self.transitions:
-            del self.transitions[key]
-        
-        self.update_transitions_table()
+        key = self.transitions_model.key_at(current_index.row())
+        self.completeness.remove_transition(self.transitions[key])
+        self.transitions_model.remove_transition(key)
+        self.update_completeness_label()
     
     def set_start_state(self):
         """Set the start state."""
@@ -379,15 +874,53 @@ class DFABuilderDialog(QDialog):
         self.symbol_combo.addItems(self.alphabet)
     
     def update_transitions_table(self):
-        """Update the transitions table."""
-        self.transitions_table.setRowCount(0)
+        """
+        Reload the transitions table from self.transitions.
+        
+        Only needed after replacing self.transitions wholesale; single edits
+        go through self.transitions_model and update the table incrementally.
+        """
+        self.transitions_model.set_transitions(self.transitions)
+        self.completeness.reset(self.states, self.alphabet, self.transitions)
+        self.update_completeness_label()
+    
+    def update_completeness_label(self):
+        """Show how far the transition function is from complete."""
+        missing = self.completeness.missing
+        dangling = self.completeness.dangling
+        
+        if not self.states or not self.alphabet:
+            self.completeness_label.setText('Add states and symbols to define transitions.')
+            self.completeness_label.setStyleSheet('padding: 5px; background-color: #f0f0f0;')
+        elif self.completeness.is_complete:
+            self.completeness_label.setText(
+                f'✓ Transition function complete ({len(self.transitions)} transitions)'
+            )
+            self.completeness_label.setStyleSheet('padding: 5px; background-color: #c8e6c9;')
+        else:
+            problems = []
+            if missing:
+                problems.append(f'{missing} missing transition{"s" if missing != 1 else ""}')
+            if dangling:
+                problems.append(f'{dangling} to removed state{"s" if dangling != 1 else ""}')
+            self.completeness_label.setText(f'⚠ {", ".join(problems)}')
+            self.completeness_label.setStyleSheet('padding: 5px; background-color: #fff3e0;')
+    
+    def missing_transitions(self, limit=5):
+        """
+        List up to `limit` (state, symbol) pairs that have no transition.
         
-        for (from_state, symbol), to_state in sorted(self.transitions.items()):
-            row = self.transitions_table.rowCount()
-            self.transitions_table.insertRow(row)
-            self.transitions_table.setItem(row, 0, QTableWidgetItem(from_state))
-            self.transitions_table.setItem(row, 1, QTableWidgetItem(symbol))
-            self.transitions_table.setItem(row, 2, QTableWidgetItem(to_state))
+        Only called when the tracker reports missing transitions, and stops
+        as soon as enough are found.
+        """
+        missing = []
+        for state in self.states:
+            for symbol in self.alphabet:
+                if (state, symbol) not in self.transitions:
+                    missing.append(f"({state}, {symbol})")
+                    if len(missing) >= limit:
+                        return missing
+        return missing
     
     def export_dfa(self):
         """Export the current DFA configuration to a JSON file."""
@@ -415,17 +948,13 @@ class DFABuilderDialog(QDialog):
                 return
         
         # Check for incomplete transitions
-        missing = []
-        for state in self.states:
-            for symbol in self.alphabet:
-                if (state, symbol) not in self.transitions:
-                    missing.append(f"({state}, {symbol})")
-        
-        if missing:
+        if self.completeness.missing:
+            missing = self.missing_transitions(limit=5)
+            total = self.completeness.missing
             reply = QMessageBox.question(
                 self, 'Incomplete Transitions',
-                f'Missing transitions: {", ".join(missing[:5])}{"..." if len(missing) > 5 else ""}\n\n'
-                f'Total missing: {len(missing)}\n\n'
+                f'Missing transitions: {", ".join(missing)}{"..." if total > 5 else ""}\n\n'
+                f'Total missing: {total}\n\n'
                 f'Export anyway? (DFA may not work correctly)',
                 QMessageBox.Yes | QMessageBox.No
             )
@@ -434,13 +963,7 @@ class DFABuilderDialog(QDialog):
         
         # Try to create and export DFA
         try:
-            temp_dfa = DFA(
-                states=set(self.states),
-                alphabet=set(self.alphabet),
-                transitions=self.transitions,
-                start_state=self.start_state,
-                final_states=set(self.final_states)
-            )
+            temp_dfa = self.build_dfa()
             
             # Open file dialog
             filename, _ = QFileDialog.getSaveFileName(
@@ -457,6 +980,25 @@ class DFABuilderDialog(QDialog):
         except Exception as e:
             QMessageBox.critical(self, 'Error', f'Failed to export DFA:\n{str(e)}')
     
+    def build_dfa(self):
+        """
+        Build a DFA from the current definition.
+        
+        The sets built here are handed to the DFA without a second copy, and
+        the completeness tracker already knows whether every transition is
+        defined, so the |Q| × |Σ| scan only runs when it reports gaps.
+        
+        Returns:
+            DFA object
+            
+        Raises:
+            ValueError: If the definition is not a valid DFA
+        """
+        dfa = DFA.from_trusted(set(self.states), set(self.alphabet), self.transitions,
+                               self.start_state, set(self.final_states))
+        dfa.validate(check_transitions=not self.completeness.is_complete)
+        return dfa
+    
     def create_dfa(self):
         """Create the DFA and close dialog."""
         # Validate
@@ -482,17 +1024,13 @@ class DFABuilderDialog(QDialog):
                 return
         
         # Check if transition function is complete
-        missing = []
-        for state in self.states:
-            for symbol in self.alphabet:
-                if (state, symbol) not in self.transitions:
-                    missing.append(f"({state}, {symbol})")
-        
-        if missing:
+        if self.completeness.missing:
+            missing = self.missing_transitions(limit=5)
+            total = self.completeness.missing
             reply = QMessageBox.question(
                 self, 'Incomplete Transitions',
-                f'Missing transitions: {", ".join(missing[:5])}{"..." if len(missing) > 5 else ""}\n\n'
-                f'Total missing: {len(missing)}\n\n'
+                f'Missing transitions: {", ".join(missing)}{"..." if total > 5 else ""}\n\n'
+                f'Total missing: {total}\n\n'
                 f'A complete DFA requires transitions for all (state, symbol) pairs.\n'
                 f'Continue anyway? (May cause errors)',
                 QMessageBox.Yes | QMessageBox.No
@@ -502,13 +1040,7 @@ class DFABuilderDialog(QDialog):
         
         # Try to create DFA
         try:
-            self.dfa = DFA(
-                states=set(self.states),
-                alphabet=set(self.alphabet),
-                transitions=self.transitions,
-                start_state=self.start_state,
-                final_states=set(self.final_states)
-            )
+            self.dfa = self.build_dfa()
             self.accept()
         except Exception as e:
             QMessageBox.critical(self, 'Error', f'Failed to create DFA:\n{str(e)}')
@@ -0,0 +1,142 @@
+"""
+Bulk loading of DFA directories
+
+load_dfa_directory() loads every DFA file in a directory, parsing and
+validating files in parallel across a process pool, and returns the DFAs
+together with a structured error report instead of printing per file.
+"""
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from dfa_compression import strip_compression_extension
+from dfa_import_cache import parse_dfa_file
+
+
+# File extensions picked up by load_dfa_directory()
+DFA_EXTENSIONS = ('.json', '.dfab')
+
+# Files sent to a worker process at a time
+CHUNK_SIZE = 16
+
+
+def _error_report(path, kind, message, line=None, column=None):
+    """Build one entry of the error report."""
+    return {
+        'path': path,
+        'kind': kind,
+        'message': message,
+        'line': line,
+        'column': column,
+    }
+
+
+def load_dfa_file(path):
+    """
+    Load one DFA file without printing, reporting failure as data.
+
+    Args:
+        path: Path to a JSON or binary DFA file
+
+    Returns:
+        Tuple of (dfa, error) where exactly one is None. error is a dict with
+        'path', 'kind' ('io', 'syntax' or 'invalid'), 'message', and for
+        JSON syntax errors the 'line' and 'column'
+    """
+    try:
+        return parse_dfa_file(path), None
+    except IOError as e:
+        return None, _error_report(path, 'io', str(e))
+    except json.JSONDecodeError as e:
+        return None, _error_report(path, 'syntax', e.msg, e.lineno, e.colno)
+    except ValueError as e:
+        return None, _error_report(path, 'invalid', str(e))
+    except Exception as e:
+        # Malformed content the parser did not anticipate, e.g. a list
+        # where a state name belongs
+        return None, _error_report(path, 'invalid', f"{type(e).__name__}: {e}")
+
+
+def load_dfa_directory(directory, workers=None, extensions=DFA_EXTENSIONS):
+    """
+    Load and validate every DFA file in a directory.
+
+    Each file `name.json` (or `name.dfab`, optionally compressed as
+    `name.json.gz` etc.) is returned under `name`. A name that several files
+    map to is not loaded and is reported as a 'duplicate' error listing
+    those files. Files are parsed in a process pool; pass workers=1 to load
+    in this process.
+
+    Args:
+        directory: Directory containing DFA files
+        workers: Number of worker processes (defaults to the CPU count)
+        extensions: File extensions to load
+
+    Returns:
+        Tuple of (dfas, errors) where dfas maps name -> DFA and errors maps
+        name -> error dict (see load_dfa_file())
+
+    Raises:
+        IOError: If the directory cannot be listed
+    """
+    try:
+        entries = sorted(os.listdir(directory))
+    except OSError as e:
+        raise IOError(f"Failed to list directory '{directory}': {e}")
+
+    files = {}
+    for entry in entries:
+        name, ext = os.path.splitext(strip_compression_extension(entry))
+        if ext in extensions:
+            files.setdefault(name, []).append(entry)
+
+    jobs = {}
+    errors = {}
+    for name, clashing in files.items():
+        path = os.path.join(directory, clashing[0])
+        if len(clashing) > 1:
+            errors[name] = _error_report(
+                path, 'duplicate', f"Several files would be loaded as '{name}': "
+                                   f"{', '.join(clashing)}")
+        else:
+            jobs[name] = path
+
+    names = list(jobs)
+    paths = list(jobs.values())
+    if workers == 1 or len(paths) <= 1:
+        results = map(load_dfa_file, paths)
+        return _collect(names, results, errors)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(load_dfa_file, paths, chunksize=CHUNK_SIZE)
+        return _collect(names, results, errors)
+
+
+def _collect(names, results, errors):
+    """Split (dfa, error) results into the dfas and errors mappings."""
+    dfas = {}
+    for name, (dfa, error) in zip(names, results):
+        if error is None:
+            dfas[name] = dfa
+        else:
+            errors[name] = error
+    return dfas, errors
+
+
+def format_error_report(errors):
+    """
+    Format an error report as readable lines.
+
+    Args:
+        errors: Errors mapping returned by load_dfa_directory()
+
+    Returns:
+        String with one line per failed file
+    """
+    lines = []
+    for name, error in sorted(errors.items()):
+        location = ''
+        if error['line'] is not None:
+            location = f" (line {error['line']}, column {error['column']})"
+        lines.append(f"✗ {name} [{error['kind']}]{location}: {error['message']}")
+    return '\n'.join(lines)
@@ -0,0 +1,312 @@
+"""
+Compact table-backed DFA
+
+CompactDFA stores the transition function as one flat sequence of state
+indexes (δ(i, j) at position i·|Σ| + j) and the final states as a bitmap,
+instead of a dict keyed by (state, symbol) tuples. The table can be any
+indexable sequence of ints: an array.array, or a memoryview over a
+memory-mapped binary DFA file (see dfa_binary.load_dfa_mmap).
+
+CompactDFA has the same attributes and simulation methods as DFA, so it
+can be passed to is_accepted(), trace_execution(), the visualizers and
+DFABuilderDialog. states, final_states and transitions are lightweight
+read-only views over the table and bitmap rather than sets and a dict;
+process() runs directly on the table. CompactDFA.from_dfa() converts a
+regular DFA, storing each transition in 4 bytes instead of a dict entry.
+"""
+import sys
+from array import array
+from collections.abc import Mapping, Set
+
+from dfa import DFA
+from dfa_encoding import ENCODE_MIN_LENGTH, make_encoder
+
+
+class CompactTransitions(Mapping):
+    """Read-only (state, symbol) -> next_state view over a CompactDFA table."""
+
+    def __init__(self, dfa):
+        self._dfa = dfa
+
+    def __getitem__(self, key):
+        dfa = self._dfa
+        try:
+            state, symbol = key
+            i = dfa.state_index[state]
+            j = dfa.symbol_index[symbol]
+        except (KeyError, TypeError, ValueError):
+            raise KeyError(key)
+        return dfa.state_names[dfa.table[i * dfa.num_symbols + j]]
+
+    def __iter__(self):
+        symbols = self._dfa.symbols
+        for state in self._dfa.state_names:
+            for symbol in symbols:
+                yield (state, symbol)
+
+    def __len__(self):
+        return self._dfa.num_states * self._dfa.num_symbols
+
+
+class CompactStates(Set):
+    """Read-only set view of the state names of a CompactDFA."""
+
+    def __init__(self, dfa):
+        self._dfa = dfa
+
+    def __contains__(self, state):
+        try:
+            return state in self._dfa.state_index
+        except TypeError:
+            return False
+
+    def __iter__(self):
+        return iter(self._dfa.state_names)
+
+    def __len__(self):
+        return self._dfa.num_states
+
+    def __repr__(self):
+        return f"CompactStates({len(self)} states)"
+
+
+class CompactFinalStates(Set):
+    """Read-only set view of the final states of a CompactDFA's bitmap."""
+
+    def __init__(self, dfa):
+        self._dfa = dfa
+
+    def __contains__(self, state):
+        try:
+            index = self._dfa.state_index.get(state)
+        except TypeError:
+            return False
+        return index is not None and self._dfa.is_final(index)
+
+    def __iter__(self):
+        names = self._dfa.state_names
+        for byte_index, byte in enumerate(self._dfa.final_bits):
+            while byte:
+                low = byte & -byte
+                yield names[(byte_index << 3) + low.bit_length() - 1]
+                byte ^= low
+
+    def __len__(self):
+        return int.from_bytes(self._dfa.final_bits, 'little').bit_count()
+
+    def __repr__(self):
+        return f"CompactFinalStates({len(self)} states)"
+
+
+class CompactDFA:
+    """
+    DFA backed by a dense transition table of state indexes.
+
+    The table must be complete: every entry is the index of a valid state.
+    """
+
+    __slots__ = ('_load_state_names', '_state_names', '_state_index', 'num_states',
+                 'symbols', 'num_symbols', 'symbol_index', 'table', 'start_index',
+                 'final_bits', 'alphabet', 'states', 'final_states', 'transitions',
+                 '_encoder', '__weakref__')
+
+    def __init__(self, state_names, symbols, table, start_index, final_bits,
+                 num_states=None):
+        """
+        Initialize a compact DFA.
+
+        Args:
+            state_names: List of state names indexed by state number, or a
+                zero-argument callable returning that list (decoded on first use)
+            symbols: Sequence of input symbols indexed by symbol number
+            table: Sequence of |Q|·|Σ| ints, δ(i, j) at position i·|Σ| + j
+            start_index: Index of the start state
+            final_bits: Bitmap of final states, bit i (LSB first) for state i
+            num_states: Number of states (required if state_names is callable)
+        """
+        if callable(state_names):
+            self._load_state_names = state_names
+            self._state_names = None
+        else:
+            self._load_state_names = None
+            self._state_names = list(state_names)
+            num_states = len(self._state_names)
+
+        self.num_states = num_states
+        self.symbols = tuple(symbols)
+        self.num_symbols = len(self.symbols)
+        self.symbol_index = {symbol: j for j, symbol in enumerate(self.symbols)}
+        self._encoder = make_encoder(self.symbols)
+        self.table = table
+        self.start_index = start_index
+        self.final_bits = final_bits
+
+        self._state_index = None
+        self.alphabet = set(self.symbols)
+        self.states = CompactStates(self)
+        self.final_states = CompactFinalStates(self)
+        self.transitions = CompactTransitions(self)
+
+    @classmethod
+    def from_dfa(cls, dfa):
+        """
+        Convert a DFA to compact storage.
+
+        State and symbol names are interned and sorted, transitions become an
+        array('I') of target indexes and final states a bitmap.
+
+        Args:
+            dfa: A DFA object with a complete transition function
+
+        Returns:
+            CompactDFA object
+
+        Raises:
+            ValueError: If a transition is missing or leads to an unknown state
+        """
+        def intern(name):
+            return sys.intern(name) if type(name) is str else name
+
+        names = [intern(state) for state in sorted(dfa.states)]
+        symbols = [intern(symbol) for symbol in sorted(dfa.alphabet)]
+        state_index = {state: i for i, state in enumerate(names)}
+        transitions = dfa.transitions
+        try:
+            table = array('I', [state_index[transitions[(state, symbol)]]
+                                for state in names for symbol in symbols])
+            start_index = state_index[dfa.start_state]
+            final_bits = bytearray((len(names) + 7) // 8)
+            for state in dfa.final_states:
+                i = state_index[state]
+                final_bits[i >> 3] |= 1 << (i & 7)
+        except KeyError as e:
+            raise ValueError(f"DFA cannot be made compact, unknown or missing entry: {e}")
+
+        compact = cls(names, symbols, table, start_index, bytes(final_bits))
+        compact._state_index = state_index
+        return compact
+
+    @property
+    def state_names(self):
+        """List of state names indexed by state number."""
+        if self._state_names is None:
+            self._state_names = self._load_state_names()
+        return self._state_names
+
+    @property
+    def state_index(self):
+        """Dict mapping state name -> state number."""
+        if self._state_index is None:
+            self._state_index = {state: i for i, state in enumerate(self.state_names)}
+        return self._state_index
+
+    @property
+    def start_state(self):
+        """Name of the start state."""
+        return self.state_names[self.start_index]
+
+    def is_final(self, index):
+        """Return True if the state with the given index is final."""
+        return bool(self.final_bits[index >> 3] & (1 << (index & 7)))
+
+    def run(self, input_string):
+        """
+        Run the DFA on an input string without decoding any state names.
+
+        Args:
+            input_string: String to process
+
+        Returns:
+            Index of the state reached
+
+        Raises:
+            ValueError: If a symbol is not in the alphabet
+        """
+        table = self.table
+        k = self.num_symbols
+        current = self.start_index
+
+        encoder = self._encoder
+        # bytes always need the encoder: iterating them gives ints
+        if encoder is not None and (isinstance(input_string, bytes) or (
+                isinstance(input_string, str) and len(input_string) >= ENCODE_MIN_LENGTH)):
+            codes = encoder.encode(input_string)
+            invalid = encoder.first_invalid(input_string, codes)
+            if invalid is not None:
+                raise ValueError(f"Symbol '{invalid[1]}' not in alphabet")
+            for code in codes:
+                current = table[current * k + code]
+            return current
+
+        symbol_index = self.symbol_index
+        try:
+            for symbol in input_string:
+                current = table[current * k + symbol_index[symbol]]
+        except KeyError as e:
+            raise ValueError(f"Symbol '{e.args[0]}' not in alphabet")
+
+        return current
+
+    def process(self, input_string):
+        """
+        Process an input string and return whether it's accepted.
+
+        Args:
+            input_string: String to process
+
+        Returns:
+            True if the string is accepted, False otherwise
+        """
+        return self.is_final(self.run(input_string))
+
+    def process_with_trace(self, input_string):
+        """
+        Process an input string and return the trace of states visited.
+
+        Args:
+            input_string: String to process
+
+        Returns:
+            Tuple of (accepted, trace) where trace is list of states visited
+        """
+        table = self.table
+        k = self.num_symbols
+        names = self.state_names
+        current = self.start_index
+        trace = [names[current]]
+
+        for symbol in input_string:
+            if symbol not in self.symbol_index:
+                raise ValueError(f"Symbol '{symbol}' not in alphabet")
+            current = table[current * k + self.symbol_index[symbol]]
+            trace.append(names[current])
+
+        return self.is_final(current), trace
+
+    def to_dfa(self):
+        """
+        Convert to a regular dict-backed DFA.
+
+        Returns:
+            DFA object
+        """
+        names = self.state_names
+        transitions = {}
+        for i, state in enumerate(names):
+            row = self.table[i * self.num_symbols:(i + 1) * self.num_symbols]
+            for symbol, target in zip(self.symbols, row):
+                transitions[(state, symbol)] = names[target]
+
+        # The table is complete and every index is a valid state
+        final_states = {state for i, state in enumerate(names) if self.is_final(i)}
+        return DFA.from_trusted(set(names), set(self.symbols), transitions,
+                                self.start_state, final_states)
+
+    def __str__(self):
+        """String representation of the DFA."""
+        return (f"CompactDFA(\n"
+                f"  States: {self.num_states}\n"
+                f"  Alphabet: {self.alphabet}\n"
+                f"  Start: {self.start_state}\n"
+                f"  Transitions: {self.num_states * self.num_symbols} rules\n"
+                f")")
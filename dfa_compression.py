@@ -0,0 +1,145 @@
+"""
+Transparent compression for DFA files
+
+Exported DFA JSON is highly repetitive and compresses very well. The
+helpers here let the import and export functions read and write compressed
+files as streams, with no decompress-to-temp step:
+
+- Reading detects the format from the file's magic bytes, so a compressed
+  file needs no special name.
+- Writing picks the format from the file extension (.gz, .bz2, .xz, .zst)
+  or an explicit compression argument.
+
+gzip, bz2 and xz come from the standard library. zstd uses compression.zstd
+(Python 3.14+) or the 'zstandard' package when one is installed.
+"""
+import bz2
+import gzip
+import io
+import lzma
+import os
+
+try:
+    from compression import zstd
+except ImportError:
+    try:
+        import zstandard as zstd
+    except ImportError:
+        zstd = None
+
+
+# (magic bytes, format) pairs checked against the start of a file
+MAGIC_NUMBERS = (
+    (b'\x1f\x8b', 'gzip'),
+    (b'BZh', 'bz2'),
+    (b'\xfd7zXZ\x00', 'xz'),
+    (b'\x28\xb5\x2f\xfd', 'zstd'),
+)
+
+# File extension -> format used when writing
+EXTENSIONS = {
+    '.gz': 'gzip',
+    '.bz2': 'bz2',
+    '.xz': 'xz',
+    '.zst': 'zstd',
+}
+
+# Exceptions raised while reading a corrupt or truncated compressed stream
+DECOMPRESSION_ERRORS = (OSError, EOFError, lzma.LZMAError)
+if zstd is not None:
+    DECOMPRESSION_ERRORS += (zstd.ZstdError,)
+
+_OPENERS = {
+    'gzip': gzip.open,
+    'bz2': bz2.open,
+    'xz': lzma.open,
+}
+
+
+def _zstd():
+    """Return the zstd module or raise ValueError if none is available."""
+    if zstd is None:
+        raise ValueError("zstd compression requires Python 3.14+ or the 'zstandard' package")
+    return zstd
+
+
+def detect_compression(header):
+    """
+    Identify the compression format from the first bytes of a file.
+
+    Args:
+        header: At least the first 6 bytes of the file
+
+    Returns:
+        'gzip', 'bz2', 'xz', 'zstd', or None for uncompressed data
+    """
+    for magic, name in MAGIC_NUMBERS:
+        if header[:len(magic)] == magic:
+            return name
+    return None
+
+
+def compression_for_filename(filename):
+    """
+    Pick a compression format from a file name's extension.
+
+    Returns:
+        Format name, or None if the extension is not a compression extension
+    """
+    return EXTENSIONS.get(os.path.splitext(filename)[1].lower())
+
+
+def strip_compression_extension(filename):
+    """Remove a trailing compression extension, e.g. 'a.json.gz' -> 'a.json'."""
+    root, ext = os.path.splitext(filename)
+    return root if ext.lower() in EXTENSIONS else filename
+
+
+def open_dfa_file(filename, mode='rb', compression=None, encoding=None):
+    """
+    Open a DFA file, decompressing or compressing on the fly.
+
+    Args:
+        filename: Path to the file
+        mode: 'rb', 'r' (text), 'wb' or 'w' (text)
+        compression: Format to use. When reading, None detects it from the
+            magic bytes; when writing, None picks it from the extension.
+            'none' forces an uncompressed file.
+        encoding: Text encoding for text modes
+
+    Returns:
+        File object (text or binary according to mode)
+
+    Raises:
+        IOError: If the file cannot be opened
+        ValueError: If the compression format is unknown or unavailable
+    """
+    writing = 'w' in mode
+    if compression is None:
+        if writing:
+            compression = compression_for_filename(filename)
+        else:
+            with open(filename, 'rb') as f:
+                compression = detect_compression(f.read(6))
+    if compression == 'none':
+        compression = None
+
+    text = 'b' not in mode
+    binary_mode = mode.replace('t', '').replace('b', '') + 'b'
+
+    if compression is None:
+        return open(filename, mode, encoding=encoding if text else None)
+
+    if compression == 'zstd':
+        stream = _zstd().open(filename, binary_mode)
+    elif compression in _OPENERS:
+        stream = _OPENERS[compression](filename, binary_mode)
+    else:
+        raise ValueError(
+            f"Unknown compression '{compression}'. "
+            f"Available: {', '.join(sorted(EXTENSIONS.values()))}"
+        )
+
+    if text:
+        return io.TextIOWrapper(stream, encoding=encoding)
+    return stream
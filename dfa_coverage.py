@@ -0,0 +1,230 @@
+"""
+Transition coverage of DFAs by test corpora
+
+TransitionCoverage counts how often each transition δ(state, symbol) is
+taken while running a corpus of inputs, in a NumPy array with one cell per
+(state, symbol) pair. Inputs can be added one at a time, as a stream of
+chunks, or as a whole corpus run in lockstep with dfa_batch.run_batch().
+
+The result lists the transitions the corpus never takes and the states it
+never enters, and edge_counts() feeds DFACanvas.show_coverage() to draw the
+transition diagram as a heat map.
+
+Inputs with a symbol outside the alphabet are not errors here: test corpora
+often contain such negative cases. The transitions before the bad symbol
+are counted and the input is counted in invalid_inputs.
+"""
+import numpy as np
+
+from dfa_analysis import analyze_structure
+from dfa_batch import BATCH_SIZE, run_batch
+from dfa_encoding import INVALID, integer_tables, symbol_encoder
+from dfa_index import index_dfa
+
+
+class TransitionCoverage:
+    """
+    Hit counts per transition of a DFA, accumulated over a corpus.
+
+    Attributes:
+        states: State names, indexing the rows of counts
+        symbols: Symbols in sorted order, indexing the columns of counts
+        counts: NumPy int64 array, counts[i, j] is the number of times
+            δ(states[i], symbols[j]) was taken
+        inputs: Number of inputs run
+        invalid_inputs: Inputs that stopped at a symbol outside the alphabet
+        symbols_processed: Number of transitions taken
+    """
+
+    def __init__(self, dfa):
+        """
+        Start with all counts at zero.
+
+        Args:
+            dfa: A DFA object with a complete transition function
+        """
+        self.dfa = dfa
+        self._index = index_dfa(dfa)
+        self.states = self._index.states
+        self.symbols = self._index.symbols
+        self.counts = np.zeros((self._index.num_states, self._index.num_symbols), dtype=np.int64)
+        self.inputs = 0
+        self.invalid_inputs = 0
+        self.symbols_processed = 0
+        self._encoder = symbol_encoder(dfa)
+        self._symbol_index = {symbol: j for j, symbol in enumerate(self.symbols)}
+
+    def _encode(self, input_string):
+        """Return the symbol ids of the valid prefix and whether it is the whole input."""
+        if self._encoder is not None and isinstance(input_string, (str, bytes, bytearray)):
+            codes = self._encoder.encode(input_string)
+            position = codes.find(INVALID)
+            if position >= 0:
+                return codes[:position], False
+            return codes, True
+
+        codes = []
+        for symbol in input_string:
+            j = self._symbol_index.get(symbol)
+            if j is None:
+                return codes, False
+            codes.append(j)
+        return codes, True
+
+    def _count(self, taken, valid):
+        """Add the flat indexes of the transitions of one input."""
+        np.add.at(self.counts.reshape(-1), taken, 1)
+        self.symbols_processed += len(taken)
+        if not valid:
+            self.invalid_inputs += 1
+
+    def add(self, input_string):
+        """
+        Run one input and count its transitions.
+
+        Args:
+            input_string: str, bytes, or sequence of symbols
+        """
+        self.add_stream([input_string])
+
+    def add_stream(self, chunks):
+        """
+        Run one input given as a sequence of chunks and count its transitions.
+
+        Args:
+            chunks: Iterable of chunks (str, bytes or sequences of symbols)
+        """
+        rows, _, state = integer_tables(self.dfa)
+        k = self._index.num_symbols
+        taken = []
+        valid = True
+        for chunk in chunks:
+            codes, valid = self._encode(chunk)
+            for code in codes:
+                taken.append(state * k + code)
+                state = rows[state][code]
+            if not valid:
+                break
+        self.inputs += 1
+        self._count(np.array(taken, dtype=np.intp), valid)
+
+    def add_corpus(self, inputs, batch_size=BATCH_SIZE):
+        """
+        Run many inputs, advancing them together, and count their transitions.
+
+        Args:
+            inputs: Iterable of inputs
+            batch_size: Number of inputs advanced together
+        """
+        if self._encoder is None:
+            for input_string in inputs:
+                self.add(input_string)
+            return
+
+        encoded = []
+        for input_string in inputs:
+            codes, valid = self._encode(input_string)
+            if not valid:
+                self.invalid_inputs += 1
+            encoded.append(bytes(codes))
+        flat = self.counts.reshape(-1)
+
+        def on_step(taken):
+            np.add.at(flat, taken, 1)
+
+        run_batch(self.dfa, encoded, batch_size, on_step=on_step)
+        self.inputs += len(encoded)
+        self.symbols_processed += sum(map(len, encoded))
+
+    @property
+    def transitions_hit(self):
+        """Number of transitions taken at least once."""
+        return int(np.count_nonzero(self.counts))
+
+    @property
+    def coverage(self):
+        """Fraction of all transitions taken at least once."""
+        return self.transitions_hit / self.counts.size if self.counts.size else 1.0
+
+    @property
+    def state_visits(self):
+        """NumPy array of the number of times each state was entered (or started in)."""
+        visits = np.bincount(self._index.delta.reshape(-1), weights=self.counts.reshape(-1),
+                             minlength=self._index.num_states).astype(np.int64)
+        visits[self._index.start] += self.inputs
+        return visits
+
+    @property
+    def unvisited_transitions(self):
+        """(state, symbol) pairs the corpus never takes, in state then symbol order."""
+        return [(self.states[i], self.symbols[j]) for i, j in zip(*np.nonzero(self.counts == 0))]
+
+    @property
+    def unreached_states(self):
+        """States the corpus never enters."""
+        return {self.states[i] for i in np.flatnonzero(self.state_visits == 0)}
+
+    def hits(self, state, symbol):
+        """
+        Return the number of times δ(state, symbol) was taken.
+
+        Raises:
+            KeyError: If the state or symbol is unknown
+        """
+        return int(self.counts[self._index.state_index[state], self._symbol_index[symbol]])
+
+    def edge_counts(self):
+        """
+        Return hit counts per diagram edge, summed over the symbols of the edge.
+
+        Returns:
+            Dict mapping (state, next_state) -> hits, for every edge of the
+            transition diagram (as drawn by build_dfa_graph)
+        """
+        edges = {}
+        states = self.states
+        for (i, j), target in np.ndenumerate(self._index.delta):
+            key = (states[i], states[target])
+            edges[key] = edges.get(key, 0) + int(self.counts[i, j])
+        return edges
+
+    def summary(self):
+        """
+        Describe the coverage in a few lines.
+
+        Returns:
+            Multi-line string
+        """
+        reachable = analyze_structure(self.dfa).reachable_mask
+        unvisited = self.counts == 0
+        structural = int(np.count_nonzero(unvisited[~np.array(reachable, dtype=bool)]))
+        return '\n'.join([
+            f"Inputs: {self.inputs} ({self.invalid_inputs} with invalid symbols), "
+            f"{self.symbols_processed} symbols",
+            f"Transitions: {self.transitions_hit}/{self.counts.size} taken "
+            f"({self.coverage:.1%})",
+            f"Unvisited transitions: {int(np.count_nonzero(unvisited))}, "
+            f"{structural} of them from states no input can reach",
+            f"Unreached states: {len(self.unreached_states)}",
+        ])
+
+    def __repr__(self):
+        return (f"TransitionCoverage({self.transitions_hit}/{self.counts.size} transitions, "
+                f"{self.inputs} inputs)")
+
+
+def measure_coverage(dfa, corpus, batch_size=BATCH_SIZE):
+    """
+    Run a corpus on a DFA and return its transition coverage.
+
+    Args:
+        dfa: A DFA object
+        corpus: Iterable of inputs
+        batch_size: Number of inputs advanced together
+
+    Returns:
+        TransitionCoverage object
+    """
+    coverage = TransitionCoverage(dfa)
+    coverage.add_corpus(corpus, batch_size)
+    return coverage
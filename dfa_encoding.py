@@ -0,0 +1,218 @@
+"""
+Symbol encoding for table-driven simulation
+
+Table-driven engines index transitions by symbol number, and mapping each
+character to its number in a Python loop costs more than the transition
+itself. SymbolEncoder maps a whole input string to a bytes buffer of symbol
+ids in one C-level pass (bytes.translate for ASCII input, str.translate
+otherwise). Characters outside the alphabet become INVALID, so a single
+bytes.find() both validates the input and gives the first bad position.
+
+This works for alphabets of at most MAX_SYMBOLS single-character symbols.
+make_encoder() and symbol_encoder() return None for other alphabets, and
+callers fall back to their per-symbol loops.
+
+The encoder is shared by the 'translate' engine of DFA.process(),
+CompactDFA and MappedDFA simulation, FrozenDFA, is_accepted() and the
+batch and streaming engines in dfa_batch.py.
+"""
+import weakref
+
+from dfa_index import dfa_cache, index_dfa
+
+
+# Id given to characters outside the alphabet
+INVALID = 0xFF
+
+# Largest alphabet that can be encoded (ids 0..254)
+MAX_SYMBOLS = 255
+
+# Shortest input the per-string simulators encode before running; for
+# shorter inputs the encoding calls cost more than per-symbol lookups
+ENCODE_MIN_LENGTH = 16
+
+# dfa -> (alphabet, alphabet size, encoder or None)
+_encoders = weakref.WeakKeyDictionary()
+
+
+class _InvalidMap(dict):
+    """str.translate table mapping unknown characters to INVALID."""
+
+    def __missing__(self, key):
+        return '\xff'
+
+
+class SymbolEncoder:
+    """
+    Encodes input strings as bytes of symbol ids.
+
+    Symbol ids are positions in `symbols`. Use make_encoder() to get None
+    instead of ValueError for alphabets that cannot be encoded.
+    """
+
+    __slots__ = ('symbols', '_str_table', '_byte_table')
+
+    def __init__(self, symbols):
+        """
+        Build the translation tables.
+
+        Args:
+            symbols: Sequence of single-character symbols, indexed by id
+
+        Raises:
+            ValueError: If a symbol is not a single character or there are
+                more than MAX_SYMBOLS symbols
+        """
+        self.symbols = tuple(symbols)
+        if len(self.symbols) > MAX_SYMBOLS:
+            raise ValueError(f"Cannot encode more than {MAX_SYMBOLS} symbols")
+        for symbol in self.symbols:
+            if not isinstance(symbol, str) or len(symbol) != 1:
+                raise ValueError(f"Cannot encode symbol {symbol!r}, symbols must be single characters")
+
+        self._str_table = _InvalidMap((ord(symbol), chr(i)) for i, symbol in enumerate(self.symbols))
+        if all(ord(symbol) < 128 for symbol in self.symbols):
+            table = bytearray([INVALID]) * 256
+            for i, symbol in enumerate(self.symbols):
+                table[ord(symbol)] = i
+            self._byte_table = bytes(table)
+        else:
+            self._byte_table = None
+
+    def encode(self, input_string):
+        """
+        Encode an input string.
+
+        Args:
+            input_string: str, or bytes-like object read as Latin-1
+
+        Returns:
+            bytes with one symbol id (or INVALID) per character
+        """
+        if isinstance(input_string, str):
+            if self._byte_table is not None and input_string.isascii():
+                return input_string.encode('ascii').translate(self._byte_table)
+            return input_string.translate(self._str_table).encode('latin-1')
+        if self._byte_table is not None:
+            return bytes(input_string).translate(self._byte_table)
+        return bytes(input_string).decode('latin-1').translate(self._str_table).encode('latin-1')
+
+    @staticmethod
+    def first_invalid(input_string, encoded):
+        """
+        Find the first character outside the alphabet.
+
+        Args:
+            input_string: The string that was encoded
+            encoded: Result of encode(input_string)
+
+        Returns:
+            Tuple of (position, character), or None if all are valid
+        """
+        position = encoded.find(INVALID)
+        if position < 0:
+            return None
+        symbol = input_string[position:position + 1]
+        if not isinstance(symbol, str):
+            symbol = bytes(symbol).decode('latin-1')
+        return position, symbol
+
+
+def make_encoder(symbols):
+    """
+    Return a SymbolEncoder for the symbols, or None if they cannot be encoded.
+
+    Args:
+        symbols: Sequence of symbols, indexed by id
+
+    Returns:
+        SymbolEncoder or None
+    """
+    if len(symbols) > MAX_SYMBOLS:
+        return None
+    if not all(isinstance(symbol, str) and len(symbol) == 1 for symbol in symbols):
+        return None
+    return SymbolEncoder(symbols)
+
+
+def symbol_encoder(dfa):
+    """
+    Return the cached encoder for a DFA's alphabet in sorted symbol order.
+
+    The ids then match the columns of index_dfa(dfa).delta. The encoder is
+    rebuilt if the alphabet is replaced or changes size.
+
+    Args:
+        dfa: A DFA object
+
+    Returns:
+        SymbolEncoder, or None if the alphabet cannot be encoded
+    """
+    alphabet = dfa.alphabet
+    entry = _encoders.get(dfa)
+    if entry is None or entry[0] is not alphabet or entry[1] != len(alphabet):
+        entry = (alphabet, len(alphabet), make_encoder(sorted(alphabet)))
+        _encoders[dfa] = entry
+    return entry[2]
+
+
+def integer_tables(dfa):
+    """
+    Return the transition table as tuples for per-symbol Python loops.
+
+    Args:
+        dfa: A DFA object
+
+    Returns:
+        Tuple of (rows, final, start): rows[i][j] is the target of state i on
+        symbol id j (sorted symbol order), final[i] is True for final states
+    """
+    cache = dfa_cache(dfa)
+    tables = cache.get('integer_tables')
+    if tables is None:
+        index = index_dfa(dfa)
+        tables = (tuple(map(tuple, index.delta.tolist())), tuple(index.final.tolist()), index.start)
+        cache['integer_tables'] = tables
+    return tables
+
+
+def translate_engine(dfa):
+    """
+    Return the 'translate' simulation function for a DFA.
+
+    The function encodes its input with symbol_encoder(dfa) and then follows
+    integer transitions, one tuple lookup per symbol. It is cached per DFA.
+
+    Args:
+        dfa: A DFA object
+
+    Returns:
+        Function input_string -> bool
+
+    Raises:
+        ValueError: If the alphabet cannot be encoded
+    """
+    cache = dfa_cache(dfa)
+    run = cache.get('translate')
+    if run is not None:
+        return run
+
+    encoder = symbol_encoder(dfa)
+    if encoder is None:
+        raise ValueError(
+            f"The 'translate' engine needs at most {MAX_SYMBOLS} single-character symbols"
+        )
+    rows, final, start = integer_tables(dfa)
+
+    def run(input_string):
+        codes = encoder.encode(input_string)
+        invalid = encoder.first_invalid(input_string, codes)
+        if invalid is not None:
+            raise ValueError(f"Symbol '{invalid[1]}' not in alphabet")
+        state = start
+        for code in codes:
+            state = rows[state][code]
+        return final[state]
+
+    cache['translate'] = run
+    return run
@@ -0,0 +1,147 @@
+"""
+Immutable DFAs
+
+FrozenDFA is a read-only DFA that can be shared between threads without
+locks and used as a dict key, e.g. for caches of layouts, compiled tables
+or minimization results.
+
+A FrozenDFA is a CompactDFA that keeps the canonical binary encoding of its
+DFA (see dfa_binary.py: sorted state and symbol names, dense uint32
+transition table, final-state bitmap) and reads its tables directly from
+those bytes; the simulation methods are CompactDFA's.
+Equal DFAs therefore have equal encodings, and the hash is computed once
+from a BLAKE2 digest of the encoding. Unlike hash(), the digest (available
+as `fingerprint`) is stable across processes.
+"""
+import hashlib
+from types import MappingProxyType
+
+from dfa import DFA
+from dfa_binary import decode_dfa_tables, encode_dfa
+from dfa_compact import CompactDFA, CompactTransitions
+from dfa_encoding import make_encoder
+
+
+class FrozenDFA(CompactDFA):
+    """
+    Immutable, hashable DFA backed by its canonical binary encoding.
+
+    Has the same attributes and simulation methods as DFA. states, alphabet
+    and final_states are frozensets, transitions is a read-only mapping and
+    assigning any attribute raises AttributeError.
+    """
+
+    __slots__ = ('fingerprint', '_data', '_hash')
+
+    def __init__(self, states, alphabet, transitions, start_state, final_states):
+        """
+        Build a frozen DFA from its five components.
+
+        Args:
+            states: Set of state names (Q)
+            alphabet: Set of input symbols (Σ)
+            transitions: Mapping (state, symbol) -> next_state (δ)
+            start_state: Initial state (q0)
+            final_states: Set of accepting states (F)
+
+        Raises:
+            ValueError: If the DFA is malformed or incomplete
+        """
+        dfa = DFA.from_trusted(set(states), set(alphabet), transitions, start_state,
+                               set(final_states))
+        dfa.validate(check_transitions=True)
+        self._load(encode_dfa(dfa))
+
+    @classmethod
+    def from_dfa(cls, dfa):
+        """
+        Freeze a DFA (or CompactDFA, MappedDFA, FrozenDFA).
+
+        Args:
+            dfa: DFA to copy
+
+        Returns:
+            FrozenDFA object
+
+        Raises:
+            ValueError: If the DFA is malformed or incomplete
+        """
+        if isinstance(dfa, cls):
+            return dfa
+        return cls(dfa.states, dfa.alphabet, dfa.transitions, dfa.start_state,
+                   dfa.final_states)
+
+    @classmethod
+    def _from_bytes(cls, data):
+        """Rebuild a FrozenDFA from its canonical encoding (used by pickle)."""
+        frozen = cls.__new__(cls)
+        frozen._load(data)
+        return frozen
+
+    def _load(self, data):
+        """Fill the slots from a canonical encoding."""
+        names, symbols, start_index, table, final_bits = decode_dfa_tables(data)
+        digest = hashlib.blake2b(data, digest_size=16).digest()
+        fields = {
+            '_data': data,
+            '_load_state_names': None,
+            '_state_names': tuple(names),
+            'symbols': tuple(symbols),
+            '_state_index': MappingProxyType({state: i for i, state in enumerate(names)}),
+            'symbol_index': MappingProxyType({symbol: j for j, symbol in enumerate(symbols)}),
+            '_encoder': make_encoder(symbols),
+            'table': table,
+            'start_index': start_index,
+            'final_bits': bytes(final_bits),
+            'num_states': len(names),
+            'num_symbols': len(symbols),
+            'states': frozenset(names),
+            'alphabet': frozenset(symbols),
+            'fingerprint': digest.hex(),
+            '_hash': int.from_bytes(digest[:8], 'little', signed=True),
+        }
+        fields['final_states'] = frozenset(
+            names[i] for i in range(len(names)) if fields['final_bits'][i >> 3] & (1 << (i & 7)))
+        for name, value in fields.items():
+            object.__setattr__(self, name, value)
+        object.__setattr__(self, 'transitions', CompactTransitions(self))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("FrozenDFA is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("FrozenDFA is immutable")
+
+    def __reduce__(self):
+        return (FrozenDFA._from_bytes, (self._data,))
+
+    def __hash__(self):
+        return self._hash
+
+    def __eq__(self, other):
+        if not isinstance(other, FrozenDFA):
+            return NotImplemented
+        return self._hash == other._hash and self._data == other._data
+
+    def to_bytes(self):
+        """
+        Return the canonical binary encoding (the dfa_binary format).
+
+        Returns:
+            bytes
+        """
+        return self._data
+
+    def __repr__(self):
+        return (f"FrozenDFA({self.num_states} states, {self.num_symbols} symbols, "
+                f"fingerprint={self.fingerprint[:12]})")
+
+    def __str__(self):
+        """String representation of the DFA."""
+        return (f"FrozenDFA(\n"
+                f"  States: {set(self.states)}\n"
+                f"  Alphabet: {set(self.alphabet)}\n"
+                f"  Start: {self.start_state}\n"
+                f"  Final: {set(self.final_states)}\n"
+                f"  Transitions: {len(self.transitions)} rules\n"
+                f")")
@@ -0,0 +1,298 @@
+"""
+Import cache for repeatedly loaded DFA files
+
+Services that load the same DFA files over and over can go through a
+DFAImportCache instead of import_dfa_from_json(). The first load of a file
+parses and validates it; later loads of the unchanged file return the same
+shared DFA object from an LRU cache, so they cost a stat() and a dict lookup.
+
+Cached DFAs are frozen SharedDFA objects: states, alphabet and final states
+are frozensets, transitions is a read-only mapping and attributes cannot be
+assigned, so one caller cannot change the DFA (or enable caches on it) for
+another. to_dfa() returns a private, mutable copy.
+
+Files are identified either by path plus modification time and size
+(key='stat', the default, no read needed on a hit) or by a SHA-256 hash of
+their contents (key='content', which also shares one DFA between identical
+files at different paths). JSON and binary (dfa_binary) files are both
+supported.
+"""
+import hashlib
+import io
+import os
+import sys
+import threading
+from collections import OrderedDict
+from types import MappingProxyType
+
+from dfa import DFA
+from dfa_binary import MAGIC, decode_dfa
+from dfa_compression import DECOMPRESSION_ERRORS, open_dfa_file
+from dfa_stream import read_dfa_json_stream
+
+
+# Default memory budget for cached DFAs
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# Bytes read at a time when hashing a file
+_HASH_CHUNK_SIZE = 1 << 16
+
+_SHARED_ERROR = "Cached DFAs are shared and cannot be modified; use to_dfa() for a copy"
+
+
+class SharedDFA(DFA):
+    """
+    Read-only DFA shared between the callers of a DFAImportCache.
+
+    Assigning or deleting attributes raises TypeError, and so do
+    enable_prefix_cache() and enable_result_cache(), whose caches would
+    change the DFA for every caller.
+    """
+
+    def __setattr__(self, name, value):
+        if getattr(self, '_sealed', False):
+            raise TypeError(_SHARED_ERROR)
+        super().__setattr__(name, value)
+
+    def __delattr__(self, name):
+        raise TypeError(_SHARED_ERROR)
+
+    def enable_prefix_cache(self, *args, **kwargs):
+        raise TypeError(_SHARED_ERROR)
+
+    def enable_result_cache(self, *args, **kwargs):
+        raise TypeError(_SHARED_ERROR)
+
+    def to_dfa(self):
+        """
+        Return a regular, mutable copy of the DFA.
+
+        Returns:
+            DFA object
+        """
+        return DFA.from_trusted(set(self.states), set(self.alphabet), dict(self.transitions),
+                                self.start_state, set(self.final_states))
+
+
+def freeze_dfa(dfa):
+    """
+    Return an immutable DFA sharing the given DFA's transition data.
+
+    The transitions dict is wrapped, not copied, so the original DFA must
+    not be modified afterwards.
+
+    Args:
+        dfa: A DFA object
+
+    Returns:
+        SharedDFA with frozenset states/alphabet/final states and read-only
+        transitions
+    """
+    shared = SharedDFA.from_trusted(frozenset(dfa.states), frozenset(dfa.alphabet),
+                                    MappingProxyType(dfa.transitions), dfa.start_state,
+                                    frozenset(dfa.final_states))
+    object.__setattr__(shared, '_sealed', True)
+    return shared
+
+
+def estimate_dfa_size(dfa):
+    """
+    Estimate the memory used by a DFA in bytes.
+
+    Counts the containers, the (state, symbol) key tuples and each distinct
+    name string once.
+
+    Args:
+        dfa: A DFA object with a dict of transitions (not yet frozen)
+
+    Returns:
+        Approximate size in bytes
+    """
+    transitions = dfa.transitions
+    size = sys.getsizeof(dfa.states) + sys.getsizeof(dfa.alphabet)
+    size += sys.getsizeof(dfa.final_states) + sys.getsizeof(transitions)
+    if transitions:
+        size += len(transitions) * sys.getsizeof(next(iter(transitions)))
+
+    names = {id(name): name for name in dfa.states}
+    names.update((id(name), name) for name in dfa.alphabet)
+    size += sum(sys.getsizeof(name) for name in names.values())
+    return size
+
+
+def parse_dfa_file(filename):
+    """
+    Parse a JSON or binary DFA file, compressed or not.
+
+    Compressed files are decompressed as they are read and JSON is parsed
+    in chunks (see dfa_stream.py), so the file contents are never held in
+    memory as a whole; only binary files are, as a single buffer to decode.
+
+    Args:
+        filename: Path to the file
+
+    Returns:
+        DFA object
+
+    Raises:
+        IOError: If the file cannot be read or decompressed
+        ValueError: If the file is not a valid DFA
+        json.JSONDecodeError: If a JSON file contains invalid JSON
+    """
+    try:
+        with open_dfa_file(filename, 'rb') as f:
+            if f.read(len(MAGIC)) == MAGIC:
+                data = MAGIC + f.read()
+            else:
+                f.seek(0)
+                with io.TextIOWrapper(f, encoding='utf-8') as text:
+                    return read_dfa_json_stream(text, filename).to_dfa()
+    except UnicodeDecodeError as e:
+        raise ValueError(f"File '{filename}' is not UTF-8 JSON: {e}")
+    except DECOMPRESSION_ERRORS as e:
+        raise IOError(f"Failed to read file '{filename}': {e}")
+
+    try:
+        return decode_dfa(data)
+    except ValueError as e:
+        raise ValueError(f"Invalid binary DFA file '{filename}': {e}")
+
+
+class DFAImportCache:
+    """
+    LRU cache of frozen DFAs loaded from files, bounded by total memory.
+
+    Thread-safe: concurrent loads of the same file may both parse it, but
+    only one result is kept.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES, key='stat'):
+        """
+        Initialize the cache.
+
+        Args:
+            max_bytes: Evict least recently used DFAs beyond this estimated size
+            key: 'stat' to key on path, mtime and size, or 'content' to key
+                on a hash of the file contents
+
+        Raises:
+            ValueError: If key is not 'stat' or 'content'
+        """
+        if key not in ('stat', 'content'):
+            raise ValueError(f"Unknown cache key '{key}'. Expected 'stat' or 'content'")
+
+        self.max_bytes = max_bytes
+        self.key = key
+        self.hits = 0
+        self.misses = 0
+        self.current_bytes = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _stat_key(self, filename):
+        """Cache key from the file's identity and modification time."""
+        st = os.stat(filename)
+        return (os.path.realpath(filename), st.st_mtime_ns, st.st_size)
+
+    def _lookup(self, key):
+        """Return the cached DFA for key, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def _store(self, key, dfa, size):
+        """Add a DFA to the cache and evict down to the memory budget."""
+        with self._lock:
+            if key in self._entries:
+                return self._entries[key][0]
+            if size > self.max_bytes:
+                return dfa
+            if isinstance(key, tuple):
+                # A new version of a file replaces the stale one
+                self._drop_path(key[0])
+            self._entries[key] = (dfa, size)
+            self.current_bytes += size
+            while self.current_bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.current_bytes -= evicted_size
+        return dfa
+
+    def load(self, filename):
+        """
+        Load a DFA file, returning the cached DFA if the file is unchanged.
+
+        Args:
+            filename: Path to a JSON or binary DFA file
+
+        Returns:
+            Frozen DFA object, shared between callers
+
+        Raises:
+            IOError: If the file cannot be read
+            ValueError: If the file is not a valid DFA
+            json.JSONDecodeError: If a JSON file contains invalid JSON
+        """
+        try:
+            if self.key == 'stat':
+                key = self._stat_key(filename)
+            else:
+                digest = hashlib.sha256()
+                with open(filename, 'rb') as f:
+                    for block in iter(lambda: f.read(_HASH_CHUNK_SIZE), b''):
+                        digest.update(block)
+                key = digest.hexdigest()
+        except IOError as e:
+            raise IOError(f"Failed to read file '{filename}': {e}")
+
+        dfa = self._lookup(key)
+        if dfa is not None:
+            return dfa
+
+        dfa = parse_dfa_file(filename)
+        size = estimate_dfa_size(dfa)
+        return self._store(key, freeze_dfa(dfa), size)
+
+    def invalidate(self, filename=None):
+        """
+        Drop cached DFAs.
+
+        Args:
+            filename: Only drop entries for this path (stat keys only);
+                None drops everything
+        """
+        with self._lock:
+            if filename is None:
+                self._entries.clear()
+                self.current_bytes = 0
+                return
+            self._drop_path(os.path.realpath(filename))
+
+    def _drop_path(self, path):
+        """Drop stat-keyed entries for a path (lock must be held)."""
+        for key in [k for k in self._entries if isinstance(k, tuple) and k[0] == path]:
+            _, size = self._entries.pop(key)
+            self.current_bytes -= size
+
+
+_default_cache = DFAImportCache()
+
+
+def load_dfa_cached(filename):
+    """
+    Load a DFA file through the shared default cache.
+
+    Args:
+        filename: Path to a JSON or binary DFA file
+
+    Returns:
+        Frozen DFA object, shared between callers
+    """
+    return _default_cache.load(filename)
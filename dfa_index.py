@@ -0,0 +1,134 @@
+"""
+Integer-indexed view of a DFA for language and structure algorithms
+
+Algorithms such as counting, sampling and graph analyses work on states
+and symbols numbered 0..n-1 and a NumPy transition matrix rather than the
+dict keyed by (state, symbol) names. index_dfa() builds that view once per
+DFA object and caches it, together with a per-DFA dict where other modules
+keep derived results (path-count tables, analysis reports, ...).
+
+Caches are keyed by the DFA object and checked against the sizes of its
+states, alphabet, transitions and final states, and against the versions
+of its transitions and final states when they are tracked (a DFA with a
+result cache enabled, see dfa_result_cache). Looking a DFA up never
+changes it. A DFA without tracked containers that is modified in place
+without changing any of those sizes must be passed to clear_dfa_cache()
+afterwards.
+"""
+import weakref
+
+import numpy as np
+
+
+class IndexedDFA:
+    """
+    A DFA with states and symbols numbered from 0.
+
+    Attributes:
+        states: List of state names; states[i] is state number i
+        symbols: Sorted list of symbols; symbols[j] is symbol number j
+        state_index: Dict mapping state name -> number
+        delta: int64 array of shape (|Q|, |Σ|), delta[i, j] = δ(i, j)
+        start: Number of the start state
+        final: bool array of length |Q|, True for final states
+    """
+
+    __slots__ = ('states', 'symbols', 'state_index', 'delta', 'start', 'final')
+
+    def __init__(self, states, symbols, delta, start, final):
+        self.states = states
+        self.symbols = symbols
+        self.state_index = {state: i for i, state in enumerate(states)}
+        self.delta = delta
+        self.start = start
+        self.final = final
+
+    @property
+    def num_states(self):
+        return len(self.states)
+
+    @property
+    def num_symbols(self):
+        return len(self.symbols)
+
+
+# dfa -> (signature, IndexedDFA, results dict)
+_cache = weakref.WeakKeyDictionary()
+
+
+def _signature(dfa):
+    """Cheap fingerprint used to notice most in-place modifications."""
+    return (len(dfa.states), len(dfa.alphabet), len(dfa.transitions),
+            dfa.start_state, len(dfa.final_states),
+            getattr(dfa.transitions, 'version', None), getattr(dfa.final_states, 'version', None))
+
+
+def _build_index(dfa):
+    """Build the IndexedDFA for a DFA or CompactDFA."""
+    if hasattr(dfa, 'table'):
+        # CompactDFA: reuse its table, reordering columns into sorted symbols
+        states = list(dfa.state_names)
+        symbols = sorted(dfa.symbols)
+        order = [dfa.symbol_index[symbol] for symbol in symbols]
+        table = np.asarray(dfa.table, dtype=np.int64).reshape(len(states), dfa.num_symbols)
+        delta = table[:, order] if order != list(range(len(order))) else table
+        final = np.array([dfa.is_final(i) for i in range(len(states))], dtype=bool)
+        return IndexedDFA(states, symbols, delta, dfa.start_index, final)
+
+    states = sorted(dfa.states)
+    symbols = sorted(dfa.alphabet)
+    state_index = {state: i for i, state in enumerate(states)}
+    transitions = dfa.transitions
+    try:
+        delta = np.array([[state_index[transitions[(state, symbol)]] for symbol in symbols]
+                          for state in states], dtype=np.int64).reshape(len(states), len(symbols))
+    except KeyError as e:
+        raise ValueError(f"DFA transition function is incomplete or invalid: {e}")
+    final = np.zeros(len(states), dtype=bool)
+    final[[state_index[state] for state in dfa.final_states]] = True
+    return IndexedDFA(states, symbols, delta, state_index[dfa.start_state], final)
+
+
+def _entry(dfa):
+    signature = _signature(dfa)
+    entry = _cache.get(dfa)
+    if entry is None or entry[0] != signature:
+        entry = (signature, _build_index(dfa), {})
+        _cache[dfa] = entry
+    return entry
+
+
+def index_dfa(dfa):
+    """
+    Return the cached integer-indexed view of a DFA.
+
+    Args:
+        dfa: A DFA (or CompactDFA)
+
+    Returns:
+        IndexedDFA object
+
+    Raises:
+        ValueError: If the transition function is incomplete
+    """
+    return _entry(dfa)[1]
+
+
+def dfa_cache(dfa):
+    """
+    Return the dict of cached derived results for a DFA.
+
+    The dict is emptied whenever the DFA's index is rebuilt.
+
+    Args:
+        dfa: A DFA (or CompactDFA)
+
+    Returns:
+        Dict for results keyed by the calling module's own keys
+    """
+    return _entry(dfa)[2]
+
+
+def clear_dfa_cache(dfa):
+    """Drop the cached index and results for a DFA modified in place."""
+    _cache.pop(dfa, None)
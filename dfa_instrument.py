@@ -0,0 +1,310 @@
+"""
+Instrumentation of DFA simulation
+
+enable_instrumentation() swaps the simulation functions behind
+is_accepted(), DFA.process() (every engine), DFA.process_with_trace() and
+trace_execution() for wrappers that record:
+
+- a latency histogram per operation
+- the number of calls and symbols processed per operation
+- visit counts per state and hit counts per (state, symbol) transition
+
+disable_instrumentation() puts the original functions back, so nothing
+is measured and nothing costs extra while instrumentation is off.
+
+Only simulations are recorded; answers served by a result cache are not.
+State and transition counts are keyed by state name, so runs of different
+DFAs with the same state names add up. Counting them replays the input
+after the timed call, which roughly doubles the cost of a simulation; pass
+count_states=False to record only latencies and symbols.
+"""
+import bisect
+import time
+from collections import Counter
+
+import dfa as dfa_module
+from dfa import DFA
+
+
+# Upper bounds of the latency histogram buckets, in seconds
+DEFAULT_BUCKETS = (1e-6, 5e-6, 1e-5, 5e-5, 1e-4, 5e-4, 1e-3, 5e-3, 1e-2, 5e-2, 0.1, 0.5, 1.0)
+
+_installed = None
+
+
+class LatencyHistogram:
+    """Latency histogram with fixed bucket bounds, like a Prometheus histogram."""
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, seconds):
+        """Add one measurement."""
+        self.counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+
+    def cumulative(self):
+        """Return (upper bound, count of measurements <= bound) pairs, ending with +Inf."""
+        pairs = []
+        total = 0
+        for bound, count in zip(self.buckets + (float('inf'),), self.counts):
+            total += count
+            pairs.append((bound, total))
+        return pairs
+
+
+class Instrumentation:
+    """
+    Counters and latency histograms for instrumented simulation calls.
+
+    Operations are 'is_accepted', 'process:<engine>', 'process_with_trace'
+    and 'trace_execution'.
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS, count_states=True):
+        """
+        Initialize empty counters.
+
+        Args:
+            buckets: Upper bounds of the latency buckets, in seconds
+            count_states: Also count state visits and transition hits
+
+        Raises:
+            ValueError: If the bucket bounds are not strictly increasing
+        """
+        if not buckets or any(a >= b for a, b in zip(buckets, buckets[1:])):
+            raise ValueError("buckets must be a non-empty, strictly increasing sequence")
+        self.buckets = tuple(buckets)
+        self.count_states = count_states
+        self.reset()
+
+    def reset(self):
+        """Clear all counters."""
+        self.latency = {}
+        self.symbols = Counter()
+        self.state_visits = Counter()
+        self.transition_hits = Counter()
+
+    def record(self, operation, seconds, symbols):
+        """
+        Record one call.
+
+        Args:
+            operation: Operation name
+            seconds: Duration of the call
+            symbols: Number of symbols processed
+        """
+        histogram = self.latency.get(operation)
+        if histogram is None:
+            histogram = self.latency[operation] = LatencyHistogram(self.buckets)
+        histogram.observe(seconds)
+        self.symbols[operation] += symbols
+
+    def count_path(self, dfa, input_string):
+        """Count the states and transitions of a run, replaying it on the DFA."""
+        visits = self.state_visits
+        hits = self.transition_hits
+        transitions = dfa.transitions
+        state = dfa.start_state
+        visits[state] += 1
+        for symbol in input_string:
+            hits[(state, symbol)] += 1
+            state = transitions[(state, symbol)]
+            visits[state] += 1
+
+    def count_trace(self, input_string, trace):
+        """Count the states and transitions of a run from its list of states."""
+        self.state_visits.update(trace)
+        self.transition_hits.update(zip(trace, input_string))
+
+    def timed(self, operation, dfa, function, *args):
+        """Call function(*args) and record it; args end with the input string."""
+        begin = time.perf_counter()
+        result = function(*args)
+        elapsed = time.perf_counter() - begin
+        input_string = args[-1]
+        self.record(operation, elapsed, len(input_string))
+        if self.count_states:
+            self.count_path(dfa, input_string)
+        return result
+
+    def snapshot(self):
+        """
+        Return all counters as plain data.
+
+        Returns:
+            Dict with 'operations' (per operation: calls, symbols, total
+            seconds and cumulative buckets), 'state_visits' and
+            'transition_hits' (keyed by (state, symbol))
+        """
+        return {
+            'operations': {
+                operation: {
+                    'calls': histogram.count,
+                    'symbols': self.symbols[operation],
+                    'seconds': histogram.sum,
+                    'buckets': histogram.cumulative(),
+                }
+                for operation, histogram in self.latency.items()
+            },
+            'state_visits': dict(self.state_visits),
+            'transition_hits': dict(self.transition_hits),
+        }
+
+    def to_prometheus(self, prefix='dfa'):
+        """
+        Return the counters in the Prometheus text exposition format.
+
+        Args:
+            prefix: Prefix of the metric names
+
+        Returns:
+            String of metric lines
+        """
+        lines = [
+            f"# HELP {prefix}_call_duration_seconds Duration of DFA simulation calls.",
+            f"# TYPE {prefix}_call_duration_seconds histogram",
+        ]
+        for operation, histogram in sorted(self.latency.items()):
+            label = f'operation="{_escape(operation)}"'
+            for bound, count in histogram.cumulative():
+                le = '+Inf' if bound == float('inf') else repr(bound)
+                lines.append(f'{prefix}_call_duration_seconds_bucket{{{label},le="{le}"}} {count}')
+            lines.append(f"{prefix}_call_duration_seconds_sum{{{label}}} {histogram.sum!r}")
+            lines.append(f"{prefix}_call_duration_seconds_count{{{label}}} {histogram.count}")
+
+        lines += [
+            f"# HELP {prefix}_symbols_processed_total Input symbols processed.",
+            f"# TYPE {prefix}_symbols_processed_total counter",
+        ]
+        for operation, count in sorted(self.symbols.items()):
+            lines.append(f'{prefix}_symbols_processed_total{{operation="{_escape(operation)}"}} {count}')
+
+        lines += [
+            f"# HELP {prefix}_state_visits_total Times a run was in each state.",
+            f"# TYPE {prefix}_state_visits_total counter",
+        ]
+        for state, count in sorted(self.state_visits.items(), key=lambda item: str(item[0])):
+            lines.append(f'{prefix}_state_visits_total{{state="{_escape(state)}"}} {count}')
+
+        lines += [
+            f"# HELP {prefix}_transition_hits_total Times each transition was taken.",
+            f"# TYPE {prefix}_transition_hits_total counter",
+        ]
+        for (state, symbol), count in sorted(self.transition_hits.items(),
+                                             key=lambda item: (str(item[0][0]), str(item[0][1]))):
+            lines.append(f'{prefix}_transition_hits_total'
+                         f'{{state="{_escape(state)}",symbol="{_escape(symbol)}"}} {count}')
+
+        return '\n'.join(lines) + '\n'
+
+
+def _escape(value):
+    """Escape a Prometheus label value."""
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _instrumented_functions(instrumentation, originals):
+    """Build the wrappers installed in place of the original functions."""
+    original_is_accepted = originals['_is_accepted']
+    original_trace = originals['_trace_execution']
+    original_process_with_trace = originals['process_with_trace']
+
+    def is_accepted(dfa, input_string):
+        return instrumentation.timed('is_accepted', dfa, original_is_accepted, dfa, input_string)
+
+    def engine(name, make_run):
+        def make_instrumented_run(dfa):
+            run = make_run(dfa)
+            return lambda input_string: instrumentation.timed(f'process:{name}', dfa, run,
+                                                              input_string)
+        return make_instrumented_run
+
+    def process_with_trace(self, input_string):
+        begin = time.perf_counter()
+        accepted, trace = original_process_with_trace(self, input_string)
+        instrumentation.record('process_with_trace', time.perf_counter() - begin,
+                               len(input_string))
+        if instrumentation.count_states:
+            instrumentation.count_trace(input_string, trace)
+        return accepted, trace
+
+    def trace_execution(dfa, input_string):
+        # Only the time spent inside the generator is counted, not the
+        # time the caller spends between steps
+        steps = original_trace(dfa, input_string)
+        elapsed = 0.0
+        trace = []
+        while True:
+            begin = time.perf_counter()
+            try:
+                step = next(steps)
+            except StopIteration:
+                break
+            finally:
+                elapsed += time.perf_counter() - begin
+            trace.append(step['next_state'] if step['symbol'] is not None else step['current_state'])
+            yield step
+        instrumentation.record('trace_execution', elapsed, len(input_string))
+        if instrumentation.count_states:
+            instrumentation.count_trace(input_string, trace[:-1])
+
+    return {
+        '_is_accepted': is_accepted,
+        '_trace_execution': trace_execution,
+        'process_with_trace': process_with_trace,
+        'ENGINES': {name: engine(name, make_run) for name, make_run in originals['ENGINES'].items()},
+    }
+
+
+def enable_instrumentation(buckets=DEFAULT_BUCKETS, count_states=True):
+    """
+    Start recording simulation calls.
+
+    Replaces any instrumentation already enabled.
+
+    Args:
+        buckets: Upper bounds of the latency buckets, in seconds
+        count_states: Also count state visits and transition hits
+
+    Returns:
+        The Instrumentation object receiving the measurements
+    """
+    disable_instrumentation()
+    global _installed
+    instrumentation = Instrumentation(buckets, count_states)
+    originals = {
+        '_is_accepted': dfa_module._is_accepted,
+        '_trace_execution': dfa_module._trace_execution,
+        'process_with_trace': DFA.process_with_trace,
+        'ENGINES': dict(dfa_module.ENGINES),
+    }
+    wrappers = _instrumented_functions(instrumentation, originals)
+    dfa_module._is_accepted = wrappers['_is_accepted']
+    dfa_module._trace_execution = wrappers['_trace_execution']
+    DFA.process_with_trace = wrappers['process_with_trace']
+    dfa_module.ENGINES.update(wrappers['ENGINES'])
+    _installed = (instrumentation, originals)
+    return instrumentation
+
+
+def disable_instrumentation():
+    """Stop recording and restore the original simulation functions."""
+    global _installed
+    if _installed is None:
+        return
+    _, originals = _installed
+    dfa_module._is_accepted = originals['_is_accepted']
+    dfa_module._trace_execution = originals['_trace_execution']
+    DFA.process_with_trace = originals['process_with_trace']
+    dfa_module.ENGINES.update(originals['ENGINES'])
+    _installed = None
+
+
+def get_instrumentation():
+    """Return the enabled Instrumentation object, or None."""
+    return _installed[0] if _installed is not None else None
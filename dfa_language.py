@@ -0,0 +1,395 @@
+"""
+Language-level operations on DFAs: counting, sampling and enumerating
+accepted strings
+
+Counts are computed on the transition count matrix M, where M[i, j] is the
+number of symbols leading from state i to state j. The number of accepted
+strings of length n is e_start · Mⁿ · f (f marks the final states).
+
+Arithmetic is exact by default. NumPy int64 is used while the counts are
+known to fit (every count of length-n strings is at most |Σ|ⁿ), and Python
+big integers in object arrays beyond that. Passing a modulus keeps all
+values below it instead, which is much faster for huge lengths.
+"""
+import math
+import random
+
+import numpy as np
+
+from dfa_analysis import analyze_structure
+from dfa_index import dfa_cache, index_dfa
+
+
+# Largest value int64 arithmetic may produce without overflowing
+_INT64_LIMIT = 2 ** 63 - 1
+
+
+def transition_count_matrix(dfa):
+    """
+    Build the transition count matrix of a DFA.
+
+    Args:
+        dfa: A DFA object
+
+    Returns:
+        int64 array M of shape (|Q|, |Q|) where M[i, j] counts the symbols
+        a with δ(i, a) = j, in index_dfa(dfa).states order
+    """
+    idx = index_dfa(dfa)
+    n, k = idx.delta.shape
+    matrix = np.zeros((n, n), dtype=np.int64)
+    np.add.at(matrix, (np.repeat(np.arange(n), k), idx.delta.ravel()), 1)
+    return matrix
+
+
+def _fits_int64(num_states, num_symbols, length, modulus):
+    """Return True if int64 arithmetic cannot overflow for this computation."""
+    if modulus is None:
+        # Every count of strings of length <= n is at most |Σ|ⁿ
+        return num_symbols <= 1 or length * math.log2(num_symbols) < 62
+    return _limb_bits(num_states, modulus) > 0
+
+
+def _limb_bits(num_states, modulus):
+    """
+    Limb size in bits for overflow-free int64 modular matrix products.
+
+    A product sums |Q| terms of (value < modulus) × (limb < 2^bits), which
+    must stay below 2^63.
+    """
+    return 62 - num_states.bit_length() - (modulus - 1).bit_length()
+
+
+def _mod_matmul(a, b, modulus, limb_bits):
+    """
+    Compute (a @ b) % modulus in int64 without overflow.
+
+    b is split into limbs of limb_bits bits and the limb products are
+    combined Horner-style, most significant limb first.
+    """
+    if limb_bits >= (modulus - 1).bit_length():
+        return (a @ b) % modulus
+
+    mask = (1 << limb_bits) - 1
+    limbs = []
+    remaining = b
+    while True:
+        limbs.append(remaining & mask)
+        remaining = remaining >> limb_bits
+        if not remaining.any():
+            break
+
+    result = None
+    for limb in reversed(limbs):
+        part = (a @ limb) % modulus
+        if result is None:
+            result = part
+        else:
+            # result < modulus, so shifting by limb_bits cannot overflow
+            result = ((result << limb_bits) % modulus + part) % modulus
+    return result
+
+
+def _check_arguments(length, modulus):
+    if length < 0:
+        raise ValueError(f"Length must be non-negative, got {length}")
+    if modulus is not None and modulus < 1:
+        raise ValueError(f"Modulus must be a positive integer, got {modulus}")
+
+
+def count_accepted(dfa, length, modulus=None, method='auto'):
+    """
+    Count the strings of exactly the given length that a DFA accepts.
+
+    Args:
+        dfa: A DFA object
+        length: String length n
+        modulus: Return the count modulo this number (None for the exact count)
+        method: 'matrix' for repeated squaring of the transition count
+            matrix, O(|Q|³ log n); 'dp' for the step-by-step dynamic
+            program, O(|Q|·|Σ|·n); 'auto' picks the cheaper one
+
+    Returns:
+        Number of accepted strings (a Python int)
+
+    Raises:
+        ValueError: If length or modulus is invalid, or method is unknown
+    """
+    _check_arguments(length, modulus)
+    idx = index_dfa(dfa)
+    if method == 'auto':
+        # One DP step costs |Q|·|Σ|, one squaring |Q|³
+        dp_cost = length * idx.num_symbols
+        matrix_cost = idx.num_states ** 2 * max(1, length.bit_length())
+        method = 'dp' if dp_cost <= matrix_cost else 'matrix'
+
+    if method == 'dp':
+        return count_accepted_by_length(dfa, length, modulus=modulus)[length]
+    if method != 'matrix':
+        raise ValueError(f"Unknown counting method '{method}'. Available: auto, dp, matrix")
+
+    matrix = transition_count_matrix(dfa)
+    if not _fits_int64(idx.num_states, idx.num_symbols, length, modulus):
+        matrix = matrix.astype(object)
+
+    def multiply(a, b):
+        if modulus is None:
+            return a @ b
+        if a.dtype == object:
+            return (a @ b) % modulus
+        return _mod_matmul(a, b, modulus, _limb_bits(idx.num_states, modulus))
+
+    # Row vector e_start · Mⁿ by binary exponentiation
+    row = np.zeros(idx.num_states, dtype=matrix.dtype)
+    row[idx.start] = 1
+    power = matrix
+    remaining = length
+    while remaining:
+        if remaining & 1:
+            row = multiply(row, power)
+        remaining >>= 1
+        if remaining:
+            power = multiply(power, power)
+
+    total = int(row[idx.final].sum())
+    return total % modulus if modulus is not None else total
+
+
+def count_accepted_by_length(dfa, max_length, modulus=None):
+    """
+    Count accepted strings of every length from 0 to max_length.
+
+    Each step pushes the per-state string counts along all transitions at
+    once with NumPy, so the whole table costs O(|Q|·|Σ|·max_length).
+
+    Args:
+        dfa: A DFA object
+        max_length: Largest string length to count
+        modulus: Return counts modulo this number (None for exact counts)
+
+    Returns:
+        List where element n is the number of accepted strings of length n
+
+    Raises:
+        ValueError: If max_length or modulus is invalid
+    """
+    _check_arguments(max_length, modulus)
+    idx = index_dfa(dfa)
+    n, k = idx.delta.shape
+    targets = idx.delta.ravel()
+
+    counts = np.zeros(n, dtype=np.int64)
+    counts[idx.start] = 1
+    exact_limit = None
+    if modulus is None and k > 1:
+        # Switch to big integers once |Σ|^length may exceed int64
+        exact_limit = int(62 / math.log2(k))
+    elif modulus is not None and not modulus * n * k <= _INT64_LIMIT:
+        counts = counts.astype(object)
+
+    result = [int(counts[idx.final].sum())]
+    for step in range(1, max_length + 1):
+        if exact_limit is not None and step > exact_limit and counts.dtype != object:
+            counts = counts.astype(object)
+        following = np.zeros(n, dtype=counts.dtype)
+        np.add.at(following, targets, np.repeat(counts, k))
+        if modulus is not None:
+            following %= modulus
+        counts = following
+        total = int(counts[idx.final].sum())
+        result.append(total % modulus if modulus is not None else total)
+
+    if modulus is not None:
+        result[0] %= modulus
+    return result
+
+
+def path_count_table(dfa, length):
+    """
+    Return cumulative path counts used for uniform sampling.
+
+    counts[t, q] is the number of strings of length t that lead from state q
+    to a final state. The returned table holds, for every t in 1..length,
+    the running sums of counts[t - 1] over the successors δ(q, a) of each
+    state in sorted symbol order, so counts[t, q] = table[t - 1, q, -1].
+
+    Tables are cached per DFA; a table for a longer length is reused for
+    shorter ones.
+
+    Args:
+        dfa: A DFA object
+        length: String length
+
+    Returns:
+        Array of shape (length, |Q|, |Σ|), int64 if the counts fit and
+        object (Python ints) otherwise
+    """
+    _check_arguments(length, None)
+    idx = index_dfa(dfa)
+    cache = dfa_cache(dfa)
+    table = cache.get('path_counts')
+    if table is not None and len(table) >= length:
+        return table[:length]
+
+    n, k = idx.delta.shape
+    exact = _fits_int64(n, k, length, None)
+    counts = np.zeros((length + 1, n), dtype=np.int64 if exact else object)
+    counts[0] = idx.final
+    for t in range(1, length + 1):
+        counts[t] = counts[t - 1][idx.delta].sum(axis=1)
+    table = np.cumsum(counts[:length][:, idx.delta], axis=2)
+    cache['path_counts'] = table
+    return table
+
+
+def sample_accepted_batch(dfa, length, size, rng=None):
+    """
+    Draw accepted strings of one length uniformly at random.
+
+    Each sample draws a uniform rank below the number of accepted strings
+    and unranks it through the path count table, choosing one symbol per
+    step for the whole batch at once.
+
+    Args:
+        dfa: A DFA object
+        length: Length of the strings
+        size: Number of strings to draw
+        rng: numpy.random.Generator or seed (None for a fresh generator)
+
+    Returns:
+        NumPy array of size strings, drawn with replacement
+
+    Raises:
+        ValueError: If the DFA accepts no strings of this length
+    """
+    idx = index_dfa(dfa)
+    rng = np.random.default_rng(rng)
+    table = path_count_table(dfa, length)
+    total = table[-1, idx.start, -1] if length else int(idx.final[idx.start])
+    if total == 0:
+        raise ValueError(f"DFA accepts no strings of length {length}")
+
+    if table.dtype == object:
+        # Ranks beyond int64 are drawn with Python's arbitrary-precision randrange
+        draw = random.Random(int(rng.integers(2 ** 63)))
+        ranks = np.array([draw.randrange(total) for _ in range(size)], dtype=object)
+    else:
+        ranks = rng.integers(0, total, size=size)
+
+    states = np.full(size, idx.start, dtype=np.int64)
+    chosen = np.empty((size, length), dtype=np.int64)
+    rows = np.arange(size)
+    for step in range(length):
+        cumulative = table[length - 1 - step][states]
+        symbols = (cumulative <= ranks[:, None]).sum(axis=1)
+        below = np.where(symbols > 0, cumulative[rows, np.maximum(symbols - 1, 0)], 0)
+        ranks = ranks - below
+        chosen[:, step] = symbols
+        states = idx.delta[states, symbols]
+
+    return _join_symbols(idx.symbols, chosen)
+
+
+def _join_symbols(symbols, chosen):
+    """Turn a (size, length) array of symbol numbers into an array of strings."""
+    size, length = chosen.shape
+    if length == 0:
+        return np.full(size, '', dtype='<U1')
+    if all(len(symbol) == 1 for symbol in symbols):
+        # Reinterpret each row of single characters as one fixed-width string
+        chars = np.array(symbols, dtype='<U1')[chosen]
+        return np.ascontiguousarray(chars).view(f'<U{length}').ravel()
+    return np.array([''.join(symbols[j] for j in row) for row in chosen.tolist()])
+
+
+def sample_accepted(dfa, length, rng=None):
+    """
+    Draw one accepted string of the given length uniformly at random.
+
+    Args:
+        dfa: A DFA object
+        length: Length of the string
+        rng: numpy.random.Generator or seed (None for a fresh generator)
+
+    Returns:
+        An accepted string
+
+    Raises:
+        ValueError: If the DFA accepts no strings of this length
+    """
+    return str(sample_accepted_batch(dfa, length, 1, rng)[0])
+
+
+def enumerate_accepted(dfa, max_length=None):
+    """
+    Generate the accepted strings of a DFA in shortlex order.
+
+    Strings are produced shortest first and alphabetically (by sorted
+    symbols) within each length. A depth-first walk builds the strings of
+    each length, entering a state only if a final state can be reached from
+    it in exactly the remaining number of steps, so no walk is wasted on
+    prefixes without an accepted completion. Memory is proportional to
+    |Q| times the current length; nothing is collected between strings.
+
+    Args:
+        dfa: A DFA object
+        max_length: Stop after this string length (None to continue for as
+            long as the language has members, possibly forever)
+
+    Yields:
+        Accepted strings
+    """
+    idx = index_dfa(dfa)
+    delta = idx.delta.tolist()
+    symbols = idx.symbols
+    structure = analyze_structure(dfa)
+    if structure.is_empty:
+        return
+    if structure.is_finite:
+        longest = structure.longest_length
+        max_length = longest if max_length is None else min(max_length, longest)
+    useful = structure.useful_mask
+
+    # reach[r][q]: some string of length exactly r leads from q to a final state
+    reach = [idx.final.tolist()]
+    length = 0
+    while max_length is None or length <= max_length:
+        while len(reach) <= length:
+            previous = reach[-1]
+            reach.append([useful[q] and any(previous[t] for t in delta[q])
+                          for q in range(idx.num_states)])
+        if reach[length][idx.start]:
+            yield from _strings_of_length(delta, symbols, reach, idx.start, length)
+        length += 1
+
+
+def _strings_of_length(delta, symbols, reach, start, length):
+    """Yield the accepted strings of one length in alphabetical order."""
+    if length == 0:
+        yield ''
+        return
+
+    num_symbols = len(symbols)
+    # Per depth: state, string so far and next symbol number to try
+    states = [start] * length
+    prefixes = [''] * length
+    choices = [0] * length
+    depth = 0
+    while depth >= 0:
+        j = choices[depth]
+        if j == num_symbols:
+            depth -= 1
+            continue
+        choices[depth] = j + 1
+        target = delta[states[depth]][j]
+        remaining = length - depth - 1
+        if not reach[remaining][target]:
+            continue
+        word = prefixes[depth] + symbols[j]
+        if remaining == 0:
+            yield word
+            continue
+        depth += 1
+        states[depth] = target
+        prefixes[depth] = word
+        choices[depth] = 0
@@ -0,0 +1,323 @@
+"""
+DFA Layout - Pluggable graph layout algorithms for DFA diagrams
+
+Spring layout looks best for small automata but costs O(n²) per iteration.
+This module offers layouts that scale to large DFAs and picks one
+automatically from the number of states:
+
+- 'spring':  NetworkX spring layout (small DFAs, the classic look)
+- 'dot':     Graphviz hierarchical layout (when pygraphviz or pydot is installed)
+- 'force':   Multilevel force-directed layout with grid-based repulsion,
+             O(n + m) per iteration
+- 'layered': BFS layers from the start state, O(n + m) overall
+
+All layouts return positions scaled to [-1, 1], like nx.spring_layout.
+"""
+import shutil
+from collections import deque
+
+import networkx as nx
+import numpy as np
+
+
+# State-count thresholds used by the 'auto' method
+SPRING_MAX_STATES = 50
+DOT_MAX_STATES = 500
+FORCE_MAX_STATES = 20000
+
+
+def spring_layout(G, start_state=None, k=2, seed=42):
+    """Classic spring layout used by the visualizers for small DFAs."""
+    return nx.spring_layout(G, k=k, iterations=50, seed=seed)
+
+
+def layered_layout(G, start_state=None, k=2, seed=42):
+    """
+    Layered layout: one column per BFS distance from the start state.
+
+    States unreachable from the start state are placed in further columns
+    by continuing the BFS from each unplaced state. Within a column, states
+    are ordered by the average position of their predecessors to reduce
+    edge crossings. Runs in O(n + m).
+    """
+    if G.number_of_nodes() == 0:
+        return {}
+
+    layer_of = {}
+    layers = []
+
+    def bfs(root, base_layer):
+        layer_of[root] = base_layer
+        queue = deque([root])
+        while queue:
+            node = queue.popleft()
+            layer = layer_of[node]
+            while len(layers) <= layer:
+                layers.append([])
+            layers[layer].append(node)
+            for succ in G.successors(node):
+                if succ not in layer_of:
+                    layer_of[succ] = layer + 1
+                    queue.append(succ)
+
+    if start_state is not None and start_state in G:
+        bfs(start_state, 0)
+    for node in sorted(G.nodes(), key=str):
+        if node not in layer_of:
+            bfs(node, len(layers))
+
+    # Order each layer by the barycenter of already-placed predecessors
+    rank = {}
+    for layer in layers:
+        def barycenter(node):
+            ranks = [rank[p] for p in G.predecessors(node) if p in rank]
+            return sum(ranks) / len(ranks) if ranks else 0.0
+        layer.sort(key=barycenter)
+        for i, node in enumerate(layer):
+            rank[node] = i
+
+    pos = {}
+    for x, layer in enumerate(layers):
+        offset = (len(layer) - 1) / 2.0
+        for i, node in enumerate(layer):
+            pos[node] = (float(x), offset - i)
+
+    return _rescale(pos)
+
+
+def force_layout(G, start_state=None, k=2, seed=42):
+    """
+    Multilevel force-directed layout.
+
+    The graph is repeatedly coarsened by merging matched neighbours, the
+    coarsest graph is laid out, and positions are refined level by level.
+    Repulsion is only computed between states in neighbouring grid cells
+    (Fruchterman-Reingold grid variant), so each iteration is O(n + m)
+    instead of O(n²). The coarse levels provide the global structure that
+    the cutoff would otherwise lose.
+    """
+    nodes = list(G.nodes())
+    n = len(nodes)
+    if n == 0:
+        return {}
+    if n == 1:
+        return {nodes[0]: (0.0, 0.0)}
+
+    index = {node: i for i, node in enumerate(nodes)}
+    edges = np.array([(index[u], index[v]) for u, v in G.edges() if u != v],
+                     dtype=np.int64).reshape(-1, 2)
+
+    rng = np.random.default_rng(seed)
+
+    # Coarsen: each level maps fine node -> coarse node
+    levels = []
+    level_n = n
+    level_edges = edges
+    while level_n > SPRING_MAX_STATES:
+        mapping, coarse_n = _match_nodes(level_n, level_edges, rng)
+        if coarse_n > 0.9 * level_n:
+            break
+        levels.append((level_n, level_edges, mapping))
+        coarse_edges = mapping[level_edges]
+        coarse_edges = coarse_edges[coarse_edges[:, 0] != coarse_edges[:, 1]]
+        level_edges = np.unique(np.sort(coarse_edges, axis=1), axis=0) \
+            if len(coarse_edges) else coarse_edges
+        level_n = coarse_n
+
+    # Lay out the coarsest graph
+    pos = rng.uniform(-1.0, 1.0, size=(level_n, 2)) * np.sqrt(level_n)
+    pos = _grid_force(pos, level_edges, iterations=100, rng=rng)
+
+    # Prolong and refine
+    for fine_n, fine_edges, mapping in reversed(levels):
+        # Spread out so the node density (and so the work per grid cell)
+        # stays constant from level to level
+        coarse_n = len(pos)
+        pos = pos[mapping] * np.sqrt(fine_n / coarse_n)
+        pos += rng.uniform(-0.5, 0.5, size=(fine_n, 2))
+        pos = _grid_force(pos, fine_edges, iterations=30, rng=rng)
+
+    return _rescale({node: (pos[i, 0], pos[i, 1]) for i, node in enumerate(nodes)})
+
+
+def dot_layout(G, start_state=None, k=2, seed=42):
+    """Graphviz 'dot' hierarchical layout (requires pygraphviz or pydot)."""
+    try:
+        pos = nx.nx_agraph.graphviz_layout(G, prog='dot')
+    except ImportError:
+        pos = nx.nx_pydot.graphviz_layout(G, prog='dot')
+    return _rescale(pos)
+
+
+def graphviz_available():
+    """Return True if the Graphviz 'dot' layout can be used."""
+    if shutil.which('dot') is None:
+        return False
+    for module in ('pygraphviz', 'pydot'):
+        try:
+            __import__(module)
+            return True
+        except ImportError:
+            continue
+    return False
+
+
+LAYOUT_METHODS = {
+    'spring': spring_layout,
+    'layered': layered_layout,
+    'force': force_layout,
+    'dot': dot_layout,
+}
+
+
+def register_layout(name, func):
+    """
+    Register a custom layout method.
+
+    Args:
+        name: Method name to use with compute_layout()
+        func: Callable (G, start_state=None, k=2, seed=42) -> {node: (x, y)}
+    """
+    LAYOUT_METHODS[name] = func
+
+
+def choose_layout_method(num_states):
+    """Pick a layout method for a DFA with the given number of states."""
+    if num_states <= SPRING_MAX_STATES:
+        return 'spring'
+    if num_states <= DOT_MAX_STATES and graphviz_available():
+        return 'dot'
+    if num_states <= FORCE_MAX_STATES:
+        return 'force'
+    return 'layered'
+
+
+def compute_layout(G, start_state=None, method='auto', k=2, seed=42):
+    """
+    Compute node positions for a DFA graph.
+
+    Args:
+        G: NetworkX graph of the DFA
+        start_state: Start state (used by the layered layout)
+        method: 'auto', or a name in LAYOUT_METHODS
+        k: Optimal node distance for the spring layout
+        seed: Random seed for reproducible layouts
+
+    Returns:
+        Dict mapping state -> (x, y)
+
+    Raises:
+        ValueError: If the layout method is unknown
+    """
+    if method == 'auto':
+        method = choose_layout_method(G.number_of_nodes())
+
+    if method not in LAYOUT_METHODS:
+        raise ValueError(
+            f"Unknown layout method '{method}'. "
+            f"Available: {', '.join(sorted(LAYOUT_METHODS))}"
+        )
+
+    return LAYOUT_METHODS[method](G, start_state=start_state, k=k, seed=seed)
+
+
+def _rescale(pos):
+    """Scale positions into [-1, 1] around the origin."""
+    if not pos:
+        return pos
+    coords = np.array(list(pos.values()), dtype=float)
+    coords -= coords.mean(axis=0)
+    extent = np.abs(coords).max()
+    if extent > 0:
+        coords /= extent
+    return {node: (float(x), float(y)) for node, (x, y) in zip(pos, coords)}
+
+
+def _match_nodes(n, edges, rng):
+    """
+    Greedy random edge matching for graph coarsening.
+
+    Returns:
+        Tuple of (mapping, coarse_n) where mapping[i] is the coarse node of i
+    """
+    mapping = np.full(n, -1, dtype=np.int64)
+    coarse_n = 0
+    for e in rng.permutation(len(edges)):
+        u, v = edges[e]
+        if mapping[u] == -1 and mapping[v] == -1:
+            mapping[u] = mapping[v] = coarse_n
+            coarse_n += 1
+    unmatched = np.flatnonzero(mapping == -1)
+    mapping[unmatched] = np.arange(coarse_n, coarse_n + len(unmatched))
+    return mapping, coarse_n + len(unmatched)
+
+
+def _grid_force(pos, edges, iterations, rng, k=1.0):
+    """
+    Fruchterman-Reingold iterations with grid-approximated repulsion.
+
+    Nodes are binned into a grid of cell size 2k. Each node is repelled by
+    the centre of mass of its own cell and the eight adjacent cells
+    (Barnes-Hut style), so each iteration costs O(n + m) however densely
+    the nodes are packed.
+    """
+    n = len(pos)
+    pos = pos.astype(float)
+    temperature = 0.1 * np.sqrt(n) * k + k
+
+    for it in range(iterations):
+        disp = _cell_repulsion(pos, 2.0 * k, k, rng)
+
+        # Attraction along edges
+        if len(edges):
+            u, v = edges[:, 0], edges[:, 1]
+            delta = pos[u] - pos[v]
+            dist = np.maximum(np.hypot(delta[:, 0], delta[:, 1]), 1e-9)
+            force = (dist / k)[:, None] * delta
+            np.add.at(disp, u, -force)
+            np.add.at(disp, v, force)
+
+        # Move, limited by the current temperature
+        length = np.maximum(np.hypot(disp[:, 0], disp[:, 1]), 1e-9)
+        pos += disp / length[:, None] * np.minimum(length, temperature)[:, None]
+        temperature *= 1.0 - (it + 1) / (iterations + 1) * 0.1
+
+    return pos
+
+
+def _cell_repulsion(pos, cell, k, rng):
+    """Repulsive displacement of each node from the mass of nearby grid cells."""
+    n = len(pos)
+    cells = np.floor(pos / cell).astype(np.int64)
+    cells -= cells.min(axis=0)
+    width = cells[:, 1].max() + 3
+    keys = (cells[:, 0] + 1) * width + (cells[:, 1] + 1)
+
+    unique_keys, inverse, counts = np.unique(keys, return_inverse=True, return_counts=True)
+    sums = np.zeros((len(unique_keys), 2))
+    np.add.at(sums, inverse, pos)
+
+    disp = np.zeros_like(pos)
+    for dx in (-1, 0, 1):
+        for dy in (-1, 0, 1):
+            target = keys + dx * width + dy
+            slot = np.minimum(np.searchsorted(unique_keys, target), len(unique_keys) - 1)
+            mass = np.where(unique_keys[slot] == target, counts[slot], 0).astype(float)
+            total = sums[slot] * (mass > 0)[:, None]
+            if dx == 0 and dy == 0:
+                # Exclude the node itself from its own cell
+                mass -= 1.0
+                total = total - pos
+            present = mass > 0
+            if not present.any():
+                continue
+            centre = total[present] / mass[present, None]
+            delta = pos[present] - centre
+            dist_sq = (delta ** 2).sum(axis=1)
+            coincident = dist_sq < 1e-12
+            if coincident.any():
+                delta[coincident] = rng.uniform(-0.01, 0.01, size=(coincident.sum(), 2))
+                dist_sq[coincident] = (delta[coincident] ** 2).sum(axis=1)
+            disp[present] += (mass[present] * k * k / dist_sq)[:, None] * delta
+
+    return disp
@@ -0,0 +1,220 @@
+"""
+Prefix-state cache for DFA simulation
+
+Inputs that share long prefixes (URL paths, log lines) repeat the same
+transitions over and over. PrefixStateCache remembers the state reached
+after prefixes of the inputs it has run, so the next input resumes from its
+longest cached prefix instead of the start state.
+
+Prefixes are cached at every multiple of `stride` symbols, as a trie whose
+nodes are keyed by their parent node and the `stride` symbols leading to
+them. Finding the longest cached prefix walks down the trie and hashes each
+symbol of the input once, so a run costs time linear in its length however
+long the shared prefixes are.
+
+Entries are evicted least recently used first, by count and by estimated
+memory, but only leaves of the trie are evicted: a cached prefix is never
+dropped while one of its extensions is still cached, so the walk from the
+root always reaches every node. A prefix whose last extension is evicted is
+next in line itself.
+
+Only str inputs are cached; other sequences of symbols are run from the
+start state.
+"""
+import sys
+from collections import OrderedDict
+
+
+# Default number of cached prefixes
+DEFAULT_MAX_PREFIXES = 10000
+
+# Default memory budget of a PrefixStateCache
+DEFAULT_MAX_PREFIX_BYTES = 8 * 1024 * 1024
+
+# Default distance in symbols between cached prefixes
+DEFAULT_STRIDE = 16
+
+# Approximate bytes per node besides its symbols (key tuple, node list,
+# dict slots)
+_NODE_OVERHEAD = 250
+
+# Fields of a trie node
+_ID, _STATE, _PARENT, _CHILDREN = range(4)
+
+
+class PrefixStateCache:
+    """
+    LRU map from input prefixes to the DFA state they lead to.
+
+    A cache belongs to a single DFA; call clear() if that DFA's transitions
+    or start state change. Not thread-safe.
+    """
+
+    def __init__(self, max_entries=DEFAULT_MAX_PREFIXES, stride=DEFAULT_STRIDE,
+                 max_bytes=DEFAULT_MAX_PREFIX_BYTES):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Evict least recently used prefixes beyond this count
+            stride: Cache the prefixes whose length is a multiple of this
+            max_bytes: Evict least recently used prefixes beyond this
+                estimated memory
+
+        Raises:
+            ValueError: If max_entries, stride or max_bytes is not positive
+        """
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be positive, got {max_entries}")
+        if stride < 1:
+            raise ValueError(f"stride must be positive, got {stride}")
+        if max_bytes < 1:
+            raise ValueError(f"max_bytes must be positive, got {max_bytes}")
+
+        self.max_entries = max_entries
+        self.stride = stride
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.symbols_skipped = 0
+        self.symbols_total = 0
+        # (parent id, symbols) -> [id, state, parent key, child count]
+        self._nodes = {}
+        # Keys of the nodes without children, least recently used first
+        self._leaves = OrderedDict()
+        self._next_id = 0
+
+    def __len__(self):
+        return len(self._nodes)
+
+    @property
+    def hit_rate(self):
+        """Fraction of runs that resumed from a cached prefix."""
+        runs = self.hits + self.misses
+        return self.hits / runs if runs else 0.0
+
+    @property
+    def skip_rate(self):
+        """Fraction of input symbols that did not have to be simulated."""
+        return self.symbols_skipped / self.symbols_total if self.symbols_total else 0.0
+
+    def stats(self):
+        """
+        Return the cache statistics.
+
+        Returns:
+            Dict with 'entries', 'bytes', 'hits', 'misses', 'hit_rate',
+            'symbols_skipped', 'symbols_total' and 'skip_rate'
+        """
+        return {
+            'entries': len(self._nodes),
+            'bytes': self.current_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hit_rate,
+            'symbols_skipped': self.symbols_skipped,
+            'symbols_total': self.symbols_total,
+            'skip_rate': self.skip_rate,
+        }
+
+    def clear(self):
+        """Drop all cached prefixes and reset the statistics."""
+        self._nodes.clear()
+        self._leaves.clear()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.symbols_skipped = 0
+        self.symbols_total = 0
+
+    def _evict(self):
+        """Drop least recently used leaves until the cache is within its limits."""
+        nodes = self._nodes
+        leaves = self._leaves
+        while len(nodes) > self.max_entries or self.current_bytes > self.max_bytes:
+            key, _ = leaves.popitem(last=False)
+            parent_key = nodes.pop(key)[_PARENT]
+            self.current_bytes -= sys.getsizeof(key[1]) + _NODE_OVERHEAD
+            if parent_key is not None:
+                parent = nodes[parent_key]
+                parent[_CHILDREN] -= 1
+                if not parent[_CHILDREN]:
+                    leaves[parent_key] = None
+                    leaves.move_to_end(parent_key, last=False)
+
+    def run(self, dfa, input_string):
+        """
+        Run a DFA on a string, resuming from the longest cached prefix.
+
+        The caller must have checked that every symbol is in the alphabet.
+
+        Args:
+            dfa: The DFA this cache belongs to
+            input_string: String to process (other sequences of symbols
+                are run without the cache)
+
+        Returns:
+            The state reached after the whole string
+        """
+        transitions = dfa.transitions
+        if type(input_string) is not str:
+            state = dfa.start_state
+            for symbol in input_string:
+                state = transitions[(state, symbol)]
+            return state
+
+        stride = self.stride
+        checkpoints = len(input_string) // stride
+        nodes = self._nodes
+        leaves = self._leaves
+
+        # Walk down the trie along the input
+        get = nodes.get
+        key = node = None
+        node_id = checkpoint = 0
+        while checkpoint < checkpoints:
+            start = checkpoint * stride
+            probe = (node_id, input_string[start:start + stride])
+            found = get(probe)
+            if found is None:
+                break
+            key, node = probe, found
+            node_id = node[_ID]
+            checkpoint += 1
+
+        self.symbols_total += len(input_string)
+        if checkpoint:
+            self.hits += 1
+            self.symbols_skipped += checkpoint * stride
+            state = node[_STATE]
+            if not node[_CHILDREN]:
+                leaves.move_to_end(key)
+        else:
+            self.misses += 1
+            state = dfa.start_state
+
+        # Add the remaining checkpoints below the node resumed from
+        if checkpoint < checkpoints:
+            if node is not None:
+                if not node[_CHILDREN]:
+                    del leaves[key]
+                node[_CHILDREN] += 1
+            for end in range((checkpoint + 1) * stride, checkpoints * stride + 1, stride):
+                chunk = input_string[end - stride:end]
+                for symbol in chunk:
+                    state = transitions[(state, symbol)]
+                self._next_id += 1
+                child_key = (node_id, chunk)
+                node = [self._next_id, state, key, 1]
+                nodes[child_key] = node
+                self.current_bytes += sys.getsizeof(chunk) + _NODE_OVERHEAD
+                key = child_key
+                node_id = self._next_id
+            node[_CHILDREN] = 0
+            leaves[key] = None
+            self._evict()
+
+        for symbol in input_string[checkpoints * stride:]:
+            state = transitions[(state, symbol)]
+        return state
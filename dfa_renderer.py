@@ -0,0 +1,365 @@
+"""
+DFA Renderer - Headless rendering of DFA diagrams to image files
+
+Uses the Agg backend directly (no PyQt5 import), so it can run on servers
+and in worker processes. The drawing code here is shared with DFACanvas in
+dfa_visualizer.py, so batch-rendered diagrams look the same as the GUI.
+"""
+import argparse
+import hashlib
+import json
+import math
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import networkx as nx
+from matplotlib import colormaps
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from dfa import import_dfa_from_json
+from dfa_layout import choose_layout_method, compute_layout
+
+
+def build_dfa_graph(dfa):
+    """
+    Build the NetworkX graph and grouped edge labels for a DFA.
+
+    Transitions between the same pair of states are merged into a single
+    edge whose label lists every symbol, e.g. "a, b".
+
+    Args:
+        dfa: A DFA object
+
+    Returns:
+        Tuple of (graph, edge_labels)
+    """
+    G = nx.DiGraph()
+
+    # Add nodes (states)
+    for state in dfa.states:
+        G.add_node(state)
+
+    # Add edges (transitions) with labels
+    edge_labels = {}
+    for (state, symbol), next_state in dfa.transitions.items():
+        # Group multiple symbols for same transition
+        edge_key = (state, next_state)
+        if edge_key in edge_labels:
+            edge_labels[edge_key] += f", {symbol}"
+        else:
+            edge_labels[edge_key] = symbol
+            G.add_edge(state, next_state)
+
+    return G, edge_labels
+
+
+def draw_dfa_graph(axes, dfa, G, pos, edge_labels, highlighted_path=(), title=None,
+                   edge_counts=None):
+    """
+    Draw a DFA graph onto matplotlib axes with the standard visual style.
+
+    Regular states are blue, the start state is green with an arrow,
+    final states are drawn as red double circles and highlighted states
+    are yellow. With edge_counts, edges are drawn as a heat map: taken
+    edges from yellow to red by log hit count, untaken edges dashed gray.
+
+    Args:
+        axes: Matplotlib axes to draw on
+        dfa: The DFA being drawn
+        G: Graph from build_dfa_graph()
+        pos: Dict mapping state -> (x, y)
+        edge_labels: Edge labels from build_dfa_graph()
+        highlighted_path: States to highlight
+        title: Plot title (defaults to a summary of the DFA)
+        edge_counts: Optional dict (state, next_state) -> hit count, e.g.
+            from TransitionCoverage.edge_counts()
+    """
+    # Draw different node types
+    regular_nodes = [n for n in G.nodes()
+                    if n != dfa.start_state and n not in dfa.final_states]
+    start_only = [dfa.start_state] if dfa.start_state not in dfa.final_states else []
+    final_only = [n for n in dfa.final_states if n != dfa.start_state]
+    start_and_final = [n for n in dfa.final_states if n == dfa.start_state]
+
+    # Highlighted nodes
+    highlighted = [n for n in highlighted_path if n in G.nodes()]
+    non_highlighted_regular = [n for n in regular_nodes if n not in highlighted]
+
+    # Draw regular states (single circle)
+    if non_highlighted_regular:
+        nx.draw_networkx_nodes(G, pos, nodelist=non_highlighted_regular,
+                              node_color='lightblue', node_size=800,
+                              ax=axes)
+
+    # Draw highlighted regular states
+    if highlighted and regular_nodes:
+        highlighted_regular = [n for n in highlighted if n in regular_nodes]
+        if highlighted_regular:
+            nx.draw_networkx_nodes(G, pos, nodelist=highlighted_regular,
+                                  node_color='yellow', node_size=800,
+                                  ax=axes)
+
+    # Draw start state (arrow will be added separately)
+    if start_only:
+        nx.draw_networkx_nodes(G, pos, nodelist=start_only,
+                              node_color='lightgreen', node_size=800,
+                              ax=axes)
+
+    # Draw final states (double circle)
+    if final_only:
+        # Outer circle
+        nx.draw_networkx_nodes(G, pos, nodelist=final_only,
+                              node_color='lightcoral', node_size=1000,
+                              ax=axes)
+        # Inner circle
+        nx.draw_networkx_nodes(G, pos, nodelist=final_only,
+                              node_color='lightcoral', node_size=800,
+                              ax=axes)
+
+    # Draw start+final states (double circle with green)
+    if start_and_final:
+        # Outer circle
+        nx.draw_networkx_nodes(G, pos, nodelist=start_and_final,
+                              node_color='lightgreen', node_size=1000,
+                              ax=axes)
+        # Inner circle
+        nx.draw_networkx_nodes(G, pos, nodelist=start_and_final,
+                              node_color='lightgreen', node_size=800,
+                              ax=axes)
+
+    # Draw edges
+    edge_style = dict(arrows=True, arrowsize=20,
+                      arrowstyle='-|>', connectionstyle='arc3,rad=0.15',
+                      width=2, ax=axes,
+                      min_source_margin=15, min_target_margin=15)
+    if edge_counts is None:
+        nx.draw_networkx_edges(G, pos, edge_color='gray', **edge_style)
+    else:
+        taken = [edge for edge in G.edges() if edge_counts.get(edge, 0) > 0]
+        untaken = [edge for edge in G.edges() if edge_counts.get(edge, 0) == 0]
+        if untaken:
+            nx.draw_networkx_edges(G, pos, edgelist=untaken, edge_color='lightgray',
+                                   style='dashed', **edge_style)
+        if taken:
+            heat = [math.log1p(edge_counts[edge]) for edge in taken]
+            nx.draw_networkx_edges(G, pos, edgelist=taken, edge_color=heat,
+                                   edge_cmap=colormaps['YlOrRd'], edge_vmin=0,
+                                   edge_vmax=max(heat), **edge_style)
+
+    # Draw edge labels (transition symbols)
+    nx.draw_networkx_edge_labels(G, pos, edge_labels,
+                                 font_size=10, ax=axes)
+
+    # Draw node labels (state names)
+    nx.draw_networkx_labels(G, pos, font_size=12, font_weight='bold',
+                           ax=axes)
+
+    # Draw arrow pointing to start state
+    if dfa.start_state in pos:
+        start_pos = pos[dfa.start_state]
+        arrow_start = (start_pos[0] - 0.15, start_pos[1] + 0.15)
+        arrow_end = (start_pos[0] - 0.05, start_pos[1] + 0.05)
+        axes.annotate('', xy=arrow_end, xytext=arrow_start,
+                      arrowprops=dict(arrowstyle='->', lw=2, color='green'))
+        axes.text(arrow_start[0] - 0.05, arrow_start[1] + 0.05, 'start',
+                  fontsize=10, color='green', weight='bold')
+
+    # Title with DFA info - legend removed to prevent overlap
+    if title is None:
+        title = (f'DFA Visualization - {len(dfa.states)} states, '
+                 f'{len(dfa.alphabet)} symbols')
+    axes.set_title(title, fontsize=12, weight='bold')
+    axes.axis('off')
+
+
+def layout_key(dfa, G, method):
+    """
+    Compute a stable cache key for the layout of a DFA graph.
+
+    The key depends only on the graph structure, start state and layout
+    method, so DFAs that differ only in final states or edge labels share
+    a layout.
+    """
+    payload = json.dumps({
+        'nodes': sorted(G.nodes()),
+        'edges': sorted(G.edges()),
+        'start': dfa.start_state,
+        'method': method,
+    }, ensure_ascii=False)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+def cached_layout(dfa, G, cache_dir=None, method='auto'):
+    """
+    Compute node positions for a DFA graph, reusing a cached layout if available.
+
+    Args:
+        dfa: The DFA being drawn
+        G: Graph from build_dfa_graph()
+        cache_dir: Directory holding cached layouts (None disables caching)
+        method: Layout method, see dfa_layout.compute_layout()
+
+    Returns:
+        Dict mapping state -> (x, y)
+    """
+    if method == 'auto':
+        method = choose_layout_method(G.number_of_nodes())
+
+    cache_file = None
+    if cache_dir:
+        cache_file = os.path.join(cache_dir, f"{layout_key(dfa, G, method)}.json")
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            if set(cached) == set(G.nodes()):
+                return {state: tuple(xy) for state, xy in cached.items()}
+        except (IOError, ValueError):
+            pass
+
+    pos = compute_layout(G, start_state=dfa.start_state, method=method, k=2)
+
+    if cache_file:
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            # Write to a temporary file first so concurrent workers never
+            # read a half-written layout
+            tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump({state: [float(x), float(y)] for state, (x, y) in pos.items()},
+                          f, ensure_ascii=False)
+            os.replace(tmp_file, cache_file)
+        except IOError:
+            pass
+
+    return pos
+
+
+def render_dfa(dfa, filename, highlighted_path=(), title=None,
+               layout_cache_dir=None, layout='auto', width=8, height=6, dpi=100,
+               edge_counts=None):
+    """
+    Render a DFA diagram to an image file without any GUI.
+
+    The image format is taken from the file extension (.png, .svg, .pdf, ...).
+
+    Args:
+        dfa: DFA object to render
+        filename: Output image path
+        highlighted_path: States to highlight
+        title: Plot title (defaults to a summary of the DFA)
+        layout_cache_dir: Directory for cached layouts (None disables caching)
+        layout: Layout method, see dfa_layout.compute_layout()
+        width, height: Figure size in inches
+        dpi: Resolution for raster formats
+        edge_counts: Optional dict (state, next_state) -> hits to draw the
+            edges as a coverage heat map
+    """
+    fig = Figure(figsize=(width, height), dpi=dpi)
+    FigureCanvasAgg(fig)
+    axes = fig.add_subplot(111)
+
+    G, edge_labels = build_dfa_graph(dfa)
+    pos = cached_layout(dfa, G, cache_dir=layout_cache_dir, method=layout)
+    draw_dfa_graph(axes, dfa, G, pos, edge_labels,
+                   highlighted_path=highlighted_path, title=title,
+                   edge_counts=edge_counts)
+
+    fig.savefig(filename, dpi=dpi)
+
+
+def _render_file(json_path, output_path, layout_cache_dir, layout, width, height, dpi):
+    """Worker: load one JSON DFA and render it. Runs in a child process."""
+    dfa = import_dfa_from_json(json_path, verbose=False)
+    render_dfa(dfa, output_path, layout_cache_dir=layout_cache_dir, layout=layout,
+               width=width, height=height, dpi=dpi)
+    return output_path
+
+
+def render_directory(input_dir, output_dir, fmt='png', workers=None,
+                     layout_cache_dir=None, layout='auto', width=8, height=6, dpi=100):
+    """
+    Render every JSON DFA in a directory to image files in parallel.
+
+    Each file `name.json` is rendered to `output_dir/name.<fmt>`. Files are
+    spread across a process pool so rendering uses all cores.
+
+    Args:
+        input_dir: Directory containing DFA JSON files
+        output_dir: Directory to write images to (created if missing)
+        fmt: Image format/extension, e.g. 'png' or 'svg'
+        workers: Number of worker processes (defaults to the CPU count)
+        layout_cache_dir: Directory for cached layouts
+                          (defaults to output_dir/.layout_cache)
+        layout: Layout method, see dfa_layout.compute_layout()
+        width, height: Figure size in inches
+        dpi: Resolution for raster formats
+
+    Returns:
+        Tuple of (rendered, failed) where rendered maps name -> image path
+        and failed maps name -> error message
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    if layout_cache_dir is None:
+        layout_cache_dir = os.path.join(output_dir, '.layout_cache')
+
+    jobs = {}
+    for entry in sorted(os.listdir(input_dir)):
+        if not entry.endswith('.json'):
+            continue
+        name = entry[:-len('.json')]
+        jobs[name] = (os.path.join(input_dir, entry),
+                      os.path.join(output_dir, f"{name}.{fmt}"))
+
+    rendered = {}
+    failed = {}
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(_render_file, json_path, output_path,
+                            layout_cache_dir, layout, width, height, dpi): name
+            for name, (json_path, output_path) in jobs.items()
+        }
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                rendered[name] = future.result()
+            except Exception as e:
+                failed[name] = str(e)
+
+    return rendered, failed
+
+
+def main(argv=None):
+    """Command line entry point for batch rendering."""
+    parser = argparse.ArgumentParser(
+        description='Render a directory of DFA JSON files to images.')
+    parser.add_argument('input_dir', help='Directory containing DFA JSON files')
+    parser.add_argument('output_dir', help='Directory to write images to')
+    parser.add_argument('--format', default='png', dest='fmt',
+                        help='Image format: png, svg, pdf, ... (default: png)')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Number of worker processes (default: CPU count)')
+    parser.add_argument('--layout-cache', default=None,
+                        help='Layout cache directory (default: OUTPUT_DIR/.layout_cache)')
+    parser.add_argument('--layout', default='auto',
+                        help='Layout method: auto, spring, layered, force, dot (default: auto)')
+    parser.add_argument('--dpi', type=int, default=100, help='Raster resolution')
+    args = parser.parse_args(argv)
+
+    rendered, failed = render_directory(args.input_dir, args.output_dir,
+                                        fmt=args.fmt, workers=args.workers,
+                                        layout_cache_dir=args.layout_cache,
+                                        layout=args.layout,
+                                        dpi=args.dpi)
+
+    print(f"✓ Rendered {len(rendered)} DFA(s) to '{args.output_dir}'")
+    for name, error in sorted(failed.items()):
+        print(f"✗ {name}: {error}")
+
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
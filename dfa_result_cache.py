@@ -0,0 +1,262 @@
+"""
+Result cache for whole-string DFA acceptance
+
+ResultCache memoizes process()/is_accepted() answers for repeated inputs in
+a bounded LRU map, limited both by entry count and by estimated memory.
+Inputs longer than a threshold are keyed by a 128-bit BLAKE2 digest instead
+of the string itself, so long inputs cost a fixed amount of cache memory.
+
+Cached answers are dropped automatically when the DFA changes. Enabling the
+cache replaces the DFA's transitions dict and final states set with
+TrackedTransitions and TrackedSet, subclasses that bump a version number on
+every mutation, and every lookup checks those versions and the start state.
+The per-DFA caches of dfa_index check the same versions.
+"""
+import hashlib
+import itertools
+import sys
+from collections import OrderedDict
+
+
+# Default limits of a ResultCache
+DEFAULT_MAX_RESULTS = 100000
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+
+# Inputs longer than this are keyed by their digest
+DEFAULT_HASH_THRESHOLD = 256
+
+# Approximate bytes per entry besides the key (dict slot, LRU links, bool)
+_ENTRY_OVERHEAD = 100
+
+# Versions of all tracked containers come from one counter, so a container
+# that replaces another never repeats its version
+_versions = itertools.count(1)
+
+
+class TrackedTransitions(dict):
+    """Transition dict that takes a new `version` on every in-place modification."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.version = next(_versions)
+
+    def _modified(self):
+        self.version = next(_versions)
+
+    def __setitem__(self, key, value):
+        self._modified()
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        self._modified()
+        super().__delitem__(key)
+
+    def __ior__(self, other):
+        self._modified()
+        return super().__ior__(other)
+
+    def pop(self, *args):
+        self._modified()
+        return super().pop(*args)
+
+    def popitem(self):
+        self._modified()
+        return super().popitem()
+
+    def clear(self):
+        self._modified()
+        super().clear()
+
+    def update(self, *args, **kwargs):
+        self._modified()
+        super().update(*args, **kwargs)
+
+    def setdefault(self, key, default=None):
+        self._modified()
+        return super().setdefault(key, default)
+
+
+class TrackedSet(set):
+    """Set that takes a new `version` on every in-place modification."""
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.version = next(_versions)
+
+    def _modified(self):
+        self.version = next(_versions)
+
+
+def _tracked_method(name):
+    method = getattr(set, name)
+
+    def tracked(self, *args):
+        self._modified()
+        return method(self, *args)
+
+    tracked.__name__ = name
+    return tracked
+
+
+for _name in ('add', 'discard', 'remove', 'pop', 'clear', 'update', 'difference_update',
+              'intersection_update', 'symmetric_difference_update',
+              '__ior__', '__iand__', '__isub__', '__ixor__'):
+    setattr(TrackedSet, _name, _tracked_method(_name))
+
+
+class ResultCache:
+    """
+    Bounded LRU cache of acceptance results for one DFA.
+
+    Not thread-safe.
+    """
+
+    def __init__(self, max_entries=DEFAULT_MAX_RESULTS, max_bytes=DEFAULT_MAX_BYTES,
+                 hash_threshold=DEFAULT_HASH_THRESHOLD):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Evict least recently used results beyond this count
+            max_bytes: Evict least recently used results beyond this
+                estimated memory use
+            hash_threshold: Key inputs longer than this by their digest
+
+        Raises:
+            ValueError: If max_entries or max_bytes is not positive
+        """
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be positive, got {max_entries}")
+        if max_bytes < 1:
+            raise ValueError(f"max_bytes must be positive, got {max_bytes}")
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hash_threshold = hash_threshold
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.current_bytes = 0
+        self._entries = OrderedDict()
+        self._snapshot = None
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def hit_rate(self):
+        """Fraction of lookups answered from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self):
+        """
+        Return the cache statistics.
+
+        Returns:
+            Dict with 'entries', 'bytes', 'hits', 'misses', 'hit_rate',
+            'evictions' and 'invalidations'
+        """
+        return {
+            'entries': len(self._entries),
+            'bytes': self.current_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hit_rate,
+            'evictions': self.evictions,
+            'invalidations': self.invalidations,
+        }
+
+    def clear(self):
+        """Drop all cached results (the counters are kept)."""
+        self._entries.clear()
+        self.current_bytes = 0
+
+    def attach(self, dfa):
+        """
+        Start tracking a DFA's transitions and final states.
+
+        Replaces dfa.transitions and dfa.final_states with tracked copies
+        unless they already are tracked.
+
+        Args:
+            dfa: The DFA whose results will be cached
+        """
+        if not isinstance(dfa.transitions, TrackedTransitions):
+            dfa.transitions = TrackedTransitions(dfa.transitions)
+        if not isinstance(dfa.final_states, TrackedSet):
+            dfa.final_states = TrackedSet(dfa.final_states)
+        self._snapshot = self._take_snapshot(dfa)
+
+    @staticmethod
+    def _take_snapshot(dfa):
+        transitions = dfa.transitions
+        final_states = dfa.final_states
+        return (transitions, transitions.version, final_states, final_states.version,
+                dfa.start_state)
+
+    def _is_current(self, dfa):
+        """Return True if the DFA is unchanged since the snapshot."""
+        transitions, transitions_version, final_states, final_version, start = self._snapshot
+        return (dfa.transitions is transitions and transitions.version == transitions_version
+                and dfa.final_states is final_states and final_states.version == final_version
+                and dfa.start_state == start)
+
+    def _invalidate(self, dfa):
+        """Drop results computed for an older version of the DFA."""
+        self.clear()
+        self.invalidations += 1
+        if getattr(dfa, 'prefix_cache', None) is not None:
+            dfa.prefix_cache.clear()
+        self.attach(dfa)
+
+    def _key(self, input_string):
+        if len(input_string) <= self.hash_threshold:
+            return input_string
+        data = input_string.encode('utf-8', 'surrogatepass')
+        return hashlib.blake2b(data, digest_size=16).digest()
+
+    def lookup(self, dfa, input_string):
+        """
+        Look up the result for an input.
+
+        Args:
+            dfa: The DFA this cache belongs to
+            input_string: Input string
+
+        Returns:
+            Tuple (key, result): result is the cached bool or None on a miss,
+            and key is passed to store() after computing a missing result
+        """
+        if not self._is_current(dfa):
+            self._invalidate(dfa)
+        key = self._key(input_string)
+        result = self._entries.get(key)
+        if result is None:
+            self.misses += 1
+            return key, None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return key, result
+
+    def store(self, key, result):
+        """
+        Cache a result returned as a miss by lookup().
+
+        Args:
+            key: Key returned by lookup()
+            result: Acceptance result
+        """
+        if key in self._entries:
+            return
+        size = sys.getsizeof(key) + _ENTRY_OVERHEAD
+        if size > self.max_bytes:
+            return
+        entries = self._entries
+        entries[key] = result
+        self.current_bytes += size
+        while len(entries) > self.max_entries or self.current_bytes > self.max_bytes:
+            evicted, _ = entries.popitem(last=False)
+            self.current_bytes -= sys.getsizeof(evicted) + _ENTRY_OVERHEAD
+            self.evictions += 1
@@ -0,0 +1,351 @@
+"""
+Streaming JSON import for very large DFA files
+
+import_dfa_from_json() loads the whole document with json.load, converts
+the transitions into a dict with tuple keys and then copies everything
+again into the DFA. For files with millions of transitions this means
+several full copies at peak.
+
+import_dfa_from_json_stream() reads the same JSON schema in chunks and
+writes each transition straight into the flat transition table of a
+CompactDFA (4 bytes per transition), so peak memory stays close to the
+size of the final structure. Transitions are streamed when "states" and
+"alphabet" come before "transitions" in the file, which is the order
+export_dfa_to_json() writes. Otherwise they are buffered until the
+states are known. Compressed files are decompressed as they are read.
+"""
+import json
+import re
+from array import array
+from json.decoder import scanstring
+
+from dfa_compact import CompactDFA
+from dfa_compression import DECOMPRESSION_ERRORS, open_dfa_file
+
+
+REQUIRED_FIELDS = ["states", "alphabet", "transitions", "start_state", "final_states"]
+
+# Marks table entries that have no transition yet
+MISSING = 0xFFFFFFFF
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+# One "state,symbol": "target" entry without escapes, plus the following separator
+_ENTRY = re.compile(r'[ \t\n\r]*"([^"\\\x00-\x1f]*)"[ \t\n\r]*:'
+                    r'[ \t\n\r]*"([^"\\\x00-\x1f]*)"[ \t\n\r]*([,}])')
+
+
+class _JSONReader:
+    """Minimal pull parser over a text file read in chunks."""
+
+    def __init__(self, f, chunk_size):
+        self._file = f
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self.buf = ''
+        self.pos = 0
+        # Characters, newlines and column of the text dropped from the buffer
+        self.dropped = 0
+        self.lines = 0
+        self.column = 0
+
+    def fill(self):
+        """
+        Drop the consumed part of the buffer and read more input.
+
+        Reads at least as much as is still unconsumed, so retrying a
+        partial value costs amortized linear time.
+
+        Returns:
+            False at end of file
+        """
+        chunk = self._file.read(max(self._chunk_size, len(self.buf) - self.pos))
+        if not chunk:
+            return False
+        newlines = self.buf.count('\n', 0, self.pos)
+        if newlines:
+            self.lines += newlines
+            self.column = self.pos - self.buf.rfind('\n', 0, self.pos) - 1
+        else:
+            self.column += self.pos
+        self.dropped += self.pos
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def error(self, message):
+        """Raise a JSONDecodeError at the current position."""
+        raise json.JSONDecodeError(message, self.buf, self.pos)
+
+    def located(self, error, message):
+        """Return a JSONDecodeError raised on the buffer, with positions in the whole file."""
+        located = json.JSONDecodeError(message, error.doc, error.pos)
+        located.pos += self.dropped
+        if located.lineno == 1:
+            located.colno += self.column
+        located.lineno += self.lines
+        return located
+
+    def peek(self):
+        """Skip whitespace and return the next character ('' at end of file)."""
+        while True:
+            self.pos = _WHITESPACE.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self.fill():
+                return ''
+
+    def expect(self, char):
+        """Consume the given character or raise JSONDecodeError."""
+        if self.peek() != char:
+            self.error(f"Expecting '{char}'")
+        self.pos += 1
+
+    def read_string(self):
+        """Read a JSON string."""
+        if self.peek() != '"':
+            self.error("Expecting string")
+        while True:
+            try:
+                value, self.pos = scanstring(self.buf, self.pos + 1, True)
+                return value
+            except json.JSONDecodeError:
+                if not self.fill():
+                    raise
+
+    def read_value(self):
+        """Read any JSON value (used for fields this module does not stream)."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self.buf, self.pos)
+                # A number at the end of the buffer may continue in the next chunk
+                if end < len(self.buf) or not self.fill():
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                if not self.fill():
+                    raise
+
+    def read_string_list(self, field):
+        """Read a JSON array of strings."""
+        if self.peek() != '[':
+            raise ValueError(f"'{field}' must be a list")
+        self.pos += 1
+        items = []
+        if self.peek() == ']':
+            self.pos += 1
+            return items
+        while True:
+            if self.peek() != '"':
+                raise ValueError(f"'{field}' must be a list of strings")
+            items.append(self.read_string())
+            char = self.peek()
+            self.pos += 1
+            if char == ']':
+                return items
+            if char != ',':
+                self.pos -= 1
+                self.error("Expecting ',' delimiter")
+
+    def iter_object(self):
+        """Iterate over the keys of a JSON object; the caller reads each value."""
+        self.expect('{')
+        if self.peek() == '}':
+            self.pos += 1
+            return
+        while True:
+            key = self.read_string()
+            self.expect(':')
+            yield key
+            char = self.peek()
+            self.pos += 1
+            if char == '}':
+                return
+            if char != ',':
+                self.pos -= 1
+                self.error("Expecting ',' delimiter")
+
+
+class _TableBuilder:
+    """Collects transitions into a flat table once states and symbols are known."""
+
+    def __init__(self):
+        self.state_names = None
+        self.symbols = None
+        self.state_index = None
+        self.symbol_index = None
+        self.table = None
+        self.pending = []
+
+    def set_states(self, states):
+        self.state_names = list(dict.fromkeys(states))
+        self.state_index = {state: i for i, state in enumerate(self.state_names)}
+        self._allocate()
+
+    def set_symbols(self, symbols):
+        self.symbols = list(dict.fromkeys(symbols))
+        self.symbol_index = {symbol: j for j, symbol in enumerate(self.symbols)}
+        self._allocate()
+
+    def _allocate(self):
+        if self.state_names is not None and self.symbols is not None:
+            self.table = array('I', [MISSING]) * (len(self.state_names) * len(self.symbols))
+            pending, self.pending = self.pending, []
+            for key, target in pending:
+                self.add(key, target)
+
+    def add(self, key, target):
+        """Add one "state,symbol" -> target transition."""
+        if self.table is None:
+            self.pending.append((key, target))
+            return
+
+        state, comma, symbol = key.partition(',')
+        if not comma:
+            raise ValueError(f"Invalid transition key format: '{key}'. Expected 'state,symbol'")
+
+        i = self.state_index.get(state)
+        j = self.symbol_index.get(symbol)
+        if i is None or j is None:
+            # Never taken by a run; import_dfa_from_json() accepts these too
+            return
+        t = self.state_index.get(target)
+        if t is None:
+            raise ValueError(f"Invalid transition target for ({state}, {symbol})")
+        self.table[i * len(self.symbols) + j] = t
+
+
+def _stream_transitions(reader, builder):
+    """Read the transitions object, writing entries straight into the table."""
+    if reader.peek() != '{':
+        raise ValueError("'transitions' must be a dictionary")
+    reader.pos += 1
+    if reader.peek() == '}':
+        reader.pos += 1
+        return
+
+    entry = _ENTRY.match
+    add = builder.add
+    while True:
+        # Fast path: a complete entry without escapes is already buffered
+        m = entry(reader.buf, reader.pos)
+        if m:
+            key, target, separator = m.groups()
+            reader.pos = m.end()
+        else:
+            key = reader.read_string()
+            reader.expect(':')
+            if reader.peek() != '"':
+                raise ValueError(f"Transition target for '{key}' must be a string")
+            target = reader.read_string()
+            separator = reader.peek()
+            reader.pos += 1
+            if separator not in ',}':
+                reader.pos -= 1
+                reader.error("Expecting ',' delimiter")
+        add(key, target)
+        if separator == '}':
+            return
+
+
+def read_dfa_json_stream(f, filename='<stream>', chunk_size=1 << 16):
+    """
+    Read a DFA from an open JSON text file in chunks.
+
+    Args:
+        f: Text file object positioned at the start of the document
+        filename: Name used in error messages
+        chunk_size: Number of characters read from the file at a time
+
+    Returns:
+        CompactDFA object
+
+    Raises:
+        ValueError: If the DFA structure is malformed
+        json.JSONDecodeError: If the file contains invalid JSON; positions
+            are counted from the start of the file
+    """
+    fields = {}
+    builder = _TableBuilder()
+
+    reader = _JSONReader(f, chunk_size)
+    try:
+        for field in reader.iter_object():
+            if field in ('states', 'alphabet', 'final_states'):
+                values = reader.read_string_list(field)
+                if field == 'states':
+                    builder.set_states(values)
+                elif field == 'alphabet':
+                    builder.set_symbols(values)
+                fields[field] = values
+                del values
+            elif field == 'transitions':
+                _stream_transitions(reader, builder)
+                fields[field] = True
+            else:
+                fields[field] = reader.read_value()
+        if reader.peek():
+            reader.error("Extra data")
+    except json.JSONDecodeError as e:
+        raise reader.located(e, f"Invalid JSON in file '{filename}': {e.msg}")
+
+    missing_fields = [field for field in REQUIRED_FIELDS if field not in fields]
+    if missing_fields:
+        raise ValueError(f"Missing required fields in JSON: {missing_fields}")
+
+    state_names = builder.state_names
+    symbols = builder.symbols
+    table = builder.table
+
+    start_state = fields['start_state']
+    if not isinstance(start_state, str) or start_state not in builder.state_index:
+        raise ValueError(f"Start state {start_state} not in states")
+
+    final_bits = bytearray((len(state_names) + 7) // 8)
+    for state in fields['final_states']:
+        i = builder.state_index.get(state)
+        if i is None:
+            raise ValueError("Final states must be subset of states")
+        final_bits[i >> 3] |= 1 << (i & 7)
+
+    try:
+        gap = table.index(MISSING)
+    except ValueError:
+        gap = None
+    if gap is not None:
+        state, symbol = divmod(gap, len(symbols))
+        raise ValueError(f"Missing transition for ({state_names[state]}, {symbols[symbol]})")
+
+    return CompactDFA(state_names, symbols, table, builder.state_index[start_state],
+                      bytes(final_bits))
+
+
+def import_dfa_from_json_stream(filename, chunk_size=1 << 16):
+    """
+    Import a DFA from a JSON file without loading the whole document.
+
+    Accepts the same schema as import_dfa_from_json(). Transition keys must
+    use the DFA's states and symbols, and the transition function must be
+    complete.
+
+    Args:
+        filename: Path to the JSON file to load
+        chunk_size: Number of characters read from the file at a time
+
+    Returns:
+        CompactDFA object
+
+    Raises:
+        IOError: If file cannot be read
+        ValueError: If the DFA structure is malformed
+        json.JSONDecodeError: If file contains invalid JSON
+    """
+    try:
+        with open_dfa_file(filename, 'r', encoding='utf-8') as f:
+            dfa = read_dfa_json_stream(f, filename, chunk_size)
+    except DECOMPRESSION_ERRORS as e:
+        raise IOError(f"Failed to read file '{filename}': {e}")
+
+    print(f"✓ DFA imported successfully from '{filename}'")
+    return dfa
@@ -2,7 +2,6 @@
 DFA Visualizer - GUI application using PyQt5 and NetworkX
 """
 import sys
-import networkx as nx
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
@@ -15,6 +14,8 @@ from PyQt5.QtCore import Qt
 
 from dfa import DFA, import_dfa_from_json, is_accepted, trace_execution
 from dfa_builder import DFABuilderDialog
+from dfa_layout import compute_layout
+from dfa_renderer import build_dfa_graph, draw_dfa_graph
 
 
 class DFACanvas(FigureCanvas):
@@ -28,11 +29,13 @@ class DFACanvas(FigureCanvas):
         
         self.dfa = None
         self.highlighted_path = []
+        self.edge_counts = None
     
     def set_dfa(self, dfa):
         """Set the DFA to visualize."""
         self.dfa = dfa
         self.highlighted_path = []
+        self.edge_counts = None
         self.draw_dfa()
     
     def highlight_path(self, states):
@@ -40,6 +43,23 @@ class DFACanvas(FigureCanvas):
         self.highlighted_path = states
         self.draw_dfa()
     
+    def show_coverage(self, coverage):
+        """
+        Color the edges by how often a test corpus took them.
+        
+        Args:
+            coverage: A TransitionCoverage, or a dict (state, next_state) -> hits
+        """
+        if hasattr(coverage, 'edge_counts'):
+            coverage = coverage.edge_counts()
+        self.edge_counts = coverage
+        self.draw_dfa()
+    
+    def clear_coverage(self):
+        """Go back to plain gray edges."""
+        self.edge_counts = None
+        self.draw_dfa()
+    
     def draw_dfa(self):
         """Draw the DFA graph with proper visual distinctions."""
         self.axes.clear()
@@ -50,110 +70,14 @@ class DFACanvas(FigureCanvas):
             self.draw()
             return
         
-        # Create directed graph
-        G = nx.DiGraph()
+        G, edge_labels = build_dfa_graph(self.dfa)
         
-        # Add nodes (states)
-        for state in self.dfa.states:
-            G.add_node(state)
+        # Layout - spring layout for small DFAs, scalable layouts for large ones
+        pos = compute_layout(G, start_state=self.dfa.start_state, k=2)
         
-        # Add edges (transitions) with labels
-        edge_labels = {}
-        for (state, symbol), next_state in self.dfa.transitions.items():
-            # Group multiple symbols for same transition
-            edge_key = (state, next_state)
-            if edge_key in edge_labels:
-                edge_labels[edge_key] += f", {symbol}"
-            else:
-                edge_labels[edge_key] = symbol
-                G.add_edge(state, next_state)
-        
-        # Layout - use spring layout for better visualization
-        pos = nx.spring_layout(G, k=2, iterations=50, seed=42)
-        
-        # Draw different node types
-        regular_nodes = [n for n in G.nodes() 
-                        if n != self.dfa.start_state and n not in self.dfa.final_states]
-        start_only = [self.dfa.start_state] if self.dfa.start_state not in self.dfa.final_states else []
-        final_only = [n for n in self.dfa.final_states if n != self.dfa.start_state]
-        start_and_final = [n for n in self.dfa.final_states if n == self.dfa.start_state]
-        
-        # Highlighted nodes
-        highlighted = [n for n in self.highlighted_path if n in G.nodes()]
-        non_highlighted_regular = [n for n in regular_nodes if n not in highlighted]
-        
-        # Draw regular states (single circle)
-        if non_highlighted_regular:
-            nx.draw_networkx_nodes(G, pos, nodelist=non_highlighted_regular,
-                                  node_color='lightblue', node_size=800,
-                                  ax=self.axes)
-        
-        # Draw highlighted regular states
-        if highlighted and regular_nodes:
-            highlighted_regular = [n for n in highlighted if n in regular_nodes]
-            if highlighted_regular:
-                nx.draw_networkx_nodes(G, pos, nodelist=highlighted_regular,
-                                      node_color='yellow', node_size=800,
-                                      ax=self.axes)
-        
-        # Draw start state (arrow will be added separately)
-        if start_only:
-            nx.draw_networkx_nodes(G, pos, nodelist=start_only,
-                                  node_color='lightgreen', node_size=800,
-                                  ax=self.axes)
-        
-        # Draw final states (double circle)
-        if final_only:
-            # Outer circle
-            nx.draw_networkx_nodes(G, pos, nodelist=final_only,
-                                  node_color='lightcoral', node_size=1000,
-                                  ax=self.axes)
-            # Inner circle
-            nx.draw_networkx_nodes(G, pos, nodelist=final_only,
-                                  node_color='lightcoral', node_size=800,
-                                  ax=self.axes)
-        
-        # Draw start+final states (double circle with green)
-        if start_and_final:
-            # Outer circle
-            nx.draw_networkx_nodes(G, pos, nodelist=start_and_final,
-                                  node_color='lightgreen', node_size=1000,
-                                  ax=self.axes)
-            # Inner circle
-            nx.draw_networkx_nodes(G, pos, nodelist=start_and_final,
-                                  node_color='lightgreen', node_size=800,
-                                  ax=self.axes)
-        
-        # Draw edges
-        nx.draw_networkx_edges(G, pos, edge_color='gray', 
-                              arrows=True, arrowsize=20, 
-                              arrowstyle='-|>', connectionstyle='arc3,rad=0.15',
-                              width=2, ax=self.axes,
-                              min_source_margin=15, min_target_margin=15)
-        
-        # Draw edge labels (transition symbols)
-        formatted_edge_labels = {k: v for k, v in edge_labels.items()}
-        nx.draw_networkx_edge_labels(G, pos, formatted_edge_labels,
-                                     font_size=10, ax=self.axes)
-        
-        # Draw node labels (state names)
-        nx.draw_networkx_labels(G, pos, font_size=12, font_weight='bold',
-                               ax=self.axes)
-        
-        # Draw arrow pointing to start state
-        if self.dfa.start_state in pos:
-            start_pos = pos[self.dfa.start_state]
-            arrow_start = (start_pos[0] - 0.15, start_pos[1] + 0.15)
-            arrow_end = (start_pos[0] - 0.05, start_pos[1] + 0.05)
-            self.axes.annotate('', xy=arrow_end, xytext=arrow_start,
-                             arrowprops=dict(arrowstyle='->', lw=2, color='green'))
-            self.axes.text(arrow_start[0] - 0.05, arrow_start[1] + 0.05, 'start',
-                          fontsize=10, color='green', weight='bold')
-        
-        # Title with DFA info - legend removed to prevent overlap
-        self.axes.set_title(f'DFA Visualization - {len(self.dfa.states)} states, '
-                           f'{len(self.dfa.alphabet)} symbols', fontsize=12, weight='bold')
-        self.axes.axis('off')
+        draw_dfa_graph(self.axes, self.dfa, G, pos, edge_labels,
+                       highlighted_path=self.highlighted_path,
+                       edge_counts=self.edge_counts)
         self.draw()
 
 
@@ -9,12 +9,14 @@ from matplotlib.figure import Figure
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QLabel, QLineEdit, QFileDialog, QMessageBox, QTextEdit,
-    QGroupBox, QScrollArea, QDialog
+    QGroupBox, QScrollArea, QDialog, QInputDialog
 )
 from PyQt5.QtCore import Qt
 
 from dfa import DFA, import_dfa_from_json, trace_execution
+from dfa_analysis import shortest_accepted, shortest_rejected, shortest_string_to
 from dfa_builder import DFABuilderDialog
+from dfa_layout import compute_layout
 
 
 class InteractiveDFACanvas(FigureCanvasQTAgg):
@@ -91,7 +93,7 @@ class InteractiveDFACanvas(FigureCanvasQTAgg):
                 self.graph.add_edge(state, next_state)
         
         # Calculate layout once
-        self.pos = nx.spring_layout(self.graph, k=2.5, iterations=50, seed=42)
+        self.pos = compute_layout(self.graph, start_state=self.dfa.start_state, k=2.5)
     
     def draw_dfa(self):
         """Draw the DFA with current highlighting."""
@@ -333,6 +335,26 @@ class InteractiveDebuggerWindow(QMainWindow):
         run_btn.clicked.connect(self.run_debug)
         input_layout.addWidget(run_btn)
         
+        # One-click witness strings
+        witness_layout = QHBoxLayout()
+        
+        accepted_btn = QPushButton('Shortest ✓')
+        accepted_btn.setToolTip('Debug the shortest accepted string')
+        accepted_btn.clicked.connect(self.debug_shortest_accepted)
+        witness_layout.addWidget(accepted_btn)
+        
+        rejected_btn = QPushButton('Shortest ✗')
+        rejected_btn.setToolTip('Debug the shortest rejected string')
+        rejected_btn.clicked.connect(self.debug_shortest_rejected)
+        witness_layout.addWidget(rejected_btn)
+        
+        reach_btn = QPushButton('Reach State...')
+        reach_btn.setToolTip('Debug the shortest string reaching a chosen state')
+        reach_btn.clicked.connect(self.debug_shortest_to_state)
+        witness_layout.addWidget(reach_btn)
+        
+        input_layout.addLayout(witness_layout)
+        
         input_group.setLayout(input_layout)
         left_panel.addWidget(input_group)
         
@@ -627,6 +649,40 @@ class InteractiveDebuggerWindow(QMainWindow):
         except ValueError as e:
             QMessageBox.warning(self, 'Invalid Input', str(e))
     
+    def debug_witness(self, witness, missing_message):
+        """Put a witness string in the input field and start debugging it."""
+        if witness is None:
+            QMessageBox.information(self, 'No Such String', missing_message)
+            return
+        self.input_field.setText(witness)
+        self.run_debug()
+    
+    def debug_shortest_accepted(self):
+        """Debug the shortest string the DFA accepts."""
+        if self.dfa is None:
+            QMessageBox.warning(self, 'Warning', 'Please load a DFA first.')
+            return
+        self.debug_witness(shortest_accepted(self.dfa), 'The DFA accepts no strings.')
+    
+    def debug_shortest_rejected(self):
+        """Debug the shortest string the DFA rejects."""
+        if self.dfa is None:
+            QMessageBox.warning(self, 'Warning', 'Please load a DFA first.')
+            return
+        self.debug_witness(shortest_rejected(self.dfa), 'The DFA accepts every string.')
+    
+    def debug_shortest_to_state(self):
+        """Ask for a state and debug the shortest string reaching it."""
+        if self.dfa is None:
+            QMessageBox.warning(self, 'Warning', 'Please load a DFA first.')
+            return
+        state, ok = QInputDialog.getItem(
+            self, 'Reach State', 'Target state:', sorted(self.dfa.states), 0, False
+        )
+        if ok:
+            self.debug_witness(shortest_string_to(self.dfa, state),
+                               f"State '{state}' is unreachable from the start state.")
+    
     def next_step(self):
         """Move to next step in execution."""
         if not self.trace_steps or self.current_step_index >= len(self.trace_steps) - 1:
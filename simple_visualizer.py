@@ -9,6 +9,7 @@ from matplotlib.figure import Figure
 from PyQt5.QtWidgets import QApplication, QMainWindow, QVBoxLayout, QWidget, QPushButton
 
 from dfa import create_even_a_dfa
+from dfa_layout import compute_layout
 
 
 class SimpleDFACanvas(FigureCanvasQTAgg):
@@ -42,7 +43,7 @@ class SimpleDFACanvas(FigureCanvasQTAgg):
                 G.add_edge(state, next_state)
         
         # Layout
-        pos = nx.spring_layout(G, k=2, seed=42)
+        pos = compute_layout(G, start_state=dfa.start_state, k=2)
         
         # Separate node types
         regular = [n for n in G.nodes() 
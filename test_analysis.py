@@ -0,0 +1,117 @@
+"""
+Test script for structural DFA analysis
+"""
+from dfa import DFA, create_even_a_dfa
+from dfa_analysis import (analyze_structure, shortest_accepted, shortest_rejected,
+                          shortest_string_to)
+
+
+def _chain_dfa():
+    """Accepts 'x', 'xx' and 'xy'; 'dead' is a trap and 'island' is unreachable."""
+    states = ['s', 'a', 'b', 'dead', 'island']
+    transitions = {
+        ('s', 'x'): 'a', ('s', 'y'): 'dead',
+        ('a', 'x'): 'b', ('a', 'y'): 'b',
+        ('b', 'x'): 'dead', ('b', 'y'): 'dead',
+        ('dead', 'x'): 'dead', ('dead', 'y'): 'dead',
+        ('island', 'x'): 'a', ('island', 'y'): 'island',
+    }
+    return DFA(states, ['x', 'y'], transitions, 's', ['a', 'b'])
+
+
+def test_finite_language():
+    """Useless states and the longest string of a finite language."""
+    print("=" * 60)
+    print("TEST 1: Finite language")
+    print("=" * 60)
+
+    report = analyze_structure(_chain_dfa())
+    assert report.is_finite and not report.is_empty and not report.is_infinite
+    assert report.longest_length == 2
+    assert report.reachable_states == {'s', 'a', 'b', 'dead'}
+    assert report.coreachable_states == {'s', 'a', 'b', 'island'}
+    assert report.useful_states == {'s', 'a', 'b'}
+    assert report.unreachable_states == {'island'}
+    assert report.dead_states == {'dead'}
+    assert report.useless_states == {'dead', 'island'}
+    print(report.summary())
+    print("✓ Reachability, co-reachability and useless states")
+
+
+def test_infinite_and_empty():
+    """Cycles among useful states make a language infinite."""
+    print("\n" + "=" * 60)
+    print("TEST 2: Infinite and empty languages")
+    print("=" * 60)
+
+    report = analyze_structure(create_even_a_dfa())
+    assert report.is_infinite and report.longest_length is None
+    assert not report.useless_states
+    print(f"✓ {report}")
+
+    # A cycle through the dead state alone does not make the language infinite
+    report = analyze_structure(_chain_dfa())
+    assert report.is_finite
+    print("✓ Cycles outside the useful states are ignored")
+
+    empty = DFA(['q0', 'q1'], ['a'], {('q0', 'a'): 'q0', ('q1', 'a'): 'q1'}, 'q0', ['q1'])
+    report = analyze_structure(empty)
+    assert report.is_empty and report.is_finite and report.longest_length is None
+    assert report.dead_states == {'q0'} and report.unreachable_states == {'q1'}
+    print(f"✓ {report}")
+
+
+def test_caching():
+    """The report is computed once per DFA."""
+    print("\n" + "=" * 60)
+    print("TEST 3: Caching")
+    print("=" * 60)
+
+    dfa = _chain_dfa()
+    assert analyze_structure(dfa) is analyze_structure(dfa)
+    print("✓ Repeated calls return the cached report")
+
+    dfa.final_states.add('dead')
+    assert analyze_structure(dfa).is_infinite
+    print("✓ Changing the final states rebuilds the report")
+
+
+def test_witnesses():
+    """Shortest accepted, rejected and state-reaching strings."""
+    print("\n" + "=" * 60)
+    print("TEST 4: Witness strings")
+    print("=" * 60)
+
+    dfa = create_even_a_dfa()
+    assert shortest_accepted(dfa) == ''
+    assert shortest_rejected(dfa) == 'a'
+    assert shortest_string_to(dfa, 'q1') == 'a'
+    print("✓ Even number of a's: '' accepted, 'a' rejected")
+
+    dfa = _chain_dfa()
+    assert shortest_accepted(dfa) == 'x'
+    assert shortest_rejected(dfa) == ''
+    assert shortest_string_to(dfa, 'b') == 'xx'
+    assert shortest_string_to(dfa, 'dead') == 'y'
+    assert shortest_string_to(dfa, 'island') is None
+    print("✓ Ties broken alphabetically, unreachable states give None")
+
+    everything = DFA(['q0'], ['a'], {('q0', 'a'): 'q0'}, 'q0', ['q0'])
+    assert shortest_rejected(everything) is None
+    empty = DFA(['q0'], ['a'], {('q0', 'a'): 'q0'}, 'q0', [])
+    assert shortest_accepted(empty) is None
+    print("✓ None when no witness exists")
+
+    try:
+        shortest_string_to(dfa, 'missing')
+        assert False, "unknown state should fail"
+    except ValueError as e:
+        print(f"✓ {e}")
+
+
+if __name__ == '__main__':
+    test_finite_language()
+    test_infinite_and_empty()
+    test_caching()
+    test_witnesses()
+    print("\n✓ All analysis tests passed!")
@@ -0,0 +1,76 @@
+"""
+Test script for headless batch rendering of DFAs
+"""
+import os
+import subprocess
+import sys
+import tempfile
+
+from dfa import create_even_a_dfa
+from dfa_renderer import render_dfa, render_directory
+
+
+TEST_IMPORTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'TestImports')
+
+
+def test_renderer_is_headless():
+    """Importing the renderer must not pull in PyQt5."""
+    print("=" * 60)
+    print("TEST 1: Renderer does not import PyQt5")
+    print("=" * 60)
+
+    code = "import sys, dfa_renderer; print('PyQt5' in sys.modules)"
+    result = subprocess.run([sys.executable, '-c', code],
+                            cwd=os.path.dirname(os.path.abspath(__file__)),
+                            capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == 'False'
+    print("✓ dfa_renderer imported without PyQt5")
+
+
+def test_render_single_dfa():
+    """Render one DFA to PNG and SVG."""
+    print("\n" + "=" * 60)
+    print("TEST 2: Render a single DFA")
+    print("=" * 60)
+
+    dfa = create_even_a_dfa()
+    with tempfile.TemporaryDirectory() as tmp:
+        for ext in ('png', 'svg'):
+            filename = os.path.join(tmp, f'even_a.{ext}')
+            render_dfa(dfa, filename, highlighted_path=['q1'])
+            assert os.path.getsize(filename) > 0
+            print(f"✓ Rendered {ext.upper()} ({os.path.getsize(filename)} bytes)")
+
+
+def test_render_directory():
+    """Render the TestImports directory in parallel, reusing cached layouts."""
+    print("\n" + "=" * 60)
+    print("TEST 3: Batch render a directory")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        rendered, failed = render_directory(TEST_IMPORTS_DIR, tmp, fmt='png', workers=2)
+
+        assert 'even_a_dfa' in rendered
+        assert os.path.exists(rendered['even_a_dfa'])
+        assert 'invalid_syntax' in failed
+        assert 'invalid_missing_field' in failed
+        print(f"✓ Rendered {len(rendered)} DFA(s), {len(failed)} failed as expected")
+
+        cache_dir = os.path.join(tmp, '.layout_cache')
+        cached = os.listdir(cache_dir)
+        assert cached
+        print(f"✓ {len(cached)} layout(s) cached")
+
+        # Second run reuses the cached layouts
+        rendered_again, _ = render_directory(TEST_IMPORTS_DIR, tmp, fmt='svg', workers=2)
+        assert set(rendered_again) == set(rendered)
+        assert sorted(os.listdir(cache_dir)) == sorted(cached)
+        print("✓ Second run reused cached layouts")
+
+
+if __name__ == '__main__':
+    test_renderer_is_headless()
+    test_render_single_dfa()
+    test_render_directory()
+    print("\n✓ All batch rendering tests passed!")
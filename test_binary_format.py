@@ -0,0 +1,191 @@
+"""
+Test script for the compact binary DFA format
+"""
+import os
+import struct
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+from dfa import DFA, create_even_a_dfa, create_mod_n_dfa, is_accepted, trace_execution
+from dfa_binary import (
+    HEADER,
+    MappedDFA,
+    decode_dfa,
+    decode_dfa_tables,
+    encode_dfa,
+    export_dfa_binary,
+    import_dfa_binary,
+    load_dfa_mmap,
+)
+
+
+def _same_dfa(a, b):
+    """Return True if two DFAs have identical definitions."""
+    return (a.states == b.states and a.alphabet == b.alphabet and
+            a.transitions == b.transitions and a.start_state == b.start_state and
+            a.final_states == b.final_states)
+
+
+def test_round_trip():
+    """Export and import preserve the DFA exactly."""
+    print("=" * 60)
+    print("TEST 1: Binary round trip")
+    print("=" * 60)
+
+    dfa = create_even_a_dfa()
+    with tempfile.TemporaryDirectory() as tmp:
+        filename = os.path.join(tmp, 'even_a.dfab')
+        export_dfa_binary(dfa, filename)
+        loaded = import_dfa_binary(filename)
+
+    assert _same_dfa(dfa, loaded)
+    for s in ['', 'a', 'aa', 'abab', 'bbb']:
+        assert loaded.process(s) == dfa.process(s)
+    print("✓ Round trip preserved states, transitions and acceptance")
+
+    # Unicode names and a start state that is also final
+    dfa = DFA(['é', 'ß'], ['α', 'β'],
+              {('é', 'α'): 'ß', ('é', 'β'): 'é', ('ß', 'α'): 'é', ('ß', 'β'): 'ß'},
+              'ß', ['ß'])
+    assert _same_dfa(dfa, decode_dfa(encode_dfa(dfa)))
+    print("✓ Unicode names round trip")
+
+
+def test_layout():
+    """The encoded file follows the documented layout."""
+    print("\n" + "=" * 60)
+    print("TEST 2: File layout")
+    print("=" * 60)
+
+    n = 1000
+    dfa = create_mod_n_dfa(n)
+    data = encode_dfa(dfa)
+
+    magic, version, _, num_states, num_symbols, _, _, names_size = \
+        HEADER.unpack_from(data, 0)
+    assert magic == b'DFAB' and version == 1
+    assert (num_states, num_symbols) == (n, 2)
+
+    table_start = (HEADER.size + names_size + 7) // 8 * 8
+    assert len(data) == table_start + 4 * n * 2 + (n + 7) // 8
+    print(f"✓ {n} states encoded in {len(data)} bytes")
+
+    states, symbols, start, table, final_bits = decode_dfa_tables(data)
+    i = states.index('q7')
+    target = struct.unpack_from('<I', data, table_start + 4 * (i * 2 + symbols.index('1')))[0]
+    assert states[target] == dfa.transitions[('q7', '1')]
+    assert list(table[i * 2:i * 2 + 2]) == [states.index(dfa.transitions[('q7', c)])
+                                           for c in symbols]
+    assert states[start] == 'q0' and final_bits[states.index('q0') >> 3]
+    print("✓ Transition table is dense little-endian uint32, row per state")
+
+    assert encode_dfa(dfa) == data
+    print("✓ Encoding is deterministic")
+
+
+def test_invalid_files():
+    """Corrupt or foreign files are rejected with ValueError."""
+    print("\n" + "=" * 60)
+    print("TEST 3: Invalid files")
+    print("=" * 60)
+
+    data = encode_dfa(create_even_a_dfa())
+    bad_inputs = {
+        'wrong magic': b'JSON' + data[4:],
+        'truncated': data[:-3],
+        'too short': data[:10],
+        'bad target': data[:-5] + struct.pack('<I', 99) + data[-1:],
+    }
+    for label, bad in bad_inputs.items():
+        try:
+            decode_dfa(bad)
+            assert False, f"{label} should fail"
+        except ValueError as e:
+            print(f"✓ Rejected {label}: {e}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        filename = os.path.join(tmp, 'bad.dfab')
+        with open(filename, 'wb') as f:
+            f.write(data[:10])
+        try:
+            import_dfa_binary(filename)
+            assert False, "import should fail"
+        except ValueError as e:
+            assert filename in str(e)
+            print("✓ import_dfa_binary() reports the file name")
+
+
+def _count_accepted_mapped(filename, strings):
+    """Worker: map the DFA file and count accepted strings."""
+    with load_dfa_mmap(filename) as dfa:
+        return sum(dfa.process(s) for s in strings)
+
+
+def test_memory_mapped():
+    """Mapped DFAs simulate from the file without decoding state names."""
+    print("\n" + "=" * 60)
+    print("TEST 4: Memory-mapped loading")
+    print("=" * 60)
+
+    n = 3000
+    dfa = DFA([f"q{i}" for i in range(n)], ['0', '1'],
+              {(f"q{i}", c): f"q{(2 * i + int(c)) % n}" for i in range(n) for c in '01'},
+              'q0', [f"q{i}" for i in range(0, n, 3)])
+    strings = [format(i, 'b') for i in range(0, 20000, 7)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        filename = os.path.join(tmp, 'mod3000.dfab')
+        export_dfa_binary(dfa, filename)
+
+        with load_dfa_mmap(filename) as mapped:
+            assert isinstance(mapped.table, memoryview)
+            assert all(mapped.process(s) == dfa.process(s) for s in strings)
+            assert mapped._state_names is None
+            print("✓ process() ran from the mapping without decoding state names")
+
+            assert mapped.start_state == 'q0' and len(mapped.final_states) == n // 3
+            assert mapped.transitions[('q7', '1')] == 'q15'
+            assert len(mapped.transitions) == 2 * n
+            assert is_accepted(mapped, '110') == dfa.process('110')
+            steps = list(trace_execution(mapped, '101'))
+            assert steps[-1]['current_state'] == 'q5'
+            assert mapped.process_with_trace('11') == (True, ['q0', 'q1', 'q3'])
+            print("✓ DFA-compatible attributes work with is_accepted() and trace_execution()")
+
+            try:
+                mapped.process('012')
+                assert False, "invalid symbol should fail"
+            except ValueError:
+                print("✓ Invalid symbols raise ValueError")
+
+            assert mapped.to_dfa().transitions == dfa.transitions
+        assert mapped._mmap.closed
+        print("✓ Mapping closed on exit")
+
+        # Several processes map the same file
+        expected = sum(dfa.process(s) for s in strings)
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            results = list(executor.map(_count_accepted_mapped, [filename] * 4,
+                                        [strings] * 4))
+        assert results == [expected] * 4
+        print(f"✓ 4 worker processes shared the mapped file ({expected} accepted)")
+
+        # Corrupt targets are caught on request
+        with open(filename, 'r+b') as f:
+            data = bytearray(f.read())
+            struct.pack_into('<I', data, len(data) - (n + 7) // 8 - 4, n + 5)
+            f.seek(0)
+            f.write(data)
+        try:
+            MappedDFA(filename, check_targets=True)
+            assert False, "corrupt target should fail"
+        except ValueError as e:
+            print(f"✓ check_targets=True rejected: {e}")
+
+
+if __name__ == '__main__':
+    test_round_trip()
+    test_layout()
+    test_invalid_files()
+    test_memory_mapped()
+    print("\n✓ All binary format tests passed!")
@@ -0,0 +1,111 @@
+"""
+Test script for bulk loading a directory of DFA files
+"""
+import io
+import json
+import os
+import shutil
+import tempfile
+from contextlib import redirect_stdout
+
+from dfa import create_mod_n_dfa, export_dfa_to_json
+from dfa_binary import export_dfa_binary
+from dfa_bulk import format_error_report, load_dfa_directory
+
+
+TEST_IMPORTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'TestImports')
+
+
+def test_load_test_imports():
+    """Valid files load, invalid ones are reported with their cause."""
+    print("=" * 60)
+    print("TEST 1: Load TestImports")
+    print("=" * 60)
+
+    output = io.StringIO()
+    with redirect_stdout(output):
+        dfas, errors = load_dfa_directory(TEST_IMPORTS_DIR, workers=1)
+    assert output.getvalue() == ''
+    print("✓ No per-file output")
+
+    assert {'even_a_dfa', 'ends_with_ab', 'divisible_by_3'} <= set(dfas)
+    assert dfas['even_a_dfa'].process('aa')
+    print(f"✓ Loaded {len(dfas)} DFA(s)")
+
+    assert errors['invalid_syntax']['kind'] == 'syntax'
+    assert errors['invalid_syntax']['line'] == 1
+    assert errors['invalid_transition']['kind'] == 'invalid'
+    assert 'q0-a' in errors['invalid_transition']['message']
+    assert errors['invalid_missing_field']['kind'] == 'invalid'
+    print(format_error_report(errors))
+
+    parallel_dfas, parallel_errors = load_dfa_directory(TEST_IMPORTS_DIR, workers=2)
+    assert set(parallel_dfas) == set(dfas)
+    assert parallel_errors == errors
+    for name, dfa in dfas.items():
+        assert parallel_dfas[name].transitions == dfa.transitions
+    print("✓ Process pool gives the same result")
+
+
+def test_many_files():
+    """Hundreds of files, mixed JSON and binary."""
+    print("\n" + "=" * 60)
+    print("TEST 2: Many files")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        output = io.StringIO()
+        with redirect_stdout(output):
+            for n in range(2, 202):
+                dfa = create_mod_n_dfa(n)
+                if n % 2:
+                    export_dfa_binary(dfa, os.path.join(tmp, f'mod{n}.dfab'))
+                else:
+                    export_dfa_to_json(dfa, os.path.join(tmp, f'mod{n}.json'))
+        shutil.copy(os.path.join(TEST_IMPORTS_DIR, 'invalid_syntax.json'), tmp)
+        shutil.copy(os.path.join(tmp, 'mod2.json'), os.path.join(tmp, 'mod3.json'))
+        with open(os.path.join(tmp, 'notes.txt'), 'w') as f:
+            f.write('ignored')
+
+        dfas, errors = load_dfa_directory(tmp, workers=2)
+
+    assert len(dfas) == 199 and 'mod3' not in dfas
+    assert all(dfas[f'mod{n}'].process(format(n * 5, 'b')) for n in range(2, 202) if n != 3)
+    assert set(errors) == {'invalid_syntax', 'mod3'}
+    assert errors['mod3']['kind'] == 'duplicate'
+    assert 'mod3.dfab, mod3.json' in errors['mod3']['message']
+    print(f"✓ Loaded {len(dfas)} DFAs, {len(errors)} reported errors")
+
+
+def test_unexpected_content():
+    """Malformed values and clashing names do not abort the directory."""
+    print("\n" + "=" * 60)
+    print("TEST 3: Malformed files and duplicate names")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        with open(os.path.join(TEST_IMPORTS_DIR, 'even_a_dfa.json')) as f:
+            data = json.load(f)
+        data['start_state'] = [data['start_state']]
+        with open(os.path.join(tmp, 'list_start.json'), 'w') as f:
+            json.dump(data, f)
+        with redirect_stdout(io.StringIO()):
+            export_dfa_to_json(create_mod_n_dfa(3), os.path.join(tmp, 'mod.json'))
+            export_dfa_binary(create_mod_n_dfa(4), os.path.join(tmp, 'mod.dfab'))
+            export_dfa_to_json(create_mod_n_dfa(5), os.path.join(tmp, 'mod5.json'))
+
+        dfas, errors = load_dfa_directory(tmp, workers=1)
+
+    assert set(dfas) == {'mod5'} and set(errors) == {'list_start', 'mod'}
+    assert errors['list_start']['kind'] == 'invalid'
+    assert errors['mod']['kind'] == 'duplicate'
+    assert errors['mod']['path'].endswith('mod.dfab')
+    assert 'mod.dfab, mod.json' in errors['mod']['message']
+    print(format_error_report(errors))
+
+
+if __name__ == '__main__':
+    test_load_test_imports()
+    test_many_files()
+    test_unexpected_content()
+    print("\n✓ All bulk loading tests passed!")
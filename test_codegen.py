@@ -0,0 +1,107 @@
+"""
+Test script for the code generation engine
+"""
+from dfa import create_even_a_dfa, create_mod_n_dfa
+from dfa_codegen import compile_dfa, generate_source
+from dfa_frozen import FrozenDFA
+from dfa_index import clear_dfa_cache
+
+
+def test_same_results():
+    """The compiled engine agrees with the dict engine."""
+    print("=" * 60)
+    print("TEST 1: Same results as the dict engine")
+    print("=" * 60)
+
+    dfa = create_mod_n_dfa(13)
+    accepts = compile_dfa(dfa)
+    for n in range(500):
+        word = format(n, 'b')
+        expected = dfa.process(word)
+        assert dfa.process(word, engine='codegen') == accepts(word) == expected
+        assert accepts.state_names[accepts.run(word)] == dfa.process_with_trace(word)[1][-1]
+    assert dfa.process('', engine='codegen') and accepts('')
+    print("✓ 500 inputs agree, run() reaches the same state")
+
+    frozen = FrozenDFA.from_dfa(dfa)
+    assert compile_dfa(frozen)('1101') == dfa.process('1101')
+    print("✓ Works on a FrozenDFA")
+
+
+def test_caching():
+    """Functions are compiled once per DFA and shared by equal DFAs."""
+    print("\n" + "=" * 60)
+    print("TEST 2: Caching")
+    print("=" * 60)
+
+    dfa = create_even_a_dfa()
+    assert compile_dfa(dfa) is compile_dfa(dfa)
+    assert compile_dfa(create_even_a_dfa()) is compile_dfa(dfa)
+    print("✓ Equal DFAs share one compiled function")
+
+    dfa.final_states.add('q1')
+    accepts = compile_dfa(dfa)
+    assert accepts('a') and dfa.process('a', engine='codegen')
+    print("✓ Recompiled after the DFA changed")
+
+    source = generate_source(dfa)
+    assert source == accepts.source and "'q0'" in source
+    print(f"✓ Generated {len(source.splitlines())} lines of source")
+
+    # Same sizes as before: the DFA's containers are not tracked, so the
+    # edit is announced with clear_dfa_cache(); queries leave them alone
+    dfa = create_even_a_dfa()
+    transitions = dfa.transitions
+    assert dfa.process('aab', engine='codegen') and dfa.transitions is transitions
+    transitions[('q0', 'b')] = 'q1'
+    clear_dfa_cache(dfa)
+    assert not dfa.process('aab', engine='codegen')
+    print("✓ Recompiled after clear_dfa_cache()")
+
+    # With a result cache the containers are tracked and edits are noticed
+    dfa.enable_result_cache()
+    dfa.final_states.discard('q0')
+    dfa.final_states.add('q1')
+    assert dfa.process('aab', engine='codegen')
+    for word in ('', 'a', 'ab', 'ba', 'aab', 'bab'):
+        assert dfa.process(word, engine='codegen') == dfa.process(word)
+    print("✓ Recompiled after a tracked final state was replaced")
+
+
+def test_errors():
+    """Invalid symbols, engines and DFAs are reported."""
+    print("\n" + "=" * 60)
+    print("TEST 3: Errors")
+    print("=" * 60)
+
+    dfa = create_even_a_dfa()
+    try:
+        dfa.process('abc', engine='codegen')
+        assert False, "invalid symbol should fail"
+    except ValueError as e:
+        assert str(e) == "Symbol 'c' not in alphabet"
+        print(f"✓ {e}")
+
+    try:
+        dfa.process('ab', engine='jit')
+        assert False, "unknown engine should fail"
+    except ValueError as e:
+        print(f"✓ {e}")
+
+    try:
+        compile_dfa(create_mod_n_dfa(100), max_transitions=100)
+        assert False, "large DFA should fail"
+    except ValueError as e:
+        print(f"✓ {e}")
+
+    cache = dfa.enable_result_cache()
+    assert dfa.process('aa', engine='codegen') and dfa.process('aa')
+    assert cache.hits == 1
+    print("✓ Result cache is shared between engines")
+
+
+if __name__ == '__main__':
+    test_same_results()
+    test_caching()
+    test_errors()
+    print("\n✓ All codegen tests passed!")
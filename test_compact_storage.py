@@ -0,0 +1,107 @@
+"""
+Test script for compact DFA storage
+"""
+import os
+import sys
+import tempfile
+
+from dfa import (DFA, create_even_a_dfa, create_mod_n_dfa, export_dfa_to_json, import_dfa_from_json,
+                 is_accepted)
+from dfa_compact import CompactDFA
+from dfa_renderer import build_dfa_graph
+
+
+def test_conversion():
+    """from_dfa() keeps the language and the dict-style attributes."""
+    print("=" * 60)
+    print("TEST 1: Conversion from DFA")
+    print("=" * 60)
+
+    dfa = create_mod_n_dfa(11)
+    compact = CompactDFA.from_dfa(dfa)
+    for n in range(300):
+        word = format(n, 'b')
+        assert compact.process(word) == dfa.process(word) == is_accepted(compact, word)
+
+    assert compact.states == dfa.states and len(compact.states) == 11
+    assert compact.final_states == dfa.final_states == {'q0'}
+    assert 'q0' in compact.final_states and 'q1' not in compact.final_states
+    assert 'missing' not in compact.states and ['unhashable'] not in compact.final_states
+    assert compact.transitions[('q3', '1')] == dfa.transitions[('q3', '1')]
+    assert dict(compact.transitions) == dfa.transitions
+    assert compact.to_dfa().transitions == dfa.transitions
+    print("✓ Same language, states, final states and transitions")
+
+    assert all(sys.intern(name) is name for name in compact.state_names)
+    try:
+        compact.extra = 1
+        assert False, "__slots__ should reject new attributes"
+    except AttributeError:
+        pass
+    print("✓ Interned names and __slots__")
+
+
+def test_consumers():
+    """Code written for DFA works unchanged on a CompactDFA."""
+    print("\n" + "=" * 60)
+    print("TEST 2: Renderer and JSON export")
+    print("=" * 60)
+
+    compact = CompactDFA.from_dfa(create_even_a_dfa())
+    G, _ = build_dfa_graph(compact)
+    assert set(G.nodes()) == {'q0', 'q1'}
+    print("✓ Renderer builds the graph from the views")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'compact.json')
+        export_dfa_to_json(compact, path)
+        assert import_dfa_from_json(path).transitions == dict(compact.transitions)
+    print("✓ JSON export round trip")
+
+
+def test_memory():
+    """Compact storage is several times smaller than the dict."""
+    print("\n" + "=" * 60)
+    print("TEST 3: Memory use")
+    print("=" * 60)
+
+    n = 5000
+    symbols = '01234567'
+    names = [f"q{i}" for i in range(n)]
+    dfa = DFA.from_trusted(set(names), set(symbols),
+                           {(names[i], c): names[(8 * i + int(c)) % n]
+                            for i in range(n) for c in symbols},
+                           names[0], {names[0]})
+    compact = CompactDFA.from_dfa(dfa)
+
+    # The dict's hash table and its (state, symbol) key tuples, against the
+    # flat transition table and final-state bitmap; state names are shared
+    dict_bytes = (sys.getsizeof(dfa.transitions)
+                  + sum(sys.getsizeof(key) for key in dfa.transitions)) / (8 * n)
+    compact_bytes = (sys.getsizeof(compact.table) + sys.getsizeof(compact.final_bits)) / (8 * n)
+    assert compact_bytes * 3 < dict_bytes
+    assert compact.process('17' * 50) == dfa.process('17' * 50)
+    print(f"✓ {dict_bytes:.0f} bytes per transition as a dict, {compact_bytes:.0f} compact")
+
+
+def test_errors():
+    """Incomplete DFAs cannot be converted."""
+    print("\n" + "=" * 60)
+    print("TEST 4: Errors")
+    print("=" * 60)
+
+    dfa = DFA(['q0', 'q1'], ['a'], {('q0', 'a'): 'q1', ('q1', 'a'): 'q0'}, 'q0', ['q1'])
+    del dfa.transitions[('q1', 'a')]
+    try:
+        CompactDFA.from_dfa(dfa)
+        assert False, "incomplete DFA should fail"
+    except ValueError as e:
+        print(f"✓ {e}")
+
+
+if __name__ == '__main__':
+    test_conversion()
+    test_consumers()
+    test_memory()
+    test_errors()
+    print("\n✓ All compact storage tests passed!")
@@ -0,0 +1,141 @@
+"""
+Test script for compressed DFA files
+"""
+import os
+import tempfile
+
+from dfa import create_mod_n_dfa, export_dfa_to_json, import_dfa_from_json
+from dfa_binary import export_dfa_binary, import_dfa_binary, load_dfa_mmap
+from dfa_bulk import load_dfa_directory, load_dfa_file
+from dfa_compression import detect_compression, zstd
+from dfa_import_cache import DFAImportCache
+from dfa_stream import import_dfa_from_json_stream
+
+
+def test_json_round_trip():
+    """Compressed JSON is written by extension and read by magic bytes."""
+    print("=" * 60)
+    print("TEST 1: Compressed JSON")
+    print("=" * 60)
+
+    dfa = create_mod_n_dfa(500)
+    with tempfile.TemporaryDirectory() as tmp:
+        plain = os.path.join(tmp, 'mod.json')
+        export_dfa_to_json(dfa, plain)
+        plain_size = os.path.getsize(plain)
+
+        for ext, fmt in (('gz', 'gzip'), ('bz2', 'bz2'), ('xz', 'xz')):
+            path = os.path.join(tmp, f'mod.json.{ext}')
+            export_dfa_to_json(dfa, path)
+            with open(path, 'rb') as f:
+                assert detect_compression(f.read(6)) == fmt
+
+            assert import_dfa_from_json(path).transitions == dfa.transitions
+            assert dict(import_dfa_from_json_stream(path).transitions) == dfa.transitions
+            size = os.path.getsize(path)
+            print(f"✓ {fmt}: {size} bytes ({plain_size / size:.0f}x smaller)")
+
+        # Detection does not depend on the file name
+        disguised = os.path.join(tmp, 'disguised.json')
+        export_dfa_to_json(dfa, disguised, compression='gzip')
+        assert import_dfa_from_json(disguised).transitions == dfa.transitions
+        print("✓ Compression detected from magic bytes, not the extension")
+
+
+def test_binary_round_trip():
+    """The binary format can be compressed too, but not memory-mapped."""
+    print("\n" + "=" * 60)
+    print("TEST 2: Compressed binary files")
+    print("=" * 60)
+
+    dfa = create_mod_n_dfa(500)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'mod.dfab.xz')
+        export_dfa_binary(dfa, path)
+        assert import_dfa_binary(path).transitions == dfa.transitions
+        print("✓ xz-compressed binary round trip")
+
+        try:
+            load_dfa_mmap(path)
+            assert False, "compressed files cannot be mapped"
+        except ValueError as e:
+            print(f"✓ {e}")
+
+
+def test_loaders():
+    """The import cache and bulk loader read compressed files."""
+    print("\n" + "=" * 60)
+    print("TEST 3: Cache and bulk loading")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        export_dfa_to_json(create_mod_n_dfa(3), os.path.join(tmp, 'mod3.json.gz'))
+        export_dfa_binary(create_mod_n_dfa(5), os.path.join(tmp, 'mod5.dfab.bz2'))
+
+        dfas, errors = load_dfa_directory(tmp, workers=1)
+        assert set(dfas) == {'mod3', 'mod5'} and not errors
+        assert dfas['mod3'].process('110') and dfas['mod5'].process('101')
+        print("✓ Bulk loader strips compression extensions")
+
+        path = os.path.join(tmp, 'mod3.json.gz')
+        for key in ('stat', 'content'):
+            cache = DFAImportCache(key=key)
+            assert cache.load(path) is cache.load(path)
+            assert cache.load(path).transitions == create_mod_n_dfa(3).transitions
+        print("✓ Import cache decompresses while parsing")
+
+
+def test_errors():
+    """Corrupt streams and unavailable formats raise clear errors."""
+    print("\n" + "=" * 60)
+    print("TEST 4: Errors")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'mod.json.gz')
+        export_dfa_to_json(create_mod_n_dfa(50), path)
+        with open(path, 'rb') as f:
+            data = f.read()
+        with open(path, 'wb') as f:
+            f.write(data[:len(data) // 2])
+        try:
+            import_dfa_from_json(path)
+            assert False, "truncated file should fail"
+        except IOError as e:
+            print(f"✓ Truncated gzip: {e}")
+        try:
+            DFAImportCache().load(path)
+            assert False, "truncated file should fail"
+        except IOError as e:
+            print(f"✓ Import cache: {e}")
+        dfa, error = load_dfa_file(path)
+        assert dfa is None and error['kind'] == 'io'
+        print("✓ Bulk loader reports an I/O error")
+
+        path = os.path.join(tmp, 'mod.json.zst')
+        if zstd is None:
+            try:
+                export_dfa_to_json(create_mod_n_dfa(3), path)
+                assert False, "zstd should be unavailable"
+            except ValueError as e:
+                print(f"✓ {e}")
+        else:
+            export_dfa_to_json(create_mod_n_dfa(3), path)
+            assert import_dfa_from_json(path).process('11')
+            print("✓ zstd round trip")
+
+            with open(path, 'rb') as f:
+                data = f.read()
+            with open(path, 'wb') as f:
+                f.write(data[:len(data) // 2])
+            dfa, error = load_dfa_file(path)
+            assert dfa is None and error['kind'] == 'io'
+            print("✓ Truncated zstd: I/O error")
+
+
+if __name__ == '__main__':
+    test_json_round_trip()
+    test_binary_round_trip()
+    test_loaders()
+    test_errors()
+    print("\n✓ All compression tests passed!")
@@ -0,0 +1,113 @@
+"""
+Test script for transition coverage
+"""
+import os
+import tempfile
+
+from dfa import DFA, create_even_a_dfa
+from dfa_coverage import TransitionCoverage, measure_coverage
+from dfa_renderer import render_dfa
+
+
+def _unused_state_dfa():
+    """Even number of a's, plus a state 'q2' that only 'b' from 'q1' reaches."""
+    return DFA(['q0', 'q1', 'q2'], ['a', 'b'],
+               {('q0', 'a'): 'q1', ('q0', 'b'): 'q0',
+                ('q1', 'a'): 'q0', ('q1', 'b'): 'q2',
+                ('q2', 'a'): 'q2', ('q2', 'b'): 'q2'},
+               'q0', ['q0'])
+
+
+def test_counts():
+    """Hit counts, unvisited transitions and unreached states."""
+    print("=" * 60)
+    print("TEST 1: Hit counts")
+    print("=" * 60)
+
+    dfa = _unused_state_dfa()
+    coverage = measure_coverage(dfa, ['aa', 'ab', 'b', ''])
+    assert coverage.hits('q0', 'a') == 2 and coverage.hits('q1', 'a') == 1
+    assert coverage.hits('q0', 'b') == 1 and coverage.hits('q1', 'b') == 1
+    assert coverage.inputs == 4 and coverage.symbols_processed == 5
+    assert coverage.unvisited_transitions == [('q2', 'a'), ('q2', 'b')]
+    assert coverage.unreached_states == set()
+    assert coverage.coverage == 4 / 6
+    print(f"✓ {coverage!r}")
+
+    coverage = measure_coverage(dfa, ['aa', 'bba'])
+    assert coverage.unreached_states == {'q2'}
+    assert list(coverage.state_visits) == [5, 2, 0]
+    assert coverage.edge_counts() == {('q0', 'q1'): 2, ('q0', 'q0'): 2,
+                                      ('q1', 'q0'): 1, ('q1', 'q2'): 0,
+                                      ('q2', 'q2'): 0}
+    print(coverage.summary())
+
+
+def test_modes_agree():
+    """Single, streaming and vectorized runs give the same counts."""
+    print("\n" + "=" * 60)
+    print("TEST 2: Single, streaming and batch modes")
+    print("=" * 60)
+
+    dfa = create_even_a_dfa()
+    corpus = ['abba' * n + 'a' * (n % 3) for n in range(50)]
+
+    batch = measure_coverage(dfa, corpus, batch_size=8)
+    single = TransitionCoverage(dfa)
+    streamed = TransitionCoverage(dfa)
+    for word in corpus:
+        single.add(word)
+        streamed.add_stream([word[:3], word[3:].encode()])
+    assert (batch.counts == single.counts).all() and (batch.counts == streamed.counts).all()
+    assert batch.symbols_processed == single.symbols_processed == sum(map(len, corpus))
+    print(f"✓ {batch.symbols_processed} transitions counted the same way three times")
+
+    words = DFA(['q0', 'q1'], ['ab', 'c'],
+                {('q0', 'ab'): 'q1', ('q0', 'c'): 'q0', ('q1', 'ab'): 'q0', ('q1', 'c'): 'q1'},
+                'q0', ['q0'])
+    coverage = measure_coverage(words, [['ab', 'c'], ['c']])
+    assert coverage.hits('q0', 'ab') == 1 and coverage.hits('q0', 'c') == 1
+    print("✓ Multi-character symbols fall back to the per-symbol loop")
+
+
+def test_invalid_inputs():
+    """Inputs with bad symbols count up to the bad symbol."""
+    print("\n" + "=" * 60)
+    print("TEST 3: Invalid inputs")
+    print("=" * 60)
+
+    dfa = create_even_a_dfa()
+    batch = measure_coverage(dfa, ['abxa', 'a'])
+    single = TransitionCoverage(dfa)
+    single.add('abxa')
+    single.add('a')
+    for coverage in (batch, single):
+        assert coverage.invalid_inputs == 1 and coverage.symbols_processed == 3
+        assert coverage.hits('q0', 'a') == 2 and coverage.hits('q1', 'b') == 1
+    print("✓ 'abxa' counts 'ab' and is reported as invalid")
+
+
+def test_heat_map():
+    """Coverage counts can be drawn as a heat map."""
+    print("\n" + "=" * 60)
+    print("TEST 4: Heat map rendering")
+    print("=" * 60)
+
+    dfa = _unused_state_dfa()
+    coverage = measure_coverage(dfa, ['aa', 'bab', 'aaaa'])
+    edges = coverage.edge_counts()
+    assert edges[('q0', 'q1')] == 4 and edges[('q2', 'q2')] == 0
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'coverage.png')
+        render_dfa(dfa, path, edge_counts=edges)
+        assert os.path.getsize(path) > 0
+    print("✓ Rendered heat map with untaken edges")
+
+
+if __name__ == '__main__':
+    test_counts()
+    test_modes_agree()
+    test_invalid_inputs()
+    test_heat_map()
+    print("\n✓ All coverage tests passed!")
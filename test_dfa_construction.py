@@ -0,0 +1,107 @@
+"""
+Test script for trusted and lazily validated DFA construction
+"""
+import time
+
+from dfa import (DFA, create_even_a_dfa, create_mod_n_dfa, import_dfa_from_json, is_accepted,
+                 trace_execution)
+
+
+def _definition(dfa):
+    """Return the five components of a DFA's definition."""
+    return dfa.states, dfa.alphabet, dfa.transitions, dfa.start_state, dfa.final_states
+
+
+def test_from_trusted():
+    """from_trusted() neither copies nor validates its inputs."""
+    print("=" * 60)
+    print("TEST 1: Trusted construction")
+    print("=" * 60)
+
+    states, alphabet, transitions, start, finals = _definition(create_mod_n_dfa(5))
+    dfa = DFA.from_trusted(states, alphabet, transitions, start, finals)
+    assert dfa.states is states and dfa.final_states is finals
+    assert dfa.validated
+    assert dfa.process('101') == (5 % 5 == 0)
+    print("✓ Inputs used as-is, DFA ready to run")
+
+    # Validation is still available on demand
+    broken = DFA.from_trusted({'q0'}, {'a'}, {}, 'q0', set())
+    try:
+        broken.validate()
+        assert False, "validate() should report the missing transition"
+    except ValueError as e:
+        print(f"✓ validate() on demand: {e}")
+
+    dfa = create_even_a_dfa()
+    assert dfa.validated and dfa.process('aa') and not dfa.process('a')
+    print("✓ create_even_a_dfa() uses the trusted path")
+
+
+def test_lazy_validation():
+    """lazy=True defers validation until first use."""
+    print("\n" + "=" * 60)
+    print("TEST 2: Lazy validation")
+    print("=" * 60)
+
+    dfa = DFA({'q0', 'q1'}, {'a'}, {('q0', 'a'): 'q1'}, 'q0', {'q1'}, lazy=True)
+    assert not dfa.validated
+    print("✓ Construction succeeded without validating")
+
+    for use in (lambda: dfa.process('a'),
+                lambda: is_accepted(dfa, 'a'),
+                lambda: list(trace_execution(dfa, 'a'))):
+        try:
+            use()
+            assert False, "first use should validate"
+        except ValueError as e:
+            message = str(e)
+    print(f"✓ First use validates: {message}")
+
+    dfa = DFA({'q0'}, {'a'}, {('q0', 'a'): 'q0'}, 'q0', {'q0'}, lazy=True)
+    assert dfa.process('aaa') and dfa.validated
+    print("✓ Valid lazy DFA runs and is marked validated")
+
+
+def test_construction_speed():
+    """Trusted construction is much faster than the validating constructor."""
+    print("\n" + "=" * 60)
+    print("TEST 3: Construction time")
+    print("=" * 60)
+
+    states, alphabet, transitions, start, finals = _definition(create_mod_n_dfa(100000))
+
+    begin = time.perf_counter()
+    DFA(states, alphabet, transitions, start, finals)
+    validating = time.perf_counter() - begin
+
+    begin = time.perf_counter()
+    DFA.from_trusted(states, alphabet, transitions, start, finals)
+    trusted = time.perf_counter() - begin
+
+    assert trusted * 10 < validating
+    print(f"✓ 100000 states: {validating * 1000:.1f} ms validating, "
+          f"{trusted * 1000:.3f} ms trusted")
+
+
+def test_import_still_validates():
+    """JSON import validates exactly once and still rejects bad files."""
+    print("\n" + "=" * 60)
+    print("TEST 4: JSON import validation")
+    print("=" * 60)
+
+    dfa = import_dfa_from_json('TestImports/even_a_dfa.json')
+    assert dfa.validated
+    try:
+        import_dfa_from_json('TestImports/invalid_transition.json')
+        assert False, "invalid file should fail"
+    except ValueError as e:
+        print(f"✓ Invalid file rejected: {e}")
+
+
+if __name__ == '__main__':
+    test_from_trusted()
+    test_lazy_validation()
+    test_construction_speed()
+    test_import_still_validates()
+    print("\n✓ All DFA construction tests passed!")
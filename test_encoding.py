@@ -0,0 +1,117 @@
+"""
+Test script for symbol encoding and the engines built on it
+"""
+from dfa import DFA, create_even_a_dfa, create_mod_n_dfa, is_accepted
+from dfa_batch import process_batch, process_stream
+from dfa_compact import CompactDFA
+from dfa_encoding import INVALID, SymbolEncoder, make_encoder, symbol_encoder
+from dfa_index import clear_dfa_cache
+
+
+def test_encoder():
+    """Strings and bytes encode to symbol ids, unknown characters to INVALID."""
+    print("=" * 60)
+    print("TEST 1: Encoder")
+    print("=" * 60)
+
+    encoder = SymbolEncoder('ab')
+    assert encoder.encode('abba') == bytes([0, 1, 1, 0])
+    assert encoder.encode(b'abba') == bytes([0, 1, 1, 0])
+    assert encoder.encode('abxé') == bytes([0, 1, INVALID, INVALID])
+    assert encoder.first_invalid('abxé', encoder.encode('abxé')) == (2, 'x')
+    assert encoder.first_invalid(b'a\xe9', encoder.encode(b'a\xe9')) == (1, 'é')
+    assert encoder.first_invalid('abba', encoder.encode('abba')) is None
+    print("✓ ASCII alphabet")
+
+    encoder = SymbolEncoder(['α', 'β', 'a'])
+    assert encoder.encode('aβαz') == bytes([2, 1, 0, INVALID])
+    print("✓ Non-ASCII alphabet")
+
+    assert make_encoder(['ab', 'c']) is None
+    assert make_encoder([chr(i) for i in range(300)]) is None
+    try:
+        SymbolEncoder(['ab'])
+        assert False, "multi-character symbol should fail"
+    except ValueError as e:
+        print(f"✓ {e}")
+
+    dfa = create_even_a_dfa()
+    assert symbol_encoder(dfa) is symbol_encoder(dfa)
+    dfa.alphabet.add('c')
+    assert symbol_encoder(dfa).symbols == ('a', 'b', 'c')
+    print("✓ Cached per DFA and rebuilt when the alphabet changes")
+
+
+def test_engines_agree():
+    """Every engine gives the same answers as the dict loop."""
+    print("\n" + "=" * 60)
+    print("TEST 2: Engines agree")
+    print("=" * 60)
+
+    dfa = create_mod_n_dfa(13)
+    compact = CompactDFA.from_dfa(dfa)
+    words = [format(n, 'b') for n in range(600)] + ['']
+    expected = [dfa.process(word) for word in words]
+
+    assert [dfa.process(word, engine='translate') for word in words] == expected
+    assert [is_accepted(dfa, word) for word in words] == expected
+    assert [compact.process(word) for word in words] == expected
+    assert [compact.process(word.encode()) for word in words] == expected
+    assert list(process_batch(dfa, words, batch_size=64)) == expected
+    assert list(process_batch(compact, [word.encode() for word in words])) == expected
+    print(f"✓ translate, is_accepted, CompactDFA and process_batch on {len(words)} inputs")
+
+    word = format(123456789 * 13, 'b')
+    assert process_stream(dfa, [word[:7], word[7:15].encode(), '', word[15:]])
+    assert not process_stream(dfa, iter(['1', '1']))
+    print("✓ process_stream across chunks")
+
+    dfa = create_even_a_dfa()
+    assert dfa.process('aab', engine='translate')
+    dfa.transitions[('q0', 'b')] = 'q1'
+    clear_dfa_cache(dfa)
+    assert not dfa.process('aab', engine='translate')
+    dfa.enable_result_cache()
+    dfa.final_states.discard('q0')
+    dfa.final_states.add('q1')
+    assert dfa.process('aab', engine='translate') and process_stream(dfa, ['aa', 'b'])
+    print("✓ translate and process_stream follow edits of the DFA")
+
+
+def test_error_positions():
+    """The first invalid symbol is reported with its position."""
+    print("\n" + "=" * 60)
+    print("TEST 3: Error positions")
+    print("=" * 60)
+
+    dfa = create_even_a_dfa()
+    cases = [
+        (lambda: is_accepted(dfa, 'abca'), "Invalid symbol 'c' at position 2."),
+        (lambda: is_accepted(dfa, 'ab' * 10 + 'c'), "Invalid symbol 'c' at position 20."),
+        (lambda: dfa.process('abca', engine='translate'), "Symbol 'c' not in alphabet"),
+        (lambda: CompactDFA.from_dfa(dfa).process('ab!'), "Symbol '!' not in alphabet"),
+        (lambda: process_batch(dfa, ['ab', 'bbz']), "Invalid symbol 'z' at position 2 of input 1."),
+        (lambda: process_stream(dfa, ['aa', 'bd']), "Invalid symbol 'd' at position 3."),
+    ]
+    for run, message in cases:
+        try:
+            run()
+            assert False, "invalid symbol should fail"
+        except ValueError as e:
+            assert str(e).startswith(message), str(e)
+            print(f"✓ {e}")
+
+    words = DFA(['q0'], ['ab'], {('q0', 'ab'): 'q0'}, 'q0', ['q0'])
+    assert is_accepted(words, ['ab', 'ab'])
+    try:
+        process_batch(words, ['ab'])
+        assert False, "multi-character alphabet should fail"
+    except ValueError as e:
+        print(f"✓ {e}")
+
+
+if __name__ == '__main__':
+    test_encoder()
+    test_engines_agree()
+    test_error_positions()
+    print("\n✓ All encoding tests passed!")
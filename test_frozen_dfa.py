@@ -0,0 +1,112 @@
+"""
+Test script for immutable FrozenDFA
+"""
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+
+from dfa import create_even_a_dfa, create_mod_n_dfa, is_accepted, trace_execution
+from dfa_compact import CompactDFA
+from dfa_frozen import FrozenDFA
+
+
+def test_behaves_like_dfa():
+    """A frozen DFA accepts the same strings as the original."""
+    print("=" * 60)
+    print("TEST 1: Same behaviour as DFA")
+    print("=" * 60)
+
+    dfa = create_mod_n_dfa(7)
+    frozen = FrozenDFA.from_dfa(dfa)
+    for n in range(200):
+        word = format(n, 'b')
+        assert frozen.process(word) == dfa.process(word) == is_accepted(frozen, word)
+    assert frozen.process_with_trace('111') == dfa.process_with_trace('111')
+    assert len(list(trace_execution(frozen, '1110'))) == 6
+    assert dict(frozen.transitions) == dfa.transitions
+    assert frozen.states == dfa.states and frozen.final_states == dfa.final_states
+    assert frozen.to_dfa().transitions == dfa.transitions
+    assert isinstance(frozen, CompactDFA) and frozen.start_state == 'q0'
+    assert frozen.process(b'111') and frozen.process('111' * 10)
+    print(f"✓ {frozen!r} matches its DFA")
+
+
+def test_immutability():
+    """Attributes and containers cannot be changed."""
+    print("\n" + "=" * 60)
+    print("TEST 2: Immutability")
+    print("=" * 60)
+
+    frozen = FrozenDFA.from_dfa(create_even_a_dfa())
+    for attempt in (lambda: setattr(frozen, 'start_state', 'q1'),
+                    lambda: setattr(frozen, 'extra', 1),
+                    lambda: delattr(frozen, 'table')):
+        try:
+            attempt()
+            assert False, "FrozenDFA should be immutable"
+        except AttributeError:
+            pass
+    print("✓ Attributes cannot be set or deleted")
+
+    for attempt in (lambda: frozen.final_states.add('q1'),
+                    lambda: frozen.transitions.__setitem__(('q0', 'a'), 'q0'),
+                    lambda: frozen.symbol_index.__setitem__('c', 2),
+                    lambda: frozen.state_index.__setitem__('q2', 2)):
+        try:
+            attempt()
+            assert False, "containers should be read-only"
+        except (AttributeError, TypeError):
+            pass
+    print("✓ Containers are read-only")
+
+
+def test_hashing():
+    """Equal DFAs hash equally, regardless of how they were built."""
+    print("\n" + "=" * 60)
+    print("TEST 3: Canonical hash")
+    print("=" * 60)
+
+    a = FrozenDFA.from_dfa(create_even_a_dfa())
+    b = FrozenDFA(['q1', 'q0'], 'ba',
+                  {('q1', 'b'): 'q1', ('q1', 'a'): 'q0', ('q0', 'b'): 'q0', ('q0', 'a'): 'q1'},
+                  'q0', {'q0'})
+    assert a == b and hash(a) == hash(b) and a.fingerprint == b.fingerprint
+    cache = {a: 'layout'}
+    assert cache[b] == 'layout'
+    print(f"✓ Construction order does not matter: {a.fingerprint}")
+
+    c = FrozenDFA(a.states, a.alphabet, a.transitions, 'q1', a.final_states)
+    assert c != a and c.fingerprint != a.fingerprint
+    print("✓ Different start state, different fingerprint")
+
+    copy = pickle.loads(pickle.dumps(a))
+    assert copy == a and copy.fingerprint == a.fingerprint
+    assert FrozenDFA.from_dfa(a) is a
+    print("✓ Pickle round trip")
+
+
+def test_sharing_and_errors():
+    """Threads share one frozen DFA; malformed DFAs are rejected."""
+    print("\n" + "=" * 60)
+    print("TEST 4: Thread sharing and errors")
+    print("=" * 60)
+
+    frozen = FrozenDFA.from_dfa(create_mod_n_dfa(3))
+    words = [format(n, 'b') for n in range(3000)]
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(frozen.process, words))
+    assert results == [n % 3 == 0 for n in range(3000)]
+    print("✓ 4 threads share one FrozenDFA")
+
+    try:
+        FrozenDFA(['q0'], ['a'], {}, 'q0', [])
+        assert False, "incomplete DFA should fail"
+    except ValueError as e:
+        print(f"✓ {e}")
+
+
+if __name__ == '__main__':
+    test_behaves_like_dfa()
+    test_immutability()
+    test_hashing()
+    test_sharing_and_errors()
+    print("\n✓ All frozen DFA tests passed!")
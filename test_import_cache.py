@@ -0,0 +1,162 @@
+"""
+Test script for the DFA import cache
+"""
+import os
+import shutil
+import tempfile
+import time
+
+from dfa import create_mod_n_dfa, export_dfa_to_json
+from dfa_binary import export_dfa_binary
+from dfa_import_cache import DFAImportCache, estimate_dfa_size
+
+
+TEST_IMPORTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'TestImports')
+
+
+def test_cache_hits():
+    """Repeated loads of an unchanged file return the same frozen DFA."""
+    print("=" * 60)
+    print("TEST 1: Cache hits")
+    print("=" * 60)
+
+    cache = DFAImportCache()
+    path = os.path.join(TEST_IMPORTS_DIR, 'even_a_dfa.json')
+
+    first = cache.load(path)
+    second = cache.load(path)
+    assert first is second
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert first.process('aa') and not first.process('a')
+    print("✓ Second load returned the shared DFA")
+
+    try:
+        first.transitions[('q0', 'a')] = 'q0'
+        assert False, "cached transitions must be read-only"
+    except TypeError:
+        pass
+    assert isinstance(first.states, frozenset) and isinstance(first.final_states, frozenset)
+    for attempt in (lambda: setattr(first, 'start_state', 'q1'),
+                    first.enable_prefix_cache, first.enable_result_cache):
+        try:
+            attempt()
+            assert False, "cached DFA must not be modified"
+        except TypeError:
+            pass
+    assert first.prefix_cache is None and first.result_cache is None
+    print("✓ Cached DFA is immutable and takes no caches")
+
+    copy = first.to_dfa()
+    copy.enable_result_cache()
+    copy.transitions[('q0', 'b')] = 'q1'
+    assert not copy.process('b') and first.process('b')
+    print("✓ to_dfa() gives a private copy")
+
+    for name in ('invalid_syntax.json', 'invalid_transition.json'):
+        try:
+            cache.load(os.path.join(TEST_IMPORTS_DIR, name))
+            assert False, f"{name} should fail"
+        except ValueError:
+            pass
+    assert len(cache) == 1
+    print("✓ Invalid files raise and are not cached")
+
+
+def test_invalidation():
+    """Modified files are reloaded; content keys share identical files."""
+    print("\n" + "=" * 60)
+    print("TEST 2: Invalidation and content keys")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'dfa.json')
+        shutil.copy(os.path.join(TEST_IMPORTS_DIR, 'even_a_dfa.json'), path)
+
+        cache = DFAImportCache()
+        old = cache.load(path)
+
+        shutil.copy(os.path.join(TEST_IMPORTS_DIR, 'odd_b_dfa.json'), path)
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        new = cache.load(path)
+        assert new is not old and len(cache) == 1
+        print("✓ Changed file reloaded, stale entry dropped")
+
+        cache.invalidate(path)
+        assert len(cache) == 0 and cache.current_bytes == 0
+        print("✓ invalidate() drops entries for a path")
+
+        copy = os.path.join(tmp, 'copy.json')
+        shutil.copy(path, copy)
+        content_cache = DFAImportCache(key='content')
+        assert content_cache.load(path) is content_cache.load(copy)
+        print("✓ Content keys share one DFA between identical files")
+
+        binary = os.path.join(tmp, 'dfa.dfab')
+        export_dfa_binary(new, binary)
+        assert cache.load(binary).transitions == new.transitions
+        print("✓ Binary files are detected by magic bytes")
+
+
+def test_lru_eviction():
+    """Least recently used DFAs are evicted beyond the memory budget."""
+    print("\n" + "=" * 60)
+    print("TEST 3: LRU eviction by memory")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for n in (50, 60, 70):
+            dfa = create_mod_n_dfa(n)
+            path = os.path.join(tmp, f'mod{n}.json')
+            export_dfa_to_json(dfa, path)
+            paths.append((path, estimate_dfa_size(dfa)))
+
+        sizes = [size for _, size in paths]
+        cache = DFAImportCache(max_bytes=sizes[0] + sizes[1] + sizes[2] // 2)
+        first = cache.load(paths[0][0])
+        cache.load(paths[1][0])
+        cache.load(paths[0][0])          # touch: paths[1] is now least recent
+        cache.load(paths[2][0])          # over budget: evicts paths[1]
+
+        assert cache.current_bytes <= cache.max_bytes
+        assert cache.load(paths[0][0]) is first
+        misses = cache.misses
+        cache.load(paths[1][0])
+        assert cache.misses == misses + 1
+        print(f"✓ Evicted least recently used entry ({cache.current_bytes} of "
+              f"{cache.max_bytes} bytes used)")
+
+
+def test_hit_speed():
+    """A hit is much cheaper than parsing."""
+    print("\n" + "=" * 60)
+    print("TEST 4: Hit cost")
+    print("=" * 60)
+
+    n = 5000
+    dfa = create_mod_n_dfa(n)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'large.json')
+        export_dfa_to_json(dfa, path)
+
+        cache = DFAImportCache()
+        begin = time.perf_counter()
+        cache.load(path)
+        miss = time.perf_counter() - begin
+
+        begin = time.perf_counter()
+        for _ in range(100):
+            cache.load(path)
+        hit = (time.perf_counter() - begin) / 100
+
+    assert hit * 20 < miss
+    print(f"✓ Miss {miss * 1000:.2f} ms, hit {hit * 1000:.3f} ms")
+
+
+if __name__ == '__main__':
+    test_cache_hits()
+    test_invalidation()
+    test_lru_eviction()
+    test_hit_speed()
+    print("\n✓ All import cache tests passed!")
@@ -0,0 +1,113 @@
+"""
+Test script for simulation instrumentation
+"""
+import dfa as dfa_module
+from dfa import create_even_a_dfa, is_accepted, trace_execution
+from dfa_instrument import (Instrumentation, LatencyHistogram, disable_instrumentation,
+                            enable_instrumentation, get_instrumentation)
+
+
+def test_counters():
+    """Calls, symbols, state visits and transition hits are recorded."""
+    print("=" * 60)
+    print("TEST 1: Counters")
+    print("=" * 60)
+
+    dfa = create_even_a_dfa()
+    instrumentation = enable_instrumentation()
+    try:
+        assert is_accepted(dfa, 'aab')
+        assert not dfa.process('ab')
+        assert not dfa.process('ab', engine='codegen')
+        assert dfa.process_with_trace('ba') == (False, ['q0', 'q0', 'q1'])
+        steps = list(trace_execution(dfa, 'aa'))
+        assert steps[-1]['accepted']
+    finally:
+        disable_instrumentation()
+
+    snapshot = instrumentation.snapshot()
+    operations = snapshot['operations']
+    assert set(operations) == {'is_accepted', 'process:dict', 'process:codegen',
+                               'process_with_trace', 'trace_execution'}
+    assert all(entry['calls'] == 1 for entry in operations.values())
+    assert operations['is_accepted']['symbols'] == 3
+    assert operations['is_accepted']['buckets'][-1] == (float('inf'), 1)
+    print(f"✓ {len(operations)} operations recorded")
+
+    assert snapshot['state_visits'] == {'q0': 9, 'q1': 7}
+    assert snapshot['transition_hits'] == {('q0', 'a'): 5, ('q0', 'b'): 2,
+                                           ('q1', 'a'): 2, ('q1', 'b'): 2}
+    print(f"✓ State visits {snapshot['state_visits']}")
+
+
+def test_disable_restores():
+    """Disabling puts the original functions back."""
+    print("\n" + "=" * 60)
+    print("TEST 2: Enable and disable")
+    print("=" * 60)
+
+    originals = (dfa_module._is_accepted, dfa_module._trace_execution,
+                 dfa_module.DFA.process_with_trace, dict(dfa_module.ENGINES))
+    first = enable_instrumentation(count_states=False)
+    second = enable_instrumentation()
+    assert get_instrumentation() is second
+
+    dfa = create_even_a_dfa()
+    is_accepted(dfa, 'ab')
+    assert not first.latency and second.symbols['is_accepted'] == 2
+
+    disable_instrumentation()
+    disable_instrumentation()
+    assert get_instrumentation() is None
+    assert (dfa_module._is_accepted, dfa_module._trace_execution,
+            dfa_module.DFA.process_with_trace, dfa_module.ENGINES) == originals
+    is_accepted(dfa, 'ab')
+    assert second.symbols['is_accepted'] == 2
+    print("✓ Original functions restored")
+
+    instrumentation = enable_instrumentation(count_states=False)
+    try:
+        dfa.process('abab')
+    finally:
+        disable_instrumentation()
+    assert instrumentation.symbols['process:dict'] == 4 and not instrumentation.state_visits
+    print("✓ count_states=False records only latency and symbols")
+
+
+def test_exports():
+    """Histograms and the Prometheus text format."""
+    print("\n" + "=" * 60)
+    print("TEST 3: Histogram and Prometheus export")
+    print("=" * 60)
+
+    histogram = LatencyHistogram((0.1, 1.0))
+    for seconds in (0.05, 0.1, 0.5, 2.0):
+        histogram.observe(seconds)
+    assert histogram.cumulative() == [(0.1, 2), (1.0, 3), (float('inf'), 4)]
+    assert histogram.count == 4 and histogram.sum == 2.65
+    print("✓ Cumulative buckets")
+
+    instrumentation = Instrumentation(buckets=(0.001,))
+    instrumentation.record('is_accepted', 0.0005, 10)
+    instrumentation.count_trace('a"', ['q0', 'q1', 'q0'])
+    text = instrumentation.to_prometheus()
+    assert '# TYPE dfa_call_duration_seconds histogram' in text
+    assert 'dfa_call_duration_seconds_bucket{operation="is_accepted",le="0.001"} 1' in text
+    assert 'dfa_call_duration_seconds_bucket{operation="is_accepted",le="+Inf"} 1' in text
+    assert 'dfa_symbols_processed_total{operation="is_accepted"} 10' in text
+    assert 'dfa_state_visits_total{state="q0"} 2' in text
+    assert 'dfa_transition_hits_total{state="q1",symbol="\\""} 1' in text
+    print(f"✓ {len(text.splitlines())} lines of Prometheus text")
+
+    try:
+        Instrumentation(buckets=(1.0, 0.5))
+        assert False, "decreasing buckets should fail"
+    except ValueError as e:
+        print(f"✓ {e}")
+
+
+if __name__ == '__main__':
+    test_counters()
+    test_disable_restores()
+    test_exports()
+    print("\n✓ All instrumentation tests passed!")
@@ -0,0 +1,157 @@
+"""
+Test script for counting accepted strings
+"""
+from collections import Counter
+from itertools import islice, product
+
+from dfa import DFA, create_even_a_dfa, create_mod_n_dfa
+from dfa_compact import CompactDFA
+from dfa_language import (count_accepted, count_accepted_by_length, enumerate_accepted,
+                          sample_accepted, sample_accepted_batch, transition_count_matrix)
+
+
+def _brute_force(dfa, length):
+    symbols = sorted(dfa.alphabet)
+    return sum(dfa.process(''.join(word)) for word in product(symbols, repeat=length))
+
+
+def test_small_lengths():
+    """Counts match brute-force enumeration."""
+    print("=" * 60)
+    print("TEST 1: Counts match enumeration")
+    print("=" * 60)
+
+    for dfa in (create_even_a_dfa(), create_mod_n_dfa(3), create_mod_n_dfa(7)):
+        expected = [_brute_force(dfa, n) for n in range(11)]
+        assert count_accepted_by_length(dfa, 10) == expected
+        for n in range(11):
+            assert count_accepted(dfa, n, method='matrix') == expected[n]
+            assert count_accepted(dfa, n, method='dp') == expected[n]
+        print(f"✓ {len(dfa.states)} states: {expected}")
+
+    matrix = transition_count_matrix(create_mod_n_dfa(3))
+    assert (matrix.sum(axis=1) == 2).all()
+    print("✓ Every row of the count matrix sums to |Σ|")
+
+
+def test_exact_and_modular():
+    """Big counts are exact, and modular counts agree with them."""
+    print("\n" + "=" * 60)
+    print("TEST 2: Exact and modular arithmetic")
+    print("=" * 60)
+
+    # Even number of a's: exactly half of all 2ⁿ strings for n >= 1
+    dfa = create_even_a_dfa()
+    assert count_accepted(dfa, 200, method='matrix') == 2 ** 199
+    assert count_accepted(dfa, 200, method='dp') == 2 ** 199
+    print("✓ Exact count beyond int64: 2^199")
+
+    modulus = 10 ** 9 + 7
+    assert count_accepted(dfa, 10 ** 18, modulus=modulus) == pow(2, 10 ** 18 - 1, modulus)
+    print("✓ Length 10^18 modulo 10^9+7")
+
+    dfa = create_mod_n_dfa(60)
+    exact = count_accepted(dfa, 300, method='matrix')
+    assert exact == count_accepted(dfa, 300, method='dp')
+    for modulus in (97, 998244353, 2 ** 61 - 1):
+        assert count_accepted(dfa, 300, modulus=modulus, method='matrix') == exact % modulus
+        assert count_accepted_by_length(dfa, 300, modulus=modulus)[300] == exact % modulus
+    print("✓ Modular counts agree with the exact count")
+
+
+def test_compact_and_errors():
+    """CompactDFA input and invalid arguments."""
+    print("\n" + "=" * 60)
+    print("TEST 3: CompactDFA and errors")
+    print("=" * 60)
+
+    dfa = create_mod_n_dfa(5)
+    states = sorted(dfa.states)
+    # Symbols deliberately out of sorted order
+    symbols = ('1', '0')
+    table = [states.index(dfa.transitions[(state, symbol)]) for state in states for symbol in symbols]
+    compact = CompactDFA(states, symbols, table, states.index('q0'),
+                         bytes([1 << states.index('q0')]))
+    assert count_accepted_by_length(compact, 12) == count_accepted_by_length(dfa, 12)
+    print("✓ CompactDFA counts match")
+
+    for args in ((-1,), (3, 0)):
+        try:
+            count_accepted(dfa, *args)
+            assert False, "invalid arguments should fail"
+        except ValueError as e:
+            print(f"✓ {e}")
+    try:
+        count_accepted(dfa, 3, method='brute')
+        assert False, "unknown method should fail"
+    except ValueError as e:
+        print(f"✓ {e}")
+
+
+def test_sampling():
+    """Samples are accepted, cover the language and are roughly uniform."""
+    print("\n" + "=" * 60)
+    print("TEST 4: Uniform sampling")
+    print("=" * 60)
+
+    dfa = create_mod_n_dfa(3)
+    samples = sample_accepted_batch(dfa, 6, 22000, rng=0)
+    counts = Counter(samples.tolist())
+    # 22 binary strings of length 6 are divisible by 3
+    assert len(counts) == count_accepted(dfa, 6) == 22
+    assert all(dfa.process(word) for word in counts)
+    assert all(800 < count < 1200 for count in counts.values())
+    print(f"✓ 22000 samples hit all 22 strings {min(counts.values())}-{max(counts.values())} times")
+
+    # Counts beyond int64 switch to exact big-integer ranks
+    samples = sample_accepted_batch(dfa, 100, 200, rng=1)
+    assert all(len(word) == 100 and dfa.process(word) for word in samples)
+    assert len(set(samples.tolist())) == 200
+    print("✓ Length 100 samples are accepted and distinct")
+
+    assert sample_accepted(dfa, 0) == ''
+    assert sample_accepted(dfa, 8, rng=5) == sample_accepted(dfa, 8, rng=5)
+    print("✓ Single samples, reproducible with a seed")
+
+    empty = DFA(['q0'], ['a'], {('q0', 'a'): 'q0'}, 'q0', [])
+    try:
+        sample_accepted(empty, 3)
+        assert False, "empty language cannot be sampled"
+    except ValueError as e:
+        print(f"✓ {e}")
+
+
+def test_enumeration():
+    """Shortlex enumeration of finite and infinite languages."""
+    print("\n" + "=" * 60)
+    print("TEST 5: Shortlex enumeration")
+    print("=" * 60)
+
+    dfa = create_mod_n_dfa(5)
+    expected = [''.join(word) for length in range(9)
+                for word in product('01', repeat=length) if dfa.process(''.join(word))]
+    assert list(enumerate_accepted(dfa, max_length=8)) == expected
+    print(f"✓ First {len(expected)} strings match filtered enumeration")
+
+    first = list(islice(enumerate_accepted(create_even_a_dfa()), 8))
+    assert first == ['', 'b', 'aa', 'bb', 'aab', 'aba', 'baa', 'bbb']
+    print(f"✓ Infinite language streams lazily: {first}")
+
+    # Finite language with a dead state: the generator ends on its own
+    finite = DFA(['s', 'a', 'b', 'dead'], ['x', 'y'],
+                 {('s', 'x'): 'a', ('s', 'y'): 'dead', ('a', 'x'): 'b', ('a', 'y'): 'b',
+                  ('b', 'x'): 'dead', ('b', 'y'): 'dead',
+                  ('dead', 'x'): 'dead', ('dead', 'y'): 'dead'}, 's', ['a', 'b'])
+    assert list(enumerate_accepted(finite)) == ['x', 'xx', 'xy']
+    empty = DFA(['q0'], ['a'], {('q0', 'a'): 'q0'}, 'q0', [])
+    assert list(enumerate_accepted(empty)) == []
+    print("✓ Finite and empty languages terminate")
+
+
+if __name__ == '__main__':
+    test_small_lengths()
+    test_exact_and_modular()
+    test_compact_and_errors()
+    test_sampling()
+    test_enumeration()
+    print("\n✓ All language tests passed!")
@@ -0,0 +1,75 @@
+"""
+Test script for the pluggable DFA layout algorithms
+"""
+import networkx as nx
+
+from dfa import create_even_a_dfa
+from dfa_layout import (
+    FORCE_MAX_STATES,
+    SPRING_MAX_STATES,
+    choose_layout_method,
+    compute_layout,
+)
+from dfa_renderer import build_dfa_graph
+
+
+def _chain_graph(n):
+    """Graph of a DFA-like chain q0 -> q1 -> ... with back edges to q0."""
+    G = nx.DiGraph()
+    for i in range(n):
+        G.add_edge(f"q{i}", f"q{(i + 1) % n}")
+        G.add_edge(f"q{i}", "q0")
+    return G
+
+
+def test_all_methods():
+    """Every built-in layout places every state inside [-1, 1]."""
+    print("=" * 60)
+    print("TEST 1: Built-in layout methods")
+    print("=" * 60)
+
+    G = _chain_graph(200)
+    for method in ('spring', 'layered', 'force'):
+        pos = compute_layout(G, start_state='q0', method=method)
+        assert set(pos) == set(G.nodes())
+        for x, y in pos.values():
+            assert -1.0001 <= x <= 1.0001 and -1.0001 <= y <= 1.0001
+        print(f"✓ {method}: {len(pos)} states positioned")
+
+
+def test_layered_follows_bfs():
+    """The layered layout puts states in columns by BFS distance."""
+    print("\n" + "=" * 60)
+    print("TEST 2: Layered layout columns")
+    print("=" * 60)
+
+    dfa = create_even_a_dfa()
+    G, _ = build_dfa_graph(dfa)
+    pos = compute_layout(G, start_state=dfa.start_state, method='layered')
+    assert pos['q0'][0] < pos['q1'][0]
+    print("✓ Start state is left of its successors")
+
+
+def test_auto_selection():
+    """'auto' picks a method by state count."""
+    print("\n" + "=" * 60)
+    print("TEST 3: Automatic method selection")
+    print("=" * 60)
+
+    assert choose_layout_method(2) == 'spring'
+    assert choose_layout_method(SPRING_MAX_STATES + 1) in ('dot', 'force')
+    assert choose_layout_method(FORCE_MAX_STATES + 1) == 'layered'
+    print("✓ spring → dot/force → layered as DFAs grow")
+
+    try:
+        compute_layout(_chain_graph(3), method='nonexistent')
+        assert False, "Should have raised ValueError"
+    except ValueError as e:
+        print(f"✓ Correctly caught error: {e}")
+
+
+if __name__ == '__main__':
+    test_all_methods()
+    test_layered_follows_bfs()
+    test_auto_selection()
+    print("\n✓ All layout tests passed!")
@@ -0,0 +1,138 @@
+"""
+Test script for the prefix-state cache
+"""
+import random
+import time
+
+from dfa import create_even_a_dfa, create_mod_n_dfa, is_accepted
+from dfa_prefix_cache import PrefixStateCache
+
+
+def test_results_unchanged():
+    """Cached runs give the same answers as uncached ones."""
+    print("=" * 60)
+    print("TEST 1: Results with and without the cache")
+    print("=" * 60)
+
+    rng = random.Random(0)
+    prefixes = [''.join(rng.choice('01') for _ in range(100)) for _ in range(5)]
+    inputs = [rng.choice(prefixes)[:rng.randrange(101)] +
+              ''.join(rng.choice('01') for _ in range(rng.randrange(40)))
+              for _ in range(2000)]
+
+    plain = create_mod_n_dfa(37)
+    expected = [plain.process(s) for s in inputs]
+
+    cached = create_mod_n_dfa(37)
+    cache = cached.enable_prefix_cache(max_entries=100, stride=8)
+    assert [cached.process(s) for s in inputs] == expected
+    assert [is_accepted(cached, s) for s in inputs] == expected
+    assert len(cache) <= 100
+    print(f"✓ {len(inputs)} inputs agree, hit rate {cache.hit_rate:.0%}, "
+          f"{cache.skip_rate:.0%} of symbols skipped")
+
+
+def test_statistics():
+    """Hits, misses and skipped symbols are counted."""
+    print("\n" + "=" * 60)
+    print("TEST 2: Statistics")
+    print("=" * 60)
+
+    dfa = create_even_a_dfa()
+    cache = dfa.enable_prefix_cache(stride=4)
+    assert dfa.process('abab' * 3)
+    assert cache.stats()['misses'] == 1 and len(cache) == 3
+
+    # Shares the first two checkpoints (8 symbols) with the previous input
+    assert not dfa.process('abab' * 2 + 'a')
+    stats = cache.stats()
+    assert stats['hits'] == 1 and stats['symbols_skipped'] == 8
+    assert stats['symbols_total'] == 21
+    print(f"✓ {stats}")
+
+    cache.clear()
+    assert len(cache) == 0 and cache.hit_rate == 0.0
+    print("✓ clear() resets entries and counters")
+
+
+def test_eviction_and_errors():
+    """LRU eviction, invalid symbols and invalid settings."""
+    print("\n" + "=" * 60)
+    print("TEST 3: Eviction and errors")
+    print("=" * 60)
+
+    dfa = create_mod_n_dfa(5)
+    cache = dfa.enable_prefix_cache(max_entries=2, stride=2)
+    dfa.process('101010')
+    assert len(cache) == 2
+    print("✓ Cache stays within max_entries")
+
+    # Only leaves are evicted, so the two shortest checkpoints stay reachable
+    skipped = cache.symbols_skipped
+    assert not dfa.process('10101011')
+    assert cache.symbols_skipped - skipped == 4
+    print("✓ Eviction keeps the shorter checkpoints of an input")
+
+    cache = dfa.enable_prefix_cache(stride=4, max_bytes=2000)
+    for n in range(100):
+        dfa.process(format(n * 7919, 'b') * 4)
+        assert cache.current_bytes <= cache.max_bytes
+    assert 0 < len(cache) < 100 and cache.stats()['bytes'] == cache.current_bytes
+    print(f"✓ Cache stays within max_bytes ({len(cache)} prefixes, "
+          f"{cache.current_bytes} bytes)")
+
+    misses = cache.misses
+    assert is_accepted(dfa, ['1', '0', '1']) and not is_accepted(dfa, ('1', '1'))
+    assert cache.misses == misses
+    print("✓ Non-string inputs run without the cache")
+
+    try:
+        is_accepted(dfa, '1021')
+        assert False, "invalid symbol should fail"
+    except ValueError as e:
+        print(f"✓ {e}")
+
+    dfa.disable_prefix_cache()
+    assert dfa.prefix_cache is None and dfa.process('101')
+
+    for kwargs in ({'max_entries': 0}, {'stride': 0}, {'max_bytes': 0}):
+        try:
+            PrefixStateCache(**kwargs)
+            assert False, "invalid settings should fail"
+        except ValueError as e:
+            print(f"✓ {e}")
+
+
+def test_long_prefixes():
+    """Runs stay linear in the input length when prefixes are long."""
+    print("\n" + "=" * 60)
+    print("TEST 4: Long shared prefixes")
+    print("=" * 60)
+
+    rng = random.Random(1)
+    prefix = ''.join(rng.choice('01') for _ in range(20000))
+    inputs = [prefix + format(n, 'b') for n in range(200)]
+
+    plain = create_mod_n_dfa(7)
+    begin = time.perf_counter()
+    expected = [plain.process(s) for s in inputs]
+    plain_time = time.perf_counter() - begin
+
+    cached = create_mod_n_dfa(7)
+    cache = cached.enable_prefix_cache()
+    begin = time.perf_counter()
+    assert [cached.process(s) for s in inputs] == expected
+    cached_time = time.perf_counter() - begin
+
+    assert cache.hits == len(inputs) - 1
+    assert cached_time < plain_time
+    print(f"✓ Without cache {plain_time * 1000:.0f} ms, with cache "
+          f"{cached_time * 1000:.0f} ms ({cache.skip_rate:.0%} of symbols skipped)")
+
+
+if __name__ == '__main__':
+    test_results_unchanged()
+    test_statistics()
+    test_eviction_and_errors()
+    test_long_prefixes()
+    print("\n✓ All prefix cache tests passed!")
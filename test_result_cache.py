@@ -0,0 +1,128 @@
+"""
+Test script for the acceptance result cache
+"""
+from dfa import DFA, create_even_a_dfa, is_accepted
+from dfa_result_cache import ResultCache, TrackedSet, TrackedTransitions
+
+
+def test_hits_misses_evictions():
+    """Repeated inputs are answered from the cache within its bounds."""
+    print("=" * 60)
+    print("TEST 1: Hits, misses and evictions")
+    print("=" * 60)
+
+    dfa = create_even_a_dfa()
+    cache = dfa.enable_result_cache(max_entries=2)
+    assert [dfa.process(s) for s in ['aa', 'a', 'aa']] == [True, False, True]
+    assert cache.hits == 1 and cache.misses == 2 and cache.evictions == 0
+
+    # 'b' evicts 'a', the least recently used entry
+    assert is_accepted(dfa, 'b')
+    assert is_accepted(dfa, 'aa')
+    assert not is_accepted(dfa, 'a')
+    stats = cache.stats()
+    assert stats['hits'] == 2 and stats['misses'] == 4 and stats['evictions'] == 2
+    assert len(cache) == 2
+    print(f"✓ {stats}")
+
+    cache = dfa.enable_result_cache(max_bytes=400)
+    for i in range(20):
+        dfa.process('b' * i)
+    assert cache.current_bytes <= 400 and cache.evictions > 0
+    print(f"✓ Memory bound: {len(cache)} entries in {cache.current_bytes} bytes")
+
+
+def test_long_inputs():
+    """Long inputs are keyed by a fixed-size digest."""
+    print("\n" + "=" * 60)
+    print("TEST 2: Long inputs")
+    print("=" * 60)
+
+    dfa = create_even_a_dfa()
+    cache = dfa.enable_result_cache(hash_threshold=16)
+    long_input = 'ab' * 5000
+    assert dfa.process(long_input) == dfa.process(long_input)
+    assert cache.hits == 1
+    assert cache.current_bytes < 200
+    print(f"✓ 10000-symbol input cached in {cache.current_bytes} bytes")
+
+
+def test_invalidation():
+    """Changing the DFA drops cached results."""
+    print("\n" + "=" * 60)
+    print("TEST 3: Invalidation on mutation")
+    print("=" * 60)
+
+    dfa = create_even_a_dfa()
+    cache = dfa.enable_result_cache()
+    assert isinstance(dfa.transitions, TrackedTransitions)
+    assert isinstance(dfa.final_states, TrackedSet)
+    assert dfa.process('b')
+
+    dfa.transitions[('q0', 'b')] = 'q1'
+    assert not dfa.process('b')
+    print("✓ Transition change")
+
+    dfa.final_states.add('q1')
+    assert dfa.process('b')
+    print("✓ Final state change")
+
+    dfa.start_state = 'q1'
+    dfa.final_states.discard('q0')
+    assert is_accepted(dfa, '')
+    print("✓ Start state change")
+
+    dfa.transitions = {('q0', 'a'): 'q0', ('q0', 'b'): 'q0',
+                       ('q1', 'a'): 'q0', ('q1', 'b'): 'q0'}
+    assert not is_accepted(dfa, 'b')
+    assert isinstance(dfa.transitions, TrackedTransitions)
+    print("✓ Replaced transitions dict")
+    assert cache.invalidations == 4
+    print(f"✓ {cache.invalidations} invalidations counted")
+
+    # Tracked containers still behave like dict and set
+    assert dfa.transitions == {('q0', 'a'): 'q0', ('q0', 'b'): 'q0',
+                               ('q1', 'a'): 'q0', ('q1', 'b'): 'q0'}
+    assert dfa.final_states == {'q1'}
+
+
+def test_errors():
+    """Invalid inputs are not cached and invalid settings are rejected."""
+    print("\n" + "=" * 60)
+    print("TEST 4: Errors")
+    print("=" * 60)
+
+    dfa = DFA(['q0'], ['a'], {('q0', 'a'): 'q0'}, 'q0', ['q0'])
+    cache = dfa.enable_result_cache()
+    for _ in range(2):
+        try:
+            dfa.process('ab')
+            assert False, "invalid symbol should fail"
+        except ValueError:
+            pass
+    assert len(cache) == 0
+    print("✓ Failed inputs are not cached")
+
+    misses = cache.misses
+    long_input = ['a'] * (cache.hash_threshold + 1)
+    assert dfa.process(['a', 'a']) and is_accepted(dfa, ('a',)) and dfa.process(long_input)
+    assert len(cache) == 0 and cache.misses == misses
+    print("✓ Lists and tuples of symbols bypass the cache")
+
+    dfa.disable_result_cache()
+    assert dfa.result_cache is None and dfa.process('aa')
+
+    for kwargs in ({'max_entries': 0}, {'max_bytes': 0}):
+        try:
+            ResultCache(**kwargs)
+            assert False, "invalid settings should fail"
+        except ValueError as e:
+            print(f"✓ {e}")
+
+
+if __name__ == '__main__':
+    test_hits_misses_evictions()
+    test_long_inputs()
+    test_invalidation()
+    test_errors()
+    print("\n✓ All result cache tests passed!")
@@ -0,0 +1,159 @@
+"""
+Test script for streaming JSON import of large DFAs
+"""
+import json
+import os
+import tempfile
+import tracemalloc
+
+from dfa import create_mod_n_dfa, export_dfa_to_json, import_dfa_from_json
+from dfa_compact import CompactDFA
+from dfa_import_cache import DFAImportCache
+from dfa_stream import import_dfa_from_json_stream
+
+
+TEST_IMPORTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'TestImports')
+
+
+def _definition(dfa):
+    """Return the DFA's definition as comparable values."""
+    return (dfa.states, dfa.alphabet, dict(dfa.transitions),
+            dfa.start_state, dfa.final_states)
+
+
+def test_matches_json_import():
+    """Streaming import agrees with import_dfa_from_json on the sample files."""
+    print("=" * 60)
+    print("TEST 1: Same result as import_dfa_from_json")
+    print("=" * 60)
+
+    for entry in sorted(os.listdir(TEST_IMPORTS_DIR)):
+        path = os.path.join(TEST_IMPORTS_DIR, entry)
+        try:
+            expected = _definition(import_dfa_from_json(path))
+        except ValueError:
+            expected = ValueError
+
+        # A tiny chunk size splits strings and entries across reads
+        for chunk_size in (3, 1 << 16):
+            try:
+                dfa = import_dfa_from_json_stream(path, chunk_size=chunk_size)
+                assert isinstance(dfa, CompactDFA)
+                actual = _definition(dfa)
+            except ValueError:
+                actual = ValueError
+            assert actual == expected, (entry, chunk_size, actual, expected)
+        print(f"✓ {entry}")
+
+
+def test_field_order_and_escapes():
+    """Fields in any order, escaped strings and unknown fields."""
+    print("\n" + "=" * 60)
+    print("TEST 2: Field order and escapes")
+    print("=" * 60)
+
+    document = (
+        '{"final_states": ["q\\"1"], "start_state": "q0", '
+        '"transitions": {"q0,\\u00e9": "q\\"1", "q\\"1,\\u00e9" : "q0"}, '
+        '"comment": [1, 2.5, {"nested": 12345}], '
+        '"alphabet": ["é"], "states": ["q0", "q\\"1"]}'
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'escaped.json')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(document)
+
+        for chunk_size in (1, 2, 5, 100):
+            dfa = import_dfa_from_json_stream(path, chunk_size=chunk_size)
+            assert dict(dfa.transitions) == {('q0', 'é'): 'q"1', ('q"1', 'é'): 'q0'}
+            assert dfa.process('é') and not dfa.process('éé')
+    print("✓ Transitions before states are buffered and applied")
+    print("✓ Escaped names and unknown fields handled at every chunk size")
+
+
+def test_errors():
+    """Malformed DFAs raise the same kinds of errors as the regular import."""
+    print("\n" + "=" * 60)
+    print("TEST 3: Error handling")
+    print("=" * 60)
+
+    base = {"states": ["q0", "q1"], "alphabet": ["a"],
+            "transitions": {"q0,a": "q1", "q1,a": "q0"},
+            "start_state": "q0", "final_states": ["q1"]}
+    cases = {
+        'incomplete': dict(base, transitions={"q0,a": "q1"}),
+        'bad target': dict(base, transitions={"q0,a": "q9", "q1,a": "q0"}),
+        'bad start': dict(base, start_state="q9"),
+        'bad final': dict(base, final_states=["q9"]),
+        'start not a string': dict(base, start_state=["q0"]),
+        'final not a string': dict(base, final_states=[["q1"]]),
+        'states not a list': dict(base, states="q0"),
+    }
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'case.json')
+        for label, document in cases.items():
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(document, f)
+            try:
+                import_dfa_from_json_stream(path)
+                assert False, f"{label} should fail"
+            except ValueError as e:
+                print(f"✓ {label}: {e}")
+
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(base, f)
+            f.write(' {}')
+        try:
+            import_dfa_from_json_stream(path)
+            assert False, "trailing data should fail"
+        except json.JSONDecodeError as e:
+            print(f"✓ trailing data: {e.msg}")
+
+        # Transitions outside the states and alphabet are never taken; both
+        # imports accept them
+        extra = dict(base, transitions=dict(base['transitions'], **{"q1,b": "q0", "q9,a": "q9"}))
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(extra, f)
+        expected = import_dfa_from_json(path, verbose=False)
+        dfa = import_dfa_from_json_stream(path)
+        assert all(dfa.process(w) == expected.process(w) for w in ('', 'a', 'aa', 'aaa'))
+        assert DFAImportCache().load(path).process('a')
+        print("✓ Transitions outside the states and alphabet are skipped")
+
+
+def test_peak_memory():
+    """Peak memory stays well below the json.load based import."""
+    print("\n" + "=" * 60)
+    print("TEST 4: Peak memory")
+    print("=" * 60)
+
+    n = 20000
+    dfa = create_mod_n_dfa(n)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'large.json')
+        export_dfa_to_json(dfa, path)
+        del dfa
+
+        peaks = {}
+        for func in (import_dfa_from_json, import_dfa_from_json_stream):
+            tracemalloc.start()
+            loaded = func(path)
+            peaks[func.__name__] = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            assert loaded.process('1100') == (12 % n == 0)
+            del loaded
+
+    ratio = peaks['import_dfa_from_json'] / peaks['import_dfa_from_json_stream']
+    assert ratio > 2
+    print(f"✓ Streaming peak is {ratio:.1f}x lower "
+          f"({peaks['import_dfa_from_json_stream'] >> 10} KiB vs "
+          f"{peaks['import_dfa_from_json'] >> 10} KiB)")
+
+
+if __name__ == '__main__':
+    test_matches_json_import()
+    test_field_order_and_escapes()
+    test_errors()
+    test_peak_memory()
+    print("\n✓ All streaming import tests passed!")
@@ -0,0 +1,200 @@
+"""
+Test script for the DFA builder's transitions table model
+"""
+import sys
+from PyQt5.QtWidgets import QApplication
+from PyQt5.QtCore import Qt
+from dfa_builder import (
+    CompletenessTracker,
+    DFABuilderDialog,
+    TransitionsTableModel,
+    parse_transitions_text,
+)
+
+
+def _rows(model):
+    """Return the visible rows of the model as tuples."""
+    return [
+        tuple(model.data(model.index(row, col)) for col in range(3))
+        for row in range(model.rowCount())
+    ]
+
+
+def test_incremental_edits():
+    """Single edits keep the rows sorted without resetting the model."""
+    print("=" * 60)
+    print("TEST 1: Incremental insert/remove")
+    print("=" * 60)
+
+    model = TransitionsTableModel({})
+    resets = []
+    model.modelReset.connect(lambda: resets.append(True))
+
+    model.set_transition(('q1', 'a'), 'q0')
+    model.set_transition(('q0', 'b'), 'q1')
+    model.set_transition(('q0', 'a'), 'q1')
+    assert _rows(model) == [('q0', 'a', 'q1'), ('q0', 'b', 'q1'), ('q1', 'a', 'q0')]
+    print("✓ Rows inserted in sorted position")
+
+    model.set_transition(('q0', 'b'), 'q0')
+    assert _rows(model)[1] == ('q0', 'b', 'q0')
+    print("✓ Overwriting a transition updates its row")
+
+    model.remove_transition(('q0', 'a'))
+    assert _rows(model) == [('q0', 'b', 'q0'), ('q1', 'a', 'q0')]
+    assert not resets
+    print("✓ Rows removed without a model reset")
+
+
+def test_sorting():
+    """Sorting by any column, in either order."""
+    print("\n" + "=" * 60)
+    print("TEST 2: Sorting")
+    print("=" * 60)
+
+    model = TransitionsTableModel({('q0', 'b'): 'q2', ('q1', 'a'): 'q0', ('q2', 'c'): 'q1'})
+
+    model.sort(1, Qt.AscendingOrder)
+    assert [row[1] for row in _rows(model)] == ['a', 'b', 'c']
+    model.sort(2, Qt.DescendingOrder)
+    assert [row[2] for row in _rows(model)] == ['q2', 'q1', 'q0']
+    print("✓ Sorted by symbol and by target")
+
+    # Edits respect the active sort
+    model.set_transition(('q3', 'a'), 'q9')
+    model.set_transition(('q1', 'a'), 'q5')
+    assert [row[2] for row in _rows(model)] == ['q9', 'q5', 'q2', 'q1']
+    print("✓ Edits keep descending target order")
+
+
+def test_lazy_fetching():
+    """Large tables only expose rows in batches."""
+    print("\n" + "=" * 60)
+    print("TEST 3: Lazy fetching")
+    print("=" * 60)
+
+    transitions = {(f"s{i:06d}", 'a'): 's0' for i in range(100000)}
+    model = TransitionsTableModel(transitions)
+
+    assert model.rowCount() == TransitionsTableModel.FETCH_BATCH
+    assert model.canFetchMore()
+    model.fetchMore()
+    assert model.rowCount() == 2 * TransitionsTableModel.FETCH_BATCH
+    print(f"✓ {model.rowCount()} of {len(transitions)} rows fetched")
+
+    # Edits beyond the fetched range do not touch the view
+    model.set_transition(('s999999', 'a'), 's1')
+    assert model.rowCount() == 2 * TransitionsTableModel.FETCH_BATCH
+    assert model.key_at(0) == ('s000000', 'a')
+    print("✓ Off-screen edits are deferred until fetched")
+
+
+def test_builder_uses_model():
+    """DFABuilderDialog edits go through the model."""
+    print("\n" + "=" * 60)
+    print("TEST 4: Builder integration")
+    print("=" * 60)
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    builder = DFABuilderDialog()
+    builder.states = ['q0', 'q1']
+    builder.alphabet = ['a']
+    builder.update_combos()
+
+    builder.from_state_combo.setCurrentText('q0')
+    builder.symbol_combo.setCurrentText('a')
+    builder.to_state_combo.setCurrentText('q1')
+    builder.add_transition()
+    assert builder.transitions == {('q0', 'a'): 'q1'}
+    assert builder.transitions_model.rowCount() == 1
+    print("✓ add_transition() inserts one row")
+
+    builder.transitions_table.setCurrentIndex(builder.transitions_model.index(0, 0))
+    builder.remove_transition()
+    assert builder.transitions == {}
+    assert builder.transitions_model.rowCount() == 0
+    print("✓ remove_transition() removes the selected row")
+
+
+def test_bulk_entry():
+    """Pasted CSV/TSV blocks are parsed and applied in one batch."""
+    print("\n" + "=" * 60)
+    print("TEST 5: Bulk transition entry")
+    print("=" * 60)
+
+    transitions, errors = parse_transitions_text(
+        "from,symbol,to\nq0,a,q1\n# comment\n\nq1, b ,q0\nbroken,line\n"
+    )
+    assert transitions == {('q0', 'a'): 'q1', ('q1', 'b'): 'q0'}
+    assert len(errors) == 1 and errors[0].startswith('Line 6')
+    print(f"✓ Parsed CSV, reported: {errors[0]}")
+
+    transitions, errors = parse_transitions_text("q0\ta\tq1\nq1\ta\tq0")
+    assert transitions == {('q0', 'a'): 'q1', ('q1', 'a'): 'q0'} and not errors
+    print("✓ Parsed TSV")
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    builder = DFABuilderDialog()
+    resets = []
+    builder.transitions_model.modelReset.connect(lambda: resets.append(True))
+
+    text = "\n".join(f"s{i},{c},s{(i + int(c)) % 3000}" for i in range(3000) for c in "01")
+    transitions, errors = parse_transitions_text(text)
+    builder.apply_transitions(transitions)
+    assert len(builder.transitions) == 6000
+    assert len(builder.states) == 3000 and sorted(builder.alphabet) == ['0', '1']
+    assert len(resets) == 1
+    print("✓ 6000 transitions applied with a single table refresh")
+
+    builder.apply_transitions({}, removed_keys=[('s0', '0')])
+    assert ('s0', '0') not in builder.transitions
+    print("✓ Grid removals applied")
+
+
+def test_completeness_tracking():
+    """The builder keeps a live count of missing and dangling transitions."""
+    print("\n" + "=" * 60)
+    print("TEST 6: Completeness tracking")
+    print("=" * 60)
+
+    tracker = CompletenessTracker(['q0', 'q1'], ['a', 'b'], {('q0', 'a'): 'q1'})
+    assert tracker.missing == 3 and tracker.dangling == 0
+    print(f"✓ {tracker.missing} missing transitions counted")
+
+    tracker.set_transition(None, 'q0')
+    tracker.set_transition(None, 'q1')
+    tracker.set_transition(None, 'q1')
+    assert tracker.is_complete
+    print("✓ Complete after adding the missing transitions")
+
+    # q1's outgoing transitions (both loops back to q1) go before q1 itself,
+    # so nothing is missing and only q0's transition into q1 dangles; adding
+    # q1 back leaves its two transitions missing
+    tracker.remove_transition('q1')
+    tracker.remove_transition('q1')
+    tracker.remove_state('q1')
+    assert tracker.missing == 0 and tracker.dangling == 1
+    tracker.add_state('q1')
+    assert tracker.missing == 2 and tracker.dangling == 0
+    print("✓ Dangling targets tracked across state removal")
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    builder = DFABuilderDialog()
+    builder.apply_transitions({('q0', 'a'): 'q1', ('q1', 'a'): 'q0'})
+    assert builder.completeness.is_complete
+    assert builder.completeness_label.text().startswith('✓')
+    builder.apply_transitions({('q0', 'b'): 'q0'})
+    assert builder.completeness.missing == 1
+    assert '1 missing transition' in builder.completeness_label.text()
+    assert builder.missing_transitions() == ['(q1, b)']
+    print(f"✓ Builder shows: {builder.completeness_label.text()}")
+
+
+if __name__ == '__main__':
+    test_incremental_edits()
+    test_sorting()
+    test_lazy_fetching()
+    test_builder_uses_model()
+    test_bulk_entry()
+    test_completeness_tracking()
+    print("\n✓ All transitions model tests passed!")